@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark mémoire - Empreinte d'un état de combat gardé en vie
+
+Joue N combats IA vs IA jusqu'au milieu de la partie, garde tous les états
+en mémoire (comme le ferait une recherche ou une simulation parallèle) et
+mesure avec tracemalloc la mémoire allouée par combat.
+
+Usage:
+    python benchmarks/bench_memoire.py [--combats 2000] [--tours 12]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.ai.ai_player import AIPlayer
+from src.game.simulation import CLASSES, Combat
+from src.models.aleatoire import Aleatoire
+from src.models.evenements import SINK_NUL
+from src.models.registre import REGISTRE
+
+
+def creer_combat(seed: int, tours: int) -> Combat:
+    """Crée un combat Sage vs Magicien et le joue pendant quelques tours"""
+    rng = Aleatoire(seed)
+    joueur1 = CLASSES['sage']("IA-Sage-1")
+    joueur2 = CLASSES['magicien']("IA-Magicien-2")
+    joueur1.sink = joueur2.sink = SINK_NUL
+    combat = Combat(joueur1, joueur2, rng=rng)
+    ias = (AIPlayer(joueur1), AIPlayer(joueur2))
+
+    while not combat.termine and combat.tour <= tours:
+        skills = combat.debut_tour()
+        skill = ias[combat.index_actif].choose_skill(skills, combat.defenseur) if skills else None
+        combat.jouer(skill)
+    return combat
+
+
+def mesurer_memoire(combats: int, tours: int) -> float:
+    """Retourne le nombre d'octets alloués par combat gardé en vie"""
+    tracemalloc.start()
+    avant = tracemalloc.take_snapshot()
+    etats = [creer_combat(seed, tours) for seed in range(combats)]
+    apres = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in apres.compare_to(avant, 'filename'))
+    del etats
+    return total / combats
+
+
+def mesurer_acces(repetitions: int = 200_000) -> float:
+    """Retourne le temps moyen (ns) d'une lecture de stats d'un personnage"""
+    personnage = CLASSES['sage']("IA-Sage-1")
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        personnage.current_hp
+        personnage.current_mp
+        personnage.attack
+        personnage.defense
+    return (time.perf_counter() - debut) / (repetitions * 4) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Empreinte mémoire d'un état de combat")
+    parser.add_argument('--combats', type=int, default=2000, help="Nombre de combats gardés en mémoire")
+    parser.add_argument('--tours', type=int, default=12, help="Tours joués avant la mesure")
+    args = parser.parse_args()
+
+    # Configs lues et compilées avant la mesure (partagées par tous les combats)
+    for classe, type_personnage in CLASSES.items():
+        REGISTRE.definition(classe).competences(type_personnage)
+    creer_combat(0, args.tours)
+
+    octets = mesurer_memoire(args.combats, args.tours)
+    print(f"Combats gardés en vie : {args.combats} ({args.tours} tours joués)")
+    print(f"Mémoire par combat    : {octets / 1024:.2f} Ko ({octets:.0f} octets)")
+    print(f"Lecture d'une stat    : {mesurer_acces():.1f} ns")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks - Mesures de référence et détection des régressions
+
+Mesure (un seul processus, meilleure de plusieurs répétitions):
+- le débit en tours par seconde d'un combat headless Sage vs Magicien
+- les latences p50/p99 de AIPlayer.choose_skill par difficulté (l'IA experte
+  avec un petit budget de réflexion, et son nombre d'itérations par coup)
+- le temps de SaveManager.lister_sauvegardes à 1k/10k/100k sauvegardes
+  (premier appel, qui construit l'index, puis appels suivants)
+- le coût de construction d'un personnage
+- le temps d'import (python -X importtime) du point d'entrée et des modules
+  des chemins sans interface, comparé à un budget fixe
+
+Les résultats sont écrits au format JSON. Comparés à un fichier de
+référence enregistré au préalable (--enregistrer-reference), une mesure
+dégradée de plus du seuil fait terminer le script en erreur, de même
+qu'un temps d'import au-delà de son budget.
+
+Usage:
+    python benchmarks/bench_suite.py --enregistrer-reference
+    python benchmarks/bench_suite.py [--reference benchmarks/reference.json] [--seuil 10] [--sortie resultats.json]
+    python benchmarks/bench_suite.py --rapide   # 1k sauvegardes seulement, moins de combats
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.ai.ai_player import AIPlayer
+from src.ai.transposition import TABLE_TRANSPOSITION
+from src.game.save_manager import SaveManager
+from src.game.simulation import CLASSES, Combat, simulate_battle
+from src.models.aleatoire import Aleatoire
+from src.models.evenements import SINK_NUL
+from src.models.registre import REGISTRE
+
+
+# Fichier de référence par défaut
+REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reference.json')
+
+# Version du format des résultats
+VERSION_RESULTATS = 1
+
+# Dégradation tolérée par défaut avant de signaler une régression (pourcentage)
+SEUIL = 10.0
+
+# Temps de réflexion par coup de l'IA experte mesurée (ms): petit, pour garder la suite courte
+BUDGET_EXPERT_MS = 5
+
+# L'IA experte joue un combat pour DIVISEUR_COMBATS_EXPERT combats des autres difficultés
+DIVISEUR_COMBATS_EXPERT = 20
+
+# Budgets de temps d'import cumulé (ms, mesuré par python -X importtime dans un processus neuf)
+BUDGETS_IMPORT = {
+    'main': 30,                  # Point d'entrée: chaque commande importe ses modules à la demande
+    'src.game.simulation': 40,   # Cœur du combat sans interface
+    'src.game.monte_carlo': 50,  # Commande simulate
+    'combat_v2': 50              # Jeu interactif, jusqu'au premier écran
+}
+
+# Racine du dépôt (répertoire courant des processus mesurés)
+RACINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Sens d'amélioration des mesures: plus haut ou plus bas
+HAUT, BAS = 'haut', 'bas'
+
+
+def _mesure(valeur: float, unite: str, meilleur: str) -> Dict:
+    return {'valeur': valeur, 'unite': unite, 'meilleur': meilleur}
+
+
+def _meilleur_temps(fonction: Callable[[], None], repetitions: int) -> float:
+    """Durée (secondes) de la meilleure de plusieurs exécutions"""
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+def _percentile(valeurs: List[float], p: float) -> float:
+    valeurs = sorted(valeurs)
+    return valeurs[min(len(valeurs) - 1, max(0, round(p / 100 * len(valeurs)) - 1))]
+
+
+def mesurer_combats(combats: int, repetitions: int) -> Dict[str, Dict]:
+    """Tours joués par seconde dans des combats headless Sage vs Magicien"""
+    tours = sum(simulate_battle('sage', 'magicien', seed)['tours'] for seed in range(combats))
+    duree = _meilleur_temps(lambda: [simulate_battle('sage', 'magicien', seed) for seed in range(combats)],
+                            repetitions)
+    return {
+        'combat_tours_par_seconde': _mesure(tours / duree, 'tours/s', HAUT),
+        'combat_combats_par_seconde': _mesure(combats / duree, 'combats/s', HAUT)
+    }
+
+
+def mesurer_choix_ia(combats: int) -> Dict[str, Dict]:
+    """
+    Latences p50/p99 de AIPlayer.choose_skill par difficulté, mesurées dans de vrais combats
+
+    L'IA experte réfléchit BUDGET_EXPERT_MS par coup, sur moins de combats: sa latence vérifie
+    que le budget est tenu, son nombre d'itérations par coup mesure la vitesse de la recherche.
+    """
+    mesures = {}
+    for difficulte in ('facile', 'normal', 'difficile', 'expert'):
+        latences = []
+        iterations = []
+        nombre = combats if difficulte != 'expert' else max(1, combats // DIVISEUR_COMBATS_EXPERT)
+        TABLE_TRANSPOSITION.vider()  # Chaque mesure de l'IA experte part d'une table vide
+        for seed in range(nombre):
+            joueur1, joueur2 = CLASSES['sage']("IA-Sage-1"), CLASSES['magicien']("IA-Magicien-2")
+            joueur1.sink = joueur2.sink = SINK_NUL
+            combat = Combat(joueur1, joueur2, rng=Aleatoire(seed))
+            ias = (AIPlayer(joueur1, difficulte, budget_ms=BUDGET_EXPERT_MS),
+                   AIPlayer(joueur2, difficulte, budget_ms=BUDGET_EXPERT_MS))
+            while not combat.termine:
+                skills = combat.debut_tour()
+                skill = None
+                if skills:
+                    ia = ias[combat.index_actif]
+                    debut = time.perf_counter_ns()
+                    skill = ia.choose_skill(skills, combat.defenseur)
+                    latences.append(time.perf_counter_ns() - debut)
+                    if ia.recherche is not None:
+                        iterations.append(ia.recherche.iterations)
+                combat.jouer(skill)
+        mesures[f'choose_skill_{difficulte}_p50'] = _mesure(_percentile(latences, 50) / 1000, 'µs', BAS)
+        mesures[f'choose_skill_{difficulte}_p99'] = _mesure(_percentile(latences, 99) / 1000, 'µs', BAS)
+        if iterations:
+            mesures[f'choose_skill_{difficulte}_iterations_p50'] = _mesure(_percentile(iterations, 50),
+                                                                           'itérations/coup', HAUT)
+    return mesures
+
+
+def _remplir_sauvegardes(dossier: str, nombre: int):
+    """Écrit des sauvegardes réalistes (sans journal) sans passer par save_game"""
+    modele = simulate_battle('sage', 'magicien', 0)
+    for i in range(nombre):
+        data = {
+            'mode': ('Auto', 'PvE', 'PvP')[i % 3],
+            'vainqueur': modele['vainqueur'],
+            'nombre_tours': modele['tours'] + i % 50,
+            'joueur1': {'nom': modele['joueur1']['nom'], 'classe': 'sage'},
+            'joueur2': {'nom': modele['joueur2']['nom'], 'classe': 'magicien'},
+            'joueur1_final': modele['joueur1'],
+            'joueur2_final': modele['joueur2'],
+            'metadata': {'date': f'2025-{1 + i % 12:02d}-{1 + i % 28:02d}T12:00:{i % 60:02d}', 'version': '2.0.0'}
+        }
+        with open(os.path.join(dossier, f'combat_{i:07d}.json'), 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def mesurer_sauvegardes(tailles: List[int], repetitions: int) -> Dict[str, Dict]:
+    """Temps de lister_sauvegardes: premier appel (index construit) puis appels suivants, liste et page"""
+    mesures = {}
+    for nombre in tailles:
+        dossier = tempfile.mkdtemp(prefix='bench_saves_')
+        try:
+            _remplir_sauvegardes(dossier, nombre)
+            debut = time.perf_counter()
+            SaveManager(dossier).lister_sauvegardes()
+            mesures[f'lister_sauvegardes_{nombre}_premier'] = _mesure(
+                (time.perf_counter() - debut) * 1000, 'ms', BAS)
+
+            manager = SaveManager(dossier)
+            mesures[f'lister_sauvegardes_{nombre}'] = _mesure(
+                _meilleur_temps(manager.lister_sauvegardes, repetitions) * 1000, 'ms', BAS)
+            mesures[f'lister_sauvegardes_{nombre}_page'] = _mesure(
+                _meilleur_temps(lambda: manager.lister_sauvegardes(1, 20, mode='PvE'), repetitions) * 1000, 'ms', BAS)
+        finally:
+            shutil.rmtree(dossier, ignore_errors=True)
+    return mesures
+
+
+def mesurer_construction(repetitions: int, nombre: int = 2000) -> Dict[str, Dict]:
+    """Coût de construction d'un personnage (configuration déjà en cache dans le registre)"""
+    mesures = {}
+    for classe, type_personnage in CLASSES.items():
+        duree = _meilleur_temps(lambda: [type_personnage(f"Bench-{classe}") for _ in range(nombre)], repetitions)
+        mesures[f'construction_{classe}'] = _mesure(duree / nombre * 1e6, 'µs', BAS)
+    return mesures
+
+
+def _temps_import(module: str) -> float:
+    """Temps d'import cumulé d'un module (ms) d'après python -X importtime, dans un processus neuf"""
+    sortie = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=RACINE,
+                            capture_output=True, text=True, check=True).stderr
+    for ligne in sortie.splitlines():
+        # import time: <propre µs> | <cumulé µs> | <module indenté>
+        colonnes = ligne.split('|')
+        if len(colonnes) == 3 and colonnes[2].strip() == module:
+            return int(colonnes[1]) / 1000
+    raise RuntimeError(f"Temps d'import de {module} absent de la sortie de -X importtime")
+
+
+def mesurer_imports(repetitions: int) -> Dict[str, Dict]:
+    """Temps d'import des modules de BUDGETS_IMPORT (le meilleur de plusieurs processus)"""
+    return {
+        f'import_{module}': _mesure(min(_temps_import(module) for _ in range(max(repetitions, 3))), 'ms', BAS)
+        for module in BUDGETS_IMPORT
+    }
+
+
+def verifier_budgets(resultats: Dict) -> List[str]:
+    """Modules dont le temps d'import dépasse leur budget"""
+    return [module for module, budget in BUDGETS_IMPORT.items()
+            if resultats['mesures'].get(f'import_{module}', {}).get('valeur', 0) > budget]
+
+
+def lancer(tailles: List[int], combats: int, repetitions: int) -> Dict:
+    """Lance toute la suite et retourne les résultats sérialisables"""
+    # Configs lues et compilées avant toute mesure
+    for classe, type_personnage in CLASSES.items():
+        REGISTRE.definition(classe).competences(type_personnage)
+
+    mesures = {}
+    for nom, fonction in (('combats', lambda: mesurer_combats(combats, repetitions)),
+                          ('choix IA', lambda: mesurer_choix_ia(combats)),
+                          ('sauvegardes', lambda: mesurer_sauvegardes(tailles, repetitions)),
+                          ('construction', lambda: mesurer_construction(repetitions)),
+                          ('imports', lambda: mesurer_imports(repetitions))):
+        print(f"   ⏳ {nom}...", flush=True)
+        mesures.update(fonction())
+
+    return {
+        'version': VERSION_RESULTATS,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plateforme': platform.platform(),
+        'mesures': mesures
+    }
+
+
+def comparer(resultats: Dict, reference: Dict, seuil: float) -> List[str]:
+    """
+    Compare des résultats à une référence et affiche le tableau des écarts
+
+    Returns:
+        Noms des mesures dégradées de plus du seuil (en pourcentage)
+    """
+    regressions = []
+    print(f"\n{'Mesure':<38}{'Référence':>14}{'Actuel':>14}{'Écart':>10}")
+    for nom, mesure in resultats['mesures'].items():
+        ancienne = reference.get('mesures', {}).get(nom)
+        valeur = mesure['valeur']
+        if ancienne is None or not ancienne['valeur']:
+            print(f"{nom:<38}{'-':>14}{valeur:>14.2f}{'nouveau':>10}")
+            continue
+
+        # Écart signé: positif quand la mesure se dégrade
+        ecart = (valeur - ancienne['valeur']) / ancienne['valeur'] * 100
+        if mesure['meilleur'] == HAUT:
+            ecart = -ecart
+        statut = "  RÉGRESSION" if ecart > seuil else ""
+        if ecart > seuil:
+            regressions.append(nom)
+        print(f"{nom:<38}{ancienne['valeur']:>14.2f}{valeur:>14.2f}{ecart:>+9.1f}%{statut}")
+    return regressions
+
+
+def afficher(resultats: Dict):
+    print(f"\n{'Mesure':<38}{'Valeur':>14}  Unité")
+    for nom, mesure in resultats['mesures'].items():
+        print(f"{nom:<38}{mesure['valeur']:>14.2f}  {mesure['unite']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks et détection des régressions")
+    parser.add_argument('--reference', default=REFERENCE, help="Fichier de référence")
+    parser.add_argument('--enregistrer-reference', action='store_true',
+                        help="Enregistre les résultats comme nouvelle référence au lieu de comparer")
+    parser.add_argument('--seuil', type=float, default=SEUIL, help="Dégradation tolérée (pourcentage)")
+    parser.add_argument('--sortie', metavar='FICHIER', help="Écrit les résultats au format JSON")
+    parser.add_argument('--tailles', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Nombres de sauvegardes de la mesure de l'historique")
+    parser.add_argument('--combats', type=int, default=200, help="Combats joués par mesure de combat et d'IA")
+    parser.add_argument('--repetitions', type=int, default=3, help="Répétitions par mesure (la meilleure compte)")
+    parser.add_argument('--rapide', action='store_true', help="1k sauvegardes et 50 combats")
+    args = parser.parse_args()
+
+    if args.rapide:
+        args.tailles, args.combats = [1000], 50
+
+    print("\n📏 Suite de benchmarks...")
+    resultats = lancer(args.tailles, args.combats, args.repetitions)
+
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+
+    depassements = verifier_budgets(resultats)
+    for module in depassements:
+        print(f"\n❌ Import de {module} : {resultats['mesures'][f'import_{module}']['valeur']:.1f} ms "
+              f"(budget {BUDGETS_IMPORT[module]} ms)")
+
+    if args.enregistrer_reference:
+        with open(args.reference, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+        afficher(resultats)
+        print(f"\n✅ Référence enregistrée dans {args.reference}")
+        sys.exit(1 if depassements else 0)
+
+    if not os.path.exists(args.reference):
+        afficher(resultats)
+        print(f"\nℹ️  Pas de référence ({args.reference}): "
+              f"relancer avec --enregistrer-reference pour en créer une")
+        sys.exit(1 if depassements else 0)
+
+    with open(args.reference, 'r', encoding='utf-8') as f:
+        reference = json.load(f)
+    regressions = comparer(resultats, reference, args.seuil)
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.seuil:g}% : {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\n✅ Aucune régression au-delà de {args.seuil:g}%")
+    if depassements:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
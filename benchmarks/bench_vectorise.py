@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark du moteur vectorisé - Débit et équivalence avec le moteur objet
+
+Mesure le nombre de combats simulés par seconde par chacun des deux moteurs
+(un seul processus), puis vérifie pour chaque appariement de classes que
+le moteur NumPy reproduit les statistiques du moteur objet : taux de
+victoire du joueur 1, nombre moyen de tours et répartition des compétences.
+Le script se termine en erreur si un écart dépasse le seuil.
+
+Usage:
+    python benchmarks/bench_vectorise.py [--parties-objet 2000] [--parties-numpy 20000] [--seuil 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.game.monte_carlo import lancer_simulation
+from src.game.vectorise import MoteurVectorise, comparer_moteurs
+
+
+APPARIEMENTS = (('sage', 'magicien'), ('magicien', 'sage'), ('sage', 'sage'), ('magicien', 'magicien'))
+
+
+def mesurer_debit(parties_objet: int, parties_numpy: int):
+    """Retourne le débit (combats/s) des moteurs objet et NumPy"""
+    lancer_simulation(10, 1)  # Configs compilées hors mesure
+
+    debut = time.perf_counter()
+    lancer_simulation(parties_objet, 1)
+    objet = parties_objet / (time.perf_counter() - debut)
+
+    debut = time.perf_counter()
+    MoteurVectorise('sage', 'magicien').simuler(parties_numpy, seed=0)
+    numpy = parties_numpy / (time.perf_counter() - debut)
+    return objet, numpy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Débit et équivalence du moteur vectorisé")
+    parser.add_argument('--parties-objet', type=int, default=2000, help="Combats par test du moteur objet")
+    parser.add_argument('--parties-numpy', type=int, default=20000, help="Combats par test du moteur NumPy")
+    parser.add_argument('--difficulte', default='normal', choices=['facile', 'normal', 'difficile'])
+    parser.add_argument('--seuil', type=float, default=4.0, help="Écart maximal accepté (en écarts-types)")
+    args = parser.parse_args()
+
+    objet, numpy = mesurer_debit(args.parties_objet, args.parties_numpy)
+    print(f"Moteur objet : {objet:>10,.0f} combats/s")
+    print(f"Moteur NumPy : {numpy:>10,.0f} combats/s (x{numpy / objet:.1f})")
+
+    print(f"\n{'Appariement':<22}{'J1 gagne (obj/np)':>22}{'Tours (obj/np)':>20}{'z max':>8}")
+    echecs = 0
+    for class_a, class_b in APPARIEMENTS:
+        resultat = comparer_moteurs(class_a, class_b, args.parties_objet, args.parties_numpy,
+                                    args.difficulte, args.seuil)
+        victoire, tours = resultat['taux_victoire_premier'], resultat['tours_moyen']
+        z_max = max(victoire['z'], tours['z'], resultat['skills_z_max'])
+        statut = "ok" if resultat['ok'] else "ÉCART"
+        print(f"{class_a + ' vs ' + class_b:<22}"
+              f"{victoire['objet']:>10.1%} / {victoire['vectorise']:<9.1%}"
+              f"{tours['objet']:>9.1f} / {tours['vectorise']:<8.1f}{z_max:>8.2f}  {statut}")
+        echecs += not resultat['ok']
+
+    sys.exit(1 if echecs else 0)
+
+
+if __name__ == '__main__':
+    main()
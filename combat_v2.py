@@ -11,17 +11,27 @@ if sys.platform == "win32":
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# Seul le cœur du combat est importé ici: menus, saisies, art ASCII et sauvegardes
+# sont importés par les fonctions qui s'en servent
 from src.models.sage import Sage
 from src.models.magicien import Magicien
 from src.ai.ai_player import AIPlayer
-from src.utils.input_handler import InputHandler
-from src.utils.menu import Menu
-from src.game.save_manager import SaveManager
+from src.ai.mcts import BUDGET_MS
+from src.game.simulation import Combat
+from src.models.aleatoire import Aleatoire
+from src.models.evenements import SinkJournal, SinkTerminal
 
 
-def start_game():
-    """Joueur vs IA - Démarre le jeu et gère le menu principal"""
+def start_game(difficulte: str = 'normal', budget_ms: float = BUDGET_MS):
+    """
+    Joueur vs IA - Démarre le jeu et gère le menu principal
+    
+    Args:
+        difficulte: Niveau de l'IA adverse en PvE
+        budget_ms: Temps de réflexion par coup de l'IA experte
+    """
     from src.utils import ascii_art
+    from src.utils.menu import Menu
     
     ascii_art.display_welcome_screen()
     
@@ -36,7 +46,7 @@ def start_game():
             
             # Confirmation et lancement direct
             if Menu.confirm_pve_battle(player_name, player_class):
-                start_pve_battle(player_name, player_class)
+                start_pve_battle(player_name, player_class, difficulte, budget_ms)
                 return
             else:
                 print("\n❌ Combat annulé.")
@@ -52,14 +62,14 @@ def start_game():
                 player_class = Menu.choose_character()
                 player_name = Menu.ask_player_name(player_class)
                 if Menu.confirm_pve_battle(player_name, player_class):
-                    start_pve_battle(player_name, player_class)
+                    start_pve_battle(player_name, player_class, difficulte, budget_ms)
                     return
             elif mode == '2':  # Auto (AI vs AI)
                 start_auto_battle()
                 return
             elif mode == '3':  # PvP
-                print("\n🚧 Mode PvP - En développement...")
-                input("⏎ Appuyez sur Entrée pour continuer...")
+                if start_pvp_battle():
+                    return
             # mode == '4' retour au menu principal
         
         elif choice == '4':  # Quitter
@@ -67,19 +77,25 @@ def start_game():
             sys.exit(0)
 
 
-def start_auto_battle():
-    """Mode automatique (IA vs IA)"""
-    import random
+def start_auto_battle(seed: int = None):
+    """
+    Mode automatique (IA vs IA)
+    
+    Args:
+        seed: Graine du combat pour rejouer exactement une partie (aléatoire par défaut)
+    """
     from src.utils import ascii_art
     
+    rng = Aleatoire(seed)
+    
     print("\n" + "="*70)
     print("🤖 MODE AUTO - IA vs IA")
     print("="*70)
     
     # Sélection aléatoire des classes
     classes = ['sage', 'magicien']
-    ai1_class = random.choice(classes)
-    ai2_class = random.choice([c for c in classes if c != ai1_class])  # Force different classes
+    ai1_class = rng.choix(classes)
+    ai2_class = rng.choix([c for c in classes if c != ai1_class])  # Force different classes
     
     # Création des personnages
     if ai1_class == 'sage':
@@ -88,13 +104,17 @@ def start_auto_battle():
     else:
         ai1 = Magicien("IA-Magicien")
         ai2 = Sage("IA-Sage")
+    ai1.rng = ai2.rng = rng
     
     print(f"\n🤖 {ai1.nom} VS 🤖 {ai2.nom}")
+    print(f"🎲 Seed du combat : {rng.seed}")
     ascii_art.display_vs(ai1_class, ai2_class)
     
     # Création des IA
-    ai_player1 = AIPlayer(ai1, difficulte='normal') # Ce n'est pas Elden Ring mais bon...
-    ai_player2 = AIPlayer(ai2, difficulte='normal')
+    ai_players = {
+        ai1.nom: AIPlayer(ai1, difficulte='normal'), # Ce n'est pas Elden Ring mais bon...
+        ai2.nom: AIPlayer(ai2, difficulte='normal')
+    }
     
     print(f"\n📊 {ai1.nom}:")
     ai1.display_stats()
@@ -104,82 +124,15 @@ def start_auto_battle():
     
     input("\n⏎ Appuyez sur Entrée pour commencer...")
     
-    # Boucle de combat
-    turn = 1
+    def choisir_ia(combat: Combat, available_skills):
+        skill = ai_players[combat.attaquant.nom].choose_skill(available_skills, combat.defenseur)
+        if skill:
+            print(f"\n🤖 {combat.attaquant.nom} utilise : {skill.icone} {skill.nom}")
+        return skill
     
-    while ai1.is_alive and ai2.is_alive:
-        # Tour de l'IA 1
-        print("\n" + "="*70)
-        print(f"⚔️  TOUR {turn} - {ai1.nom} attaque !")
-        print("="*70)
-        
-        ai1.start_turn(ai2)
-        
-        if not ai2.is_alive:
-            break
-        
-        available_skills_ai1 = [s for s in ai1.skills if ai1.can_use_skill(s)]
-        if not available_skills_ai1:
-            print(f"\n⚠️  {ai1.nom} n'a plus de MP pour utiliser ses compétences!")
-            ai1.end_turn()
-            if not ai2.is_alive:
-                break
-            input("\n⏎ Appuyez sur Entrée pour continuer...")
-            continue
-        
-        skill_ai1 = ai_player1.choose_skill(available_skills_ai1, ai2)
-        if skill_ai1:
-            print(f"\n🤖 {ai1.nom} utilise : {skill_ai1.get('icone', '⚔️')} {skill_ai1['nom']}")
-            ai1.use_skill(skill_ai1, ai2)
-        
-        ai1.end_turn()
-        
-        if not ai2.is_alive:
-            break
-        
-        input("\n⏎ Appuyez sur Entrée pour continuer...")
-        
-        # Tour de l'IA 2
-        print("\n" + "="*70)
-        print(f"⚔️  TOUR {turn+1} - {ai2.nom} attaque !")
-        print("="*70)
-        
-        ai2.start_turn(ai1)
-        
-        if not ai1.is_alive:
-            break
-        
-        available_skills_ai2 = [s for s in ai2.skills if ai2.can_use_skill(s)]
-        if not available_skills_ai2:
-            print(f"\n⚠️  {ai2.nom} n'a plus de MP pour utiliser ses compétences!")
-            ai2.end_turn()
-            if not ai1.is_alive:
-                break
-            input("\n⏎ Appuyez sur Entrée pour continuer...")
-            turn += 2
-            continue
-        
-        skill_ai2 = ai_player2.choose_skill(available_skills_ai2, ai1)
-        if skill_ai2:
-            print(f"\n🤖 {ai2.nom} utilise : {skill_ai2.get('icone', '⚔️')} {skill_ai2['nom']}")
-            ai2.use_skill(skill_ai2, ai1)
-        
-        ai2.end_turn()
-        
-        if not ai1.is_alive:
-            break
-        
-        input("\n⏎ Appuyez sur Entrée pour continuer...")
-        
-        turn += 2
-    
-    # Fin du combat
-    if ai1.is_alive:
-        winner = ai1
-        loser = ai2
-    else:
-        winner = ai2
-        loser = ai1
+    combat, journal = _boucle_combat(ai1, ai2, choisir_ia, choisir_ia)
+    winner = combat.vainqueur
+    loser = ai2 if winner is ai1 else ai1
     
     print("\n" + "="*70)
     ascii_art.display_victory()
@@ -197,29 +150,23 @@ def start_auto_battle():
     print(f"   💥 Dégâts infligés: {loser.total_damage_dealt}")
     print(f"   ⚡ Coups critiques: {loser.critical_hits}")
     
+    # Stats finales figées avant la montée de niveau (soin complet)
+    donnees = combat.donnees_sauvegarde('Auto', journal)
+    
     # Montée de niveau du vainqueur
     winner.gain_level()
     
     # Sauvegarde
+    from src.game.save_manager import SaveManager
     save_manager = SaveManager()
-    save_manager.save_game({
-        'mode': 'Auto',
-        'vainqueur': winner.nom,
-        'perdant': loser.nom,
-        'tours': turn,
-        'stats_vainqueur': {
-            'hp': winner.current_hp,
-            'niveau': winner.level,
-            'degats_infliges': winner.total_damage_dealt,
-            'coups_critiques': winner.critical_hits
-        }
-    })
-    
+    save_manager.save_game(donnees)
 
 
-def start_pve_battle(player_name: str, player_class: str):
+def start_pve_battle(player_name: str, player_class: str, difficulte: str = 'normal',
+                     budget_ms: float = BUDGET_MS):
     """Démarre une bataille PvE avec les paramètres donnés"""
     from src.utils import ascii_art
+    from src.utils.input_handler import InputHandler
     
     # Création des personnages
     if player_class == 'sage':
@@ -230,9 +177,10 @@ def start_pve_battle(player_name: str, player_class: str):
         player = Magicien(player_name)
         ai = Sage("AI")
         ai_class = 'sage'
+    player.rng = ai.rng = Aleatoire()
     
     # Créer l'IA
-    ai_player = AIPlayer(ai, difficulte='normal')
+    ai_player = AIPlayer(ai, difficulte=difficulte, budget_ms=budget_ms)
     
     print("\n" + "="*70)
     print("🎭 LES COMBATTANTS ENTRENT EN SCÈNE !")
@@ -248,91 +196,119 @@ def start_pve_battle(player_name: str, player_class: str):
     
     input("\n⏎ Appuyez sur Entrée pour commencer la bataille...")
     
-    # Boucle de combat
-    turn = 1
+    def choisir_joueur(combat: Combat, available_skills):
+        return InputHandler.choose_skill(player, ai)
     
-    while player.is_alive and ai.is_alive:
-        # Tour du joueur
-        print("\n" + "="*70)
-        print(f"⚔️  TOUR {turn} - {player.nom} attaque !")
-        print("="*70)
-        
-        player.start_turn(ai)
-        
-        if not ai.is_alive:
-            break
-        
-        player_skill = InputHandler.choose_skill(player, ai)
-        player.use_skill(player_skill, ai)
-        
-        player.end_turn()
-        
-        if not ai.is_alive:
-            break
-        
-        input("\n⏎ Appuyez sur Entrée pour continuer...")
-        
-        # Tour de l'IA
-        print("\n" + "="*70)
-        print(f"⚔️  TOUR {turn+1} - {ai.nom} attaque !")
-        print("="*70)
-        
-        ai.start_turn(player)
-        
-        if not player.is_alive:
-            break
-        
+    def choisir_ia(combat: Combat, available_skills):
         # L'IA choisit parmi les compétences disponibles
-        available_ai_skills = [s for s in ai.skills if ai.can_use_skill(s)]
-        if not available_ai_skills:
-            print(f"\n⚠️  {ai.nom} n'a plus de PM pour utiliser ses compétences!")
-            ai.end_turn()
-            if not player.is_alive:
-                break
-            input("\n⏎ Appuyez sur Entrée pour continuer...")
-            turn += 2
-            continue
-        
-        ai_skill = ai_player.choose_skill(available_ai_skills, player)
+        ai_skill = ai_player.choose_skill(available_skills, player)
         if ai_skill:
-            print(f"\n🤖 L'IA choisit : {ai_skill.get('icone', '⚔️')} {ai_skill['nom']}")
-            ai.use_skill(ai_skill, player)
-        
-        ai.end_turn()
-        
-        if not player.is_alive:
-            break
-        
-        input("\n⏎ Appuyez sur Entrée pour continuer...")
-        
-        turn += 2
+            print(f"\n🤖 L'IA choisit : {ai_skill.icone} {ai_skill.nom}")
+        return ai_skill
     
-    # Fin du combat
-    if player.is_alive:
-        winner = player
-        loser = ai
-    else:
-        winner = ai
-        loser = player
+    combat, journal = _boucle_combat(player, ai, choisir_joueur, choisir_ia)
+    winner = combat.vainqueur
+    loser = ai if winner is player else player
     
     InputHandler.display_victory_message(winner, loser)
     
+    # Stats finales figées avant la montée de niveau (soin complet)
+    donnees = combat.donnees_sauvegarde('PvE', journal)
+    
     # Montée de niveau du vainqueur
     winner.gain_level()
     
     # Sauvegarde
+    from src.game.save_manager import SaveManager
     save_manager = SaveManager()
-    save_manager.save_game({
-        'vainqueur': winner.nom,
-        'perdant': loser.nom,
-        'tours': turn,
-        'stats_vainqueur': {
-            'hp': winner.current_hp,
-            'niveau': winner.level,
-            'degats_infliges': winner.total_damage_dealt,
-            'coups_critiques': winner.critical_hits
-        }
-    })
+    save_manager.save_game(donnees)
+
+
+def start_pvp_battle() -> bool:
+    """
+    Joueur vs Joueur en réseau: héberge une partie sur cette machine ou en rejoint une
+    
+    Returns:
+        True si une partie a été lancée, False pour revenir au menu
+    """
+    import asyncio
+    from src.game.client import jouer_pvp_terminal
+    from src.game.protocole import PORT
+    from src.utils.menu import Menu
+    
+    choice = Menu.pvp_menu()
+    if choice == '4':
+        return False
+    
+    hote, port, jeton = '127.0.0.1', PORT, None
+    if choice == '1':
+        from src.game.save_manager import SaveManager
+        from src.game.serveur import demarrer_en_fond
+        try:
+            demarrer_en_fond(hote=hote, port=port, save_manager=SaveManager())
+        except OSError as erreur:
+            print(f"\n❌ Impossible d'ouvrir le port {port} ({erreur.strerror}) : une partie est peut-être "
+                  f"déjà hébergée ici, rejoignez-la.")
+            return False
+        print(f"\n🏠 Partie hébergée sur {hote}:{port}")
+        print(f"   Votre adversaire la rejoint depuis ce menu, ou avec : python main.py connect --pvp")
+    else:
+        hote = input(f"\n🌐 Adresse du serveur (Entrée : {hote}) : ").strip() or hote
+        saisie = input(f"🔌 Port (Entrée : {port}) : ").strip()
+        port = int(saisie) if saisie.isdigit() else port
+        if choice == '3':
+            jeton = input("🔁 Jeton de reprise : ").strip()
+    
+    player_name, player_class = "Joueur", 'sage'  # Ignorés en reprise: le serveur connaît déjà le joueur
+    if jeton is None:
+        player_class = Menu.choose_character()
+        player_name = Menu.ask_player_name(player_class)
+    
+    asyncio.run(jouer_pvp_terminal(player_name, player_class, hote, port, jeton))
+    return True
+
+
+def _boucle_combat(joueur1, joueur2, choisir1, choisir2):
+    """
+    Boucle de combat commune aux modes interactifs
+    
+    Args:
+        joueur1: Personnage qui commence
+        joueur2: Second personnage
+        choisir1: Fonction (combat, skills disponibles) -> skill pour le joueur 1
+        choisir2: Idem pour le joueur 2
+        
+    Returns:
+        Le combat terminé et son journal d'événements
+    """
+    journal = SinkJournal((joueur1.nom, joueur2.nom), suivant=SinkTerminal())
+    joueur1.sink = joueur2.sink = journal
+    
+    combat = Combat(joueur1, joueur2, tours_max=sys.maxsize, rng=joueur1.rng)
+    choix = (choisir1, choisir2)
+    
+    while not combat.termine:
+        attaquant, defenseur = combat.attaquant, combat.defenseur
+        available_skills = combat.debut_tour()
+        
+        if not defenseur.is_alive:
+            combat.jouer(None)
+            break
+        
+        if available_skills:
+            skill = choix[combat.index_actif](combat, available_skills)
+        else:
+            print(f"\n⚠️  {attaquant.nom} n'a plus de PM pour utiliser ses compétences!")
+            skill = None
+        
+        combat.jouer(skill)
+        
+        if not defenseur.is_alive:
+            break
+        
+        input("\n⏎ Appuyez sur Entrée pour continuer...")
+    
+    return combat, journal
 
 
 if __name__ == "__main__":
@@ -1,15 +1,354 @@
 """
 WiZ-Fight - Combat Magique Épique
 Point d'entrée principal du jeu
+
+Usage:
+    python main.py                                  # Jeu interactif
+    python main.py --ia expert --budget-ms 500      # Jeu interactif contre l'IA experte (MCTS)
+    python main.py simulate --games 100000 --workers 4
+    python main.py simulate --games 1000000 --moteur numpy
+    python main.py simulate --games 100000 --no-cache
+    python main.py solve --classes sage sage --seed 3 --tour 100
+    python main.py tune --cible 0.5 --tours 30 80 --moteur numpy --sortie diff.json
+    python main.py tournament --classes sage sage --graines 200 --reprise tournoi.json
+    python main.py replay combat_20251130_194400.json --tour 12
+    python main.py replay --mode PvE --tri duree_tours --page 2
+    python main.py export --dossier export --compacter --stats
+    python main.py serve --port 8765 --sessions-max 500 --inactivite 300
+    python main.py connect --port 8765                  # Client terminal (--charge 200: test de charge)
+    python main.py connect --pvp --nom Merlin --classe sage   # PvP (--reprise JETON, --charge 100: 100 paires)
+    python main.py --profile trace.json simulate --games 2000   # Profil des phases (ou WIZFIGHT_PROFILE=1)
 """
 
+import argparse
+import json
+import os
 import sys
-from combat_v2 import start_game
+
+
+def creer_parser() -> argparse.ArgumentParser:
+    """Construit le parser des commandes en ligne de commande"""
+    parser = argparse.ArgumentParser(prog='wizfight', description="WiZ-Fight - Combat Magique Épique")
+    parser.add_argument('--ia', default='normal', choices=['facile', 'normal', 'difficile', 'expert'],
+                        help="Niveau de l'IA adverse en PvE")
+    parser.add_argument('--budget-ms', type=float, default=300,
+                        help="Temps de réflexion par coup de l'IA experte (millisecondes)")
+    parser.add_argument('--profile', nargs='?', const='profil.json', metavar='TRACE',
+                        help="Mesure les phases des tours et écrit une trace Chrome/Perfetto "
+                             "(profil.json par défaut, ou variable WIZFIGHT_PROFILE)")
+    commandes = parser.add_subparsers(dest='commande')
+
+    simulate = commandes.add_parser('simulate', help="Simule des combats IA vs IA en masse (équilibrage)")
+    simulate.add_argument('--games', type=int, default=10000, help="Nombre de combats à simuler")
+    simulate.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Nombre de processus")
+    simulate.add_argument('--classes', nargs=2, default=['sage', 'magicien'], metavar=('CLASSE_A', 'CLASSE_B'))
+    simulate.add_argument('--difficulte', default='normal', choices=['facile', 'normal', 'difficile'])
+    simulate.add_argument('--seed', type=int, default=0, help="Graine du premier combat")
+    simulate.add_argument('--moteur', default='objet', choices=['objet', 'numpy'],
+                          help="Moteur de simulation (numpy: combats vectorisés par lots)")
+    simulate.add_argument('--json', metavar='FICHIER', help="Écrit le rapport au format JSON")
+    simulate.add_argument('--cache', metavar='FICHIER', default=os.path.join('.cache', 'combats.sqlite'),
+                          help="Cache des combats déjà simulés (moteur objet)")
+    simulate.add_argument('--cache-max', type=int, default=1_000_000, help="Nombre maximal de combats en cache")
+    simulate.add_argument('--no-cache', action='store_true',
+                          help="Simule tous les combats sans lire ni écrire le cache")
+
+    solve = commandes.add_parser('solve', help="Calcule la probabilité exacte de victoire (programmation dynamique)")
+    solve.add_argument('--classes', nargs=2, default=['sage', 'magicien'], metavar=('CLASSE_A', 'CLASSE_B'))
+    solve.add_argument('--difficulte', default='normal', choices=['facile', 'normal', 'difficile'])
+    solve.add_argument('--seed', type=int, help="Part de la position d'un combat seedé (avec --tour)")
+    solve.add_argument('--tour', type=int, default=0, help="Tours joués avant la position à résoudre")
+    solve.add_argument('--etats-max', type=int, default=50000, help="Positions distinctes au plus par tour")
+    solve.add_argument('--seuil', type=float, default=0.0,
+                       help="Probabilité sous laquelle une position est abandonnée")
+    solve.add_argument('--temps-max', type=float, help="Durée maximale de la résolution (secondes)")
+    solve.add_argument('--json', metavar='FICHIER', help="Écrit le résultat au format JSON")
+
+    tune = commandes.add_parser('tune', help="Cherche des valeurs de skills qui atteignent une cible d'équilibrage")
+    tune.add_argument('--classes', nargs=2, default=['sage', 'magicien'], metavar=('CLASSE_A', 'CLASSE_B'))
+    tune.add_argument('--cible', type=float, default=0.5, help="Taux de victoire visé pour CLASSE_A")
+    tune.add_argument('--tours', type=float, nargs=2, default=[30, 80], metavar=('MIN', 'MAX'),
+                      help="Fourchette visée pour le nombre moyen de tours")
+    tune.add_argument('--generations', type=int, default=5, help="Nombre maximal de générations")
+    tune.add_argument('--candidats', type=int, default=16, help="Candidats par génération")
+    tune.add_argument('--parties', type=int, default=200, help="Combats par candidat à la première ronde")
+    tune.add_argument('--mutations', type=int, default=2, help="Paramètres modifiés par candidat")
+    tune.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Nombre de processus")
+    tune.add_argument('--moteur', default='objet', choices=['objet', 'numpy'], help="Moteur de simulation")
+    tune.add_argument('--difficulte', default='normal', choices=['facile', 'normal', 'difficile'])
+    tune.add_argument('--seed', type=int, default=0, help="Graine de la recherche")
+    tune.add_argument('--sortie', metavar='FICHIER', help="Écrit le diff JSON des configs et le résumé")
+
+    tournament = commandes.add_parser('tournament', help="Classe des politiques d'IA par un tournoi (Elo)")
+    tournament.add_argument('--politiques', nargs='+', metavar='POLITIQUE',
+                            help="Politiques classées (toutes sauf l'experte par défaut)")
+    tournament.add_argument('--classes', nargs=2, default=['sage', 'magicien'], metavar=('CLASSE_A', 'CLASSE_B'))
+    tournament.add_argument('--graines', type=int, default=100,
+                            help="Combats par paire de politiques et par attribution des classes")
+    tournament.add_argument('--seed', type=int, default=0, help="Graine du premier combat de chaque rencontre")
+    tournament.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Nombre de processus")
+    tournament.add_argument('--reprise', metavar='FICHIER', default='tournoi.json',
+                            help="Fichier de reprise (résultats déjà joués, réutilisés)")
+    tournament.add_argument('--json', metavar='FICHIER', help="Écrit le classement au format JSON")
+
+    replay = commandes.add_parser('replay', help="Rejoue un combat sauvegardé tour par tour")
+    replay.add_argument('fichier', nargs='?', help="Fichier dans saves/ (historique si absent)")
+    replay.add_argument('--tour', type=int, help="Affiche directement un tour précis")
+    replay.add_argument('--pas-a-pas', action='store_true', help="Attend Entrée entre chaque tour")
+    replay.add_argument('--page', type=int, default=1, help="Page de l'historique")
+    replay.add_argument('--par-page', type=int, default=20, help="Parties par page de l'historique")
+    replay.add_argument('--tri', default='date', choices=['date', 'mode', 'vainqueur', 'duree_tours'])
+    replay.add_argument('--croissant', action='store_true', help="Trie l'historique par ordre croissant")
+    replay.add_argument('--mode', help="Ne liste que ce mode de jeu (PvE, PvP, Auto)")
+    replay.add_argument('--vainqueur', help="Ne liste que les parties gagnées par ce joueur")
+    replay.add_argument('--tours-min', type=int, help="Durée minimale en tours")
+    replay.add_argument('--tours-max', type=int, help="Durée maximale en tours")
+    replay.add_argument('--date-min', help="Date ISO minimale (ex. 2025-11-30)")
+    replay.add_argument('--date-max', help="Date ISO maximale")
+
+    export = commandes.add_parser('export', help="Exporte l'historique au format colonnaire (Parquet ou npz)")
+    export.add_argument('--dossier', default='export', help="Répertoire de l'export")
+    export.add_argument('--format', default='auto', choices=['auto', 'parquet', 'npz'],
+                        help="Format des tables (auto: Parquet si pyarrow est installé, sinon npz)")
+    export.add_argument('--compacter', action='store_true', help="Fusionne les exports successifs en un seul")
+    export.add_argument('--stats', action='store_true', help="Affiche les taux de victoire par classe et par tranche")
+    export.add_argument('--tranche', type=int, default=10, help="Largeur des tranches de tours des statistiques")
+
+    serve = commandes.add_parser('serve', help="Héberge des parties PvE et PvP simultanées sur TCP")
+    serve.add_argument('--hote', default='127.0.0.1', help="Adresse d'écoute")
+    serve.add_argument('--port', type=int, default=8765, help="Port d'écoute")
+    serve.add_argument('--sessions-max', type=int, default=500, help="Sessions simultanées au plus")
+    serve.add_argument('--inactivite', type=float, default=300,
+                       help="Délai sans réponse avant de fermer une session ou de perdre un tour PvP (secondes)")
+    serve.add_argument('--sauvegardes', default='saves', help="Répertoire des sauvegardes (journal en segments)")
+    serve.add_argument('--sans-sauvegarde', action='store_true', help="Ne sauvegarde pas les parties")
+
+    connect = commandes.add_parser('connect', help="Joue sur un serveur WiZ-Fight (ou le teste en charge)")
+    connect.add_argument('--hote', default='127.0.0.1', help="Adresse du serveur")
+    connect.add_argument('--port', type=int, default=8765, help="Port du serveur")
+    connect.add_argument('--charge', type=int, metavar='SESSIONS',
+                         help="Lance autant de clients automatiques simultanés et affiche les latences")
+    connect.add_argument('--pvp', action='store_true', help="Joue contre un autre joueur (--charge: nombre de paires)")
+    connect.add_argument('--nom', default='Joueur', help="Nom du joueur PvP")
+    connect.add_argument('--classe', default='sage', choices=['sage', 'magicien'], help="Classe du joueur PvP")
+    connect.add_argument('--reprise', metavar='JETON', help="Reprend une partie PvP interrompue")
+
+    return parser
+
+
+def commande_simulate(args):
+    """Lance une simulation Monte Carlo et affiche le rapport"""
+    from src.game.cache_combats import CacheCombats
+    from src.game.monte_carlo import main_simulation
+
+    rapport = main_simulation(
+        args.games, args.workers,
+        classes=tuple(args.classes), difficulte=args.difficulte, seed_base=args.seed,
+        moteur=args.moteur, cache=None if args.no_cache else CacheCombats(args.cache, args.cache_max)
+    )
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rapport.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+def commande_solve(args):
+    """Résout exactement un combat IA vs IA (ou sa fin) et affiche le résultat"""
+    from src.game.solveur import SolveurExact, position_apres
+
+    class_a, class_b = args.classes
+    combat = agressives = None
+    if args.seed is not None:
+        combat, agressives = position_apres(class_a, class_b, args.seed, args.tour, args.difficulte)
+
+    solveur = SolveurExact(class_a, class_b, args.difficulte, etats_max=args.etats_max,
+                           seuil=args.seuil, temps_max=args.temps_max)
+    resultat = solveur.resoudre(combat, agressives)
+    resultat.afficher()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resultat.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+def commande_tune(args):
+    """Lance l'équilibreur et affiche (ou écrit) le diff de configuration proposé"""
+    from src.game.equilibreur import Equilibreur
+
+    def afficher_generation(resume):
+        print(f"   🧬 Génération {resume['generation']}: {resume['taux_victoire']:.1%} de victoires, "
+              f"{resume['tours_moyen']:.1f} tours, écart {resume['perte']:.3f} ({resume['combats']} combats)")
+
+    equilibreur = Equilibreur(tuple(args.classes), args.cible, tuple(args.tours), difficulte=args.difficulte,
+                              moteur=args.moteur, workers=args.workers, seed=args.seed)
+    print(f"\n🎚️  Équilibrage sur {len(equilibreur.parametres)} paramètres ({args.workers} processus)...")
+    resultat = equilibreur.lancer(args.generations, args.candidats, args.parties, args.mutations,
+                                  progression=afficher_generation)
+    resultat.afficher()
+
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            json.dump(resultat.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+def commande_tournament(args):
+    """Lance un tournoi entre politiques d'IA et affiche le classement"""
+    from src.ai.politiques import POLITIQUES, politique
+    from src.game.tournoi import Tournoi
+
+    if args.politiques:
+        politiques = [politique(nom) for nom in args.politiques]
+    else:
+        politiques = [p for p in POLITIQUES.values() if p.difficulte != 'expert']
+
+    def afficher_progression(faits: int, total: int):
+        print(f"\r   ⏳ {faits}/{total} combats", end='', flush=True)
+
+    tournoi = Tournoi(politiques, tuple(args.classes), args.graines, args.seed, workers=args.workers,
+                      fichier=args.reprise)
+    print(f"\n🏟️  Tournoi entre {len(politiques)} politiques ({args.workers} processus)...")
+    resultat = tournoi.lancer(progression=afficher_progression)
+    print()
+    resultat.afficher()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resultat.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+def commande_replay(args):
+    """Affiche l'historique ou le replay d'une sauvegarde"""
+    from src.game.save_manager import SaveManager
+
+    save_manager = SaveManager()
+    if args.fichier:
+        save_manager.afficher_replay(args.fichier, tour=args.tour, pas_a_pas=args.pas_a_pas)
+    else:
+        save_manager.afficher_historique(
+            args.page, args.par_page, tri=args.tri, decroissant=not args.croissant, mode=args.mode,
+            vainqueur=args.vainqueur, tours_min=args.tours_min, tours_max=args.tours_max,
+            date_min=args.date_min, date_max=args.date_max
+        )
+
+
+def commande_export(args):
+    """Exporte les nouvelles sauvegardes au format colonnaire et affiche les statistiques demandées"""
+    from src.game.export_colonnes import ExportColonnes
+    from src.game.save_manager import SaveManager
+
+    resume = SaveManager().exporter(args.dossier, args.format, args.compacter)
+    print(f"\n📦 {resume['exportees']} parties exportées dans {args.dossier}/ ({resume['illisibles']} illisibles)")
+    if resume.get('compactage', {}).get('fusionnees', 0) > 1:
+        print(f"   🗜️  {resume['compactage']['fusionnees']} parties d'export fusionnées "
+              f"({resume['compactage']['lignes']} lignes)")
+
+    if args.stats:
+        statistiques = ExportColonnes(args.dossier).statistiques(args.tranche)
+        print(f"\n🏆 TAUX DE VICTOIRE ({statistiques['parties']} parties) :")
+        for classe, ligne in statistiques['par_classe'].items():
+            print(f"   {classe.title():<10} {ligne['taux_victoire']:7.2%} ({ligne['participations']} participations)")
+        print(f"\n⏱️  PAR TRANCHE DE TOURS :")
+        for tranche, taux in statistiques['par_tranche'].items():
+            print(f"   {tranche:<10} " + "  ".join(f"{classe.title()} {t:7.2%}" for classe, t in taux.items()))
+
+
+def commande_serve(args):
+    """Lance le serveur de parties PvE et PvP"""
+    from src.game.save_manager import SaveManager
+    from src.game.serveur import lancer_serveur
+
+    save_manager = None if args.sans_sauvegarde else SaveManager(args.sauvegardes, stockage='segments')
+    lancer_serveur(hote=args.hote, port=args.port, sessions_max=args.sessions_max,
+                   delai_inactivite=args.inactivite, difficulte=args.ia, budget_ms=args.budget_ms,
+                   save_manager=save_manager)
+
+
+def commande_connect(args):
+    """Joue une partie en ligne, ou lance un test de charge contre le serveur"""
+    import asyncio
+    from src.game.client import charge_pve, charge_pvp, jouer_pvp_terminal, jouer_terminal
+
+    if args.pvp or args.reprise:
+        if args.charge is None:
+            asyncio.run(jouer_pvp_terminal(args.nom, args.classe, args.hote, args.port, args.reprise))
+            return
+        print(f"\n🌐 {args.charge} parties PvP automatiques sur {args.hote}:{args.port}...")
+        resultat = asyncio.run(charge_pvp(args.charge, args.hote, args.port))
+        print(f"   ✅ {resultat['terminees']}/{resultat['joueurs']} joueurs ont fini leur partie "
+              f"en {resultat['duree_s']:.1f}s")
+        print(f"   ⏱️  Coup (envoi -> validation et diffusion par le serveur) : "
+              f"moyenne {resultat['latence_moyenne_ms']:.2f} ms | p50 {resultat['latence_p50_ms']:.2f} ms | "
+              f"p99 {resultat['latence_p99_ms']:.2f} ms")
+        return
+
+    if args.charge is None:
+        asyncio.run(jouer_terminal(args.hote, args.port))
+        return
+
+    print(f"\n🌐 {args.charge} sessions automatiques sur {args.hote}:{args.port}...")
+    resultat = asyncio.run(charge_pve(args.charge, args.hote, args.port))
+    print(f"   ✅ {resultat['terminees']}/{resultat['sessions']} parties terminées en {resultat['duree_s']:.1f}s")
+    print(f"   ⏱️  Tour (choix -> coup de l'IA -> tour suivant) : "
+          f"moyenne {resultat['latence_moyenne_ms']:.2f} ms | p50 {resultat['latence_p50_ms']:.2f} ms | "
+          f"p99 {resultat['latence_p99_ms']:.2f} ms")
+
+
+def main(argv=None):
+    args = creer_parser().parse_args(argv)
+
+    # Le module de profilage (et le moteur qu'il instrumente) n'est importé que si le profil est demandé
+    trace = None
+    if args.profile or os.environ.get('WIZFIGHT_PROFILE'):
+        from src.game.profilage import trace_demandee
+        trace = trace_demandee(args.profile)
+    if trace is None:
+        executer(args)
+        return
+
+    from src.game.profilage import Profileur
+    # Les mesures sont faites dans ce processus, sur des combats réellement joués
+    if getattr(args, 'workers', 1) > 1:
+        print(f"ℹ️  Profilage: {args.workers} processus ramenés à 1")
+        args.workers = 1
+    if getattr(args, 'no_cache', True) is False:
+        args.no_cache = True
+
+    profileur = Profileur()
+    try:
+        with profileur:
+            executer(args)
+    finally:
+        profileur.afficher()
+        profileur.ecrire_trace(trace)
+        print(f"📈 Trace écrite dans {trace} (chrome://tracing ou ui.perfetto.dev)")
+
+
+def executer(args):
+    """Lance la commande demandée"""
+    if args.commande == 'simulate':
+        commande_simulate(args)
+    elif args.commande == 'solve':
+        commande_solve(args)
+    elif args.commande == 'tune':
+        commande_tune(args)
+    elif args.commande == 'tournament':
+        commande_tournament(args)
+    elif args.commande == 'replay':
+        commande_replay(args)
+    elif args.commande == 'export':
+        commande_export(args)
+    elif args.commande == 'serve':
+        commande_serve(args)
+    elif args.commande == 'connect':
+        commande_connect(args)
+    else:
+        from combat_v2 import start_game
+        start_game(args.ia, args.budget_ms)
 
 
 if __name__ == "__main__":
     try:
-        start_game()
+        main()
     except KeyboardInterrupt:
         print("\n\n⚠️  Bataille interrompue par le joueur.")
         sys.exit(0)
@@ -3,5 +3,7 @@ Package ai - Intelligence artificielle
 """
 
 from src.ai.ai_player import AIPlayer
+from src.ai.mcts import RechercheMCTS
+from src.ai.politiques import POLITIQUES, Politique, politique
 
-__all__ = ['AIPlayer']
+__all__ = ['AIPlayer', 'RechercheMCTS', 'POLITIQUES', 'Politique', 'politique']
@@ -2,26 +2,44 @@
 Module de l'intelligence artificielle
 """
 
-import random
-from typing import Dict, List
+from typing import List, Optional
+
+from src.ai.mcts import BUDGET_MS, RechercheMCTS
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence, TypeSkill
+
+
+# Types d'attaques retenus par une IA qui a du mana (ou agressive)
+_ATTAQUES_MOYENNES = (TypeSkill.ATTAQUE_MOYENNE, TypeSkill.ATTAQUE_LEGERE)
 
 
 class AIPlayer:
     """Intelligence artificielle pour contrôler un personnage"""
     
-    def __init__(self, personnage, difficulte="normal"):
+    def __init__(self, personnage, difficulte="normal", rng: Aleatoire = None,
+                 budget_ms: Optional[float] = BUDGET_MS, agressive: Optional[bool] = None):
         """
         Initialise l'IA
         
         Args:
             personnage: Le personnage contrôlé par l'IA
-            difficulte: Niveau de difficulté ('facile', 'normal', 'difficile')
+            difficulte: Niveau de difficulté ('facile', 'normal', 'difficile', 'expert')
+            rng: Générateur aléatoire (celui du personnage par défaut)
+            budget_ms: Temps de réflexion par coup de l'IA experte (millisecondes)
+            agressive: Impose la stratégie agressive (None pour la tirer au sort)
         """
         self.personnage = personnage
         self.difficulte = difficulte
-        self.strategie_agressive = random.random() > 0.5  # 50% chance d'être agressif
+        self.rng = rng if rng is not None else personnage.rng
+        if agressive is None:
+            self.strategie_agressive = self.rng.chance(0.5)  # 50% chance d'être agressif
+        else:
+            self.strategie_agressive = agressive
+        
+        # L'IA experte cherche avec son propre générateur pour ne pas décaler celui du combat
+        self.recherche = RechercheMCTS(budget_ms) if difficulte == "expert" else None
     
-    def choose_skill(self, available_skills: List[Dict], opponent) -> Dict:
+    def choose_skill(self, available_skills: List[Competence], opponent) -> Competence:
         """
         Choisit une compétence à utiliser en fonction de la situation
         
@@ -32,70 +50,73 @@ class AIPlayer:
         Returns:
             Compétence choisie
         """
+        if self.recherche is not None:
+            return self.recherche.choisir(self.personnage, opponent, available_skills)
+        
         hp_percent = self.personnage.current_hp / self.personnage.hp_max
         current_mp = self.personnage.current_mp
         opponent_hp_percent = opponent.current_hp / opponent.hp_max
         
         # 1ère priorité : Soigner si les PV sont bas
         if hp_percent < 0.3:
-            heal_skills = [s for s in available_skills if s['type'] == 'heal' and s.get('cout_mp', 0) <= current_mp]
+            heal_skills = [s for s in available_skills if s.code_type == TypeSkill.HEAL and s.cout_mp <= current_mp]
             if heal_skills:
-                return random.choice(heal_skills)
+                return self.rng.choix(heal_skills)
         
         # 2nd priorité: Utilise l'attaque ultime si l'adversaire est faible
         if opponent_hp_percent < 0.4 and current_mp > 140:
-            ultimate_skills = [s for s in available_skills if s['type'] == 'attaque_ultime' and s.get('cout_mp', 0) <= current_mp]
+            ultimate_skills = [s for s in available_skills if s.code_type == TypeSkill.ATTAQUE_ULTIME and s.cout_mp <= current_mp]
             if ultimate_skills:
-                return random.choice(ultimate_skills)
+                return self.rng.choix(ultimate_skills)
         
         # 3ème priorité : Buff si pas déjà actif
-        if random.random() < 0.2:  # 20% chance de buff
-            buff_skills = [s for s in available_skills if s['type'] == 'buff' and s.get('cout_mp', 0) <= current_mp]
+        if self.rng.chance(0.2):  # 20% chance de buff
+            buff_skills = [s for s in available_skills if s.code_type == TypeSkill.BUFF and s.cout_mp <= current_mp]
             if buff_skills:
-                return random.choice(buff_skills)
+                return self.rng.choix(buff_skills)
         
         # 4ème priorité : Debuff pour affaiblir l'adversaire
-        if random.random() < 0.15 and opponent_hp_percent > 0.5:
-            debuff_skills = [s for s in available_skills if s['type'] == 'debuff' and s.get('cout_mp', 0) <= current_mp]
+        if self.rng.chance(0.15) and opponent_hp_percent > 0.5:
+            debuff_skills = [s for s in available_skills if s.code_type == TypeSkill.DEBUFF and s.cout_mp <= current_mp]
             if debuff_skills:
-                return random.choice(debuff_skills)
+                return self.rng.choix(debuff_skills)
         
         # 5ème priorité : Évasion si les PV sont critiques
-        if hp_percent < 0.2 and random.random() < 0.3:
-            evasion_skills = [s for s in available_skills if s['type'] == 'evasion' and s.get('cout_mp', 0) <= current_mp]
+        if hp_percent < 0.2 and self.rng.chance(0.3):
+            evasion_skills = [s for s in available_skills if s.code_type == TypeSkill.EVASION and s.cout_mp <= current_mp]
             if evasion_skills:
-                return random.choice(evasion_skills)
+                return self.rng.choix(evasion_skills)
         
         # 6ème priorité : Attaque moyenne ou légère
         if self.strategie_agressive or current_mp > 100:
             # Préfère les attaques moyennes
-            attack_skills = [s for s in available_skills if s['type'] in ['attaque_moyenne', 'attaque_legere'] and s.get('cout_mp', 0) <= current_mp]
+            attack_skills = [s for s in available_skills if s.code_type in _ATTAQUES_MOYENNES and s.cout_mp <= current_mp]
         else:
             # Préfère les attaques légères pour économiser du MP
-            attack_skills = [s for s in available_skills if s['type'] == 'attaque_legere' and s.get('cout_mp', 0) <= current_mp]
+            attack_skills = [s for s in available_skills if s.code_type == TypeSkill.ATTAQUE_LEGERE and s.cout_mp <= current_mp]
         
         if attack_skills:
             # Choisir en fonction de la difficulté
             if self.difficulte == "difficile":
                 # IA difficile choisit la meilleure compétence
-                return max(attack_skills, key=lambda s: s.get('degats_base', 0))
+                return max(attack_skills, key=lambda s: s.degats_base)
             elif self.difficulte == "facile":
                 # IA facile choisit au hasard
-                return random.choice(attack_skills)
+                return self.rng.choix(attack_skills)
             else:
                 # IA normale : 70% meilleure compétence, 30% aléatoire
-                if random.random() < 0.7:
-                    return max(attack_skills, key=lambda s: s.get('degats_base', 0))
+                if self.rng.chance(0.7):
+                    return max(attack_skills, key=lambda s: s.degats_base)
                 else:
-                    return random.choice(attack_skills)
+                    return self.rng.choix(attack_skills)
         
         # Par défaut : première compétence disponible (attaque de base)
-        usable_skills = [s for s in available_skills if s.get('cout_mp', 0) <= current_mp]
+        usable_skills = [s for s in available_skills if s.cout_mp <= current_mp]
         if usable_skills:
             return usable_skills[0]
         elif available_skills:
             # Si aucune compétence n'est utilisable avec le MP actuel, retourner la moins chère
-            return min(available_skills, key=lambda s: s.get('cout_mp', 0))
+            return min(available_skills, key=lambda s: s.cout_mp)
         else:
             # Si aucune compétence n'est disponible, retourner None (ne devrait jamais arriver)
             return None
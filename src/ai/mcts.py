@@ -0,0 +1,244 @@
+"""
+Module de l'IA experte - Recherche arborescente Monte Carlo (MCTS)
+
+La recherche joue des fins de combat sur des copies des deux personnages,
+avec les vraies règles du jeu (cooldowns, régénération de PM, familiers,
+zones, coups critiques). L'arbre est en boucle ouverte : un nœud correspond
+à une suite de compétences jouées, les tirages aléatoires étant refaits à
+chaque itération.
+
+Les évaluations des feuilles sont partagées via une table de transposition:
+une position déjà évaluée assez souvent n'est plus simulée.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional
+
+from src.ai.transposition import TABLE_TRANSPOSITION, TableTransposition
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence
+from src.models.evenements import SINK_NUL
+
+
+# Coup joué quand aucune compétence n'est utilisable
+PASSER = -1
+
+# Budget de réflexion par défaut (millisecondes par coup)
+BUDGET_MS = 300
+
+# Constante d'exploration de UCT
+EXPLORATION = math.sqrt(2)
+
+# Nombre de coups joués au hasard après une feuille avant d'évaluer la position
+HORIZON = 20
+
+# Nombre d'évaluations d'une position au-delà duquel sa moyenne remplace la simulation
+CONFIANCE = 8
+
+
+class Noeud:
+    """Nœud de l'arbre de recherche (statistiques du coup qui y mène)"""
+
+    __slots__ = ('enfants', 'visites', 'valeur')
+
+    def __init__(self):
+        self.enfants: Dict[int, 'Noeud'] = {}
+        self.visites = 0
+        self.valeur = 0.0  # Somme des résultats, du point de vue du joueur qui a joué le coup
+
+
+def _coups_legaux(personnage) -> List[int]:
+    """uids des compétences utilisables (PASSER si aucune)"""
+    coups = [skill.uid for skill in personnage.skills if personnage.can_use_skill(skill)]
+    return coups or [PASSER]
+
+
+def _evaluer(joueur, adversaire) -> float:
+    """Évalue une position non terminale entre 0 (perdue) et 1 (gagnée)"""
+    return 0.5 + 0.5 * (joueur.current_hp / joueur.hp_max - adversaire.current_hp / adversaire.hp_max)
+
+
+class RechercheMCTS:
+    """Recherche MCTS bornée en temps, qui conserve son arbre d'un tour à l'autre"""
+
+    def __init__(self, budget_ms: Optional[float] = BUDGET_MS, iterations_max: Optional[int] = None,
+                 rng: Optional[Aleatoire] = None, exploration: float = EXPLORATION, horizon: int = HORIZON,
+                 table: Optional[TableTransposition] = TABLE_TRANSPOSITION):
+        """
+        Args:
+            budget_ms: Temps de réflexion par coup (None pour ne borner que les itérations)
+            iterations_max: Nombre maximal d'itérations par coup (None pour ne borner que le temps)
+            rng: Générateur des simulations (distinct de celui du combat, qui n'est jamais consommé)
+            exploration: Constante d'exploration de UCT
+            horizon: Coups joués au hasard après une feuille avant d'évaluer la position
+            table: Table de transposition (partagée par défaut, None pour s'en passer)
+        """
+        if budget_ms is None and iterations_max is None:
+            raise ValueError("Il faut un budget en temps ou en itérations")
+        self.budget_ms = budget_ms
+        self.iterations_max = iterations_max
+        self.rng = rng if rng is not None else Aleatoire()
+        self.exploration = exploration
+        self.horizon = horizon
+        self.table = table
+
+        # Arbre conservé entre deux coups
+        self.racine: Optional[Noeud] = None
+        self.__dernier_coup: Optional[int] = None
+        self.__tour_racine = 0
+
+        # Statistiques du dernier coup
+        self.iterations = 0
+        self.arbre_reutilise = False
+
+    def choisir(self, personnage, adversaire, skills_disponibles: List[Competence]) -> Optional[Competence]:
+        """
+        Cherche la meilleure compétence à partir de l'état actuel du combat
+
+        Args:
+            personnage: Personnage qui joue (son début de tour a déjà eu lieu)
+            adversaire: Personnage adverse
+            skills_disponibles: Compétences utilisables ce tour
+
+        Returns:
+            La compétence la plus explorée, ou None si aucune n'est disponible
+        """
+        if not skills_disponibles:
+            return None
+
+        racine = self.__reprendre_arbre(personnage, adversaire)
+
+        # Copies de travail: sans affichage et avec le générateur de la recherche
+        joueurs = (personnage.cloner(), adversaire.cloner())
+        for joueur in joueurs:
+            joueur.sink = SINK_NUL
+            joueur.rng = self.rng
+        etats = tuple(joueur.snapshot() for joueur in joueurs)
+
+        fin = time.perf_counter() + self.budget_ms / 1000 if self.budget_ms is not None else None
+        iterations = 0
+        while True:
+            joueurs[0].restore(etats[0])
+            joueurs[1].restore(etats[1])
+            self.__iterer(racine, joueurs)
+            iterations += 1
+
+            if self.iterations_max is not None and iterations >= self.iterations_max:
+                break
+            if fin is not None and time.perf_counter() >= fin:
+                break
+
+        uids = {skill.uid for skill in skills_disponibles}
+        meilleur = max((uid for uid in racine.enfants if uid in uids),
+                       key=lambda uid: racine.enfants[uid].visites, default=None)
+        skill = personnage.skills[meilleur] if meilleur is not None else skills_disponibles[0]
+
+        self.racine = racine
+        self.__dernier_coup = skill.uid
+        self.__tour_racine = personnage.effets.tour
+        self.iterations = iterations
+        return skill
+
+    def __reprendre_arbre(self, personnage, adversaire) -> Noeud:
+        """Retrouve le sous-arbre correspondant aux coups joués depuis la dernière recherche"""
+        self.arbre_reutilise = False
+        # L'arbre n'est valable que si l'on a joué au tour précédent le coup qu'il prévoyait
+        if self.racine is None or personnage.effets.tour != self.__tour_racine + 1:
+            return Noeud()
+
+        noeud = self.racine.enfants.get(self.__dernier_coup)
+        if noeud is not None:
+            coup_adverse = adversaire.dernier_skill
+            noeud = noeud.enfants.get(PASSER if coup_adverse is None else coup_adverse)
+        if noeud is None:
+            return Noeud()
+
+        self.arbre_reutilise = True
+        return noeud
+
+    def __jouer(self, joueurs, actif: int, coup: int) -> Optional[int]:
+        """
+        Joue un coup puis le début du tour suivant
+
+        Returns:
+            Index du vainqueur si le combat est terminé, None sinon
+        """
+        attaquant, defenseur = joueurs[actif], joueurs[1 - actif]
+        if coup != PASSER:
+            attaquant.use_skill(attaquant.skills[coup], defenseur)
+        if not defenseur.is_alive:
+            return actif
+
+        defenseur.start_turn(attaquant)
+        if not attaquant.is_alive:
+            return 1 - actif
+        return None
+
+    def __iterer(self, racine: Noeud, joueurs):
+        """Une itération: sélection UCT, expansion, simulation aléatoire puis rétropropagation"""
+        noeud = racine
+        chemin = []
+        actif = 0
+        vainqueur = None
+
+        # Sélection puis expansion d'un seul nouveau nœud
+        while vainqueur is None:
+            coups = _coups_legaux(joueurs[actif])
+            nouveaux = [coup for coup in coups if coup not in noeud.enfants]
+            if nouveaux:
+                coup = self.rng.choix(nouveaux)
+                enfant = noeud.enfants[coup] = Noeud()
+            else:
+                log_visites = math.log(noeud.visites)
+                coup = max(coups, key=lambda c: self.__score_uct(noeud.enfants[c], log_visites))
+                enfant = noeud.enfants[coup]
+
+            vainqueur = self.__jouer(joueurs, actif, coup)
+            chemin.append((enfant, actif))
+            noeud = enfant
+            actif = 1 - actif
+            if nouveaux:
+                break
+
+        if vainqueur is None:
+            resultat = self.__evaluer_feuille(joueurs, actif)
+        else:
+            resultat = 1.0 if vainqueur == 0 else 0.0
+
+        # Rétropropagation (résultat vu du joueur qui a joué chaque coup)
+        racine.visites += 1
+        for enfant, joueur in chemin:
+            enfant.visites += 1
+            enfant.valeur += resultat if joueur == 0 else 1.0 - resultat
+
+    def __evaluer_feuille(self, joueurs, actif: int) -> float:
+        """Évalue une feuille (vue du joueur 0) par la table de transposition ou une simulation"""
+        cle = None
+        if self.table is not None:
+            cle = (joueurs[actif].cle_etat(), joueurs[1 - actif].cle_etat())
+            entree = self.table.chercher(cle)
+            if entree is not None and entree[0] >= CONFIANCE:
+                moyenne = entree[1] / entree[0]
+                return moyenne if actif == 0 else 1.0 - moyenne
+
+        # Simulation aléatoire jusqu'à la fin du combat ou l'horizon
+        actif_feuille = actif
+        vainqueur = None
+        profondeur = 0
+        while vainqueur is None and profondeur < self.horizon:
+            vainqueur = self.__jouer(joueurs, actif, self.rng.choix(_coups_legaux(joueurs[actif])))
+            actif = 1 - actif
+            profondeur += 1
+
+        if vainqueur is None:
+            resultat = _evaluer(joueurs[0], joueurs[1])
+        else:
+            resultat = 1.0 if vainqueur == 0 else 0.0
+
+        if cle is not None:
+            self.table.enregistrer(cle, resultat if actif_feuille == 0 else 1.0 - resultat)
+        return resultat
+
+    def __score_uct(self, noeud: Noeud, log_visites_parent: float) -> float:
+        return noeud.valeur / noeud.visites + self.exploration * math.sqrt(log_visites_parent / noeud.visites)
@@ -0,0 +1,77 @@
+"""
+Module des politiques d'IA
+
+Une politique est une recette de construction d'IA identifiée par un nom
+stable: niveau de difficulté, stratégie agressive imposée ou tirée au sort,
+budget de réflexion. Les tournois classent des politiques, pas des classes:
+une nouvelle IA y participe dès que sa politique est enregistrée.
+"""
+
+from typing import Dict, Optional
+
+from src.ai.ai_player import AIPlayer
+from src.ai.mcts import BUDGET_MS
+from src.models.aleatoire import Aleatoire
+
+
+class Politique:
+    """Recette de construction d'une IA"""
+
+    __slots__ = ('nom', 'difficulte', 'agressive', 'budget_ms')
+
+    def __init__(self, nom: str, difficulte: str = 'normal', agressive: Optional[bool] = None,
+                 budget_ms: Optional[float] = BUDGET_MS):
+        """
+        Args:
+            nom: Nom unique de la politique ('normal', 'difficile-agressive', ...)
+            difficulte: Niveau de difficulté de l'IA
+            agressive: Stratégie agressive imposée (None pour la tirer au sort à chaque combat)
+            budget_ms: Temps de réflexion par coup de l'IA experte (millisecondes)
+        """
+        self.nom = nom
+        self.difficulte = difficulte
+        self.agressive = agressive
+        self.budget_ms = budget_ms
+
+    def creer(self, personnage, rng: Optional[Aleatoire] = None) -> AIPlayer:
+        """Construit l'IA qui contrôle un personnage"""
+        return AIPlayer(personnage, self.difficulte, rng, self.budget_ms, agressive=self.agressive)
+
+    @property
+    def description(self) -> str:
+        """Description complète et stable (deux politiques de même description jouent pareil)"""
+        budget = self.budget_ms if self.difficulte == 'expert' else None
+        return f"{self.nom}:{self.difficulte}:{self.agressive}:{budget}"
+
+    def __repr__(self):
+        return f"Politique({self.description})"
+
+
+# Politiques connues, par nom
+POLITIQUES: Dict[str, Politique] = {}
+
+
+def enregistrer_politique(politique: Politique) -> Politique:
+    """Ajoute (ou remplace) une politique dans le registre et la retourne"""
+    POLITIQUES[politique.nom] = politique
+    return politique
+
+
+def politique(nom: str) -> Politique:
+    """
+    Retourne une politique enregistrée
+
+    Raises:
+        ValueError: Si aucune politique ne porte ce nom
+    """
+    try:
+        return POLITIQUES[nom]
+    except KeyError:
+        raise ValueError(f"Politique inconnue : {nom} (connues : {', '.join(POLITIQUES)})") from None
+
+
+for _difficulte in ('facile', 'normal', 'difficile'):
+    enregistrer_politique(Politique(_difficulte, _difficulte))
+    enregistrer_politique(Politique(f'{_difficulte}-agressive', _difficulte, agressive=True))
+    enregistrer_politique(Politique(f'{_difficulte}-prudente', _difficulte, agressive=False))
+enregistrer_politique(Politique('expert', 'expert'))
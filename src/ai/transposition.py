@@ -0,0 +1,109 @@
+"""
+Module de la table de transposition des IA de recherche
+
+Une même position (PV, PM, cooldowns, effets, familiers, zones) est souvent
+atteinte par des suites de compétences différentes. La table garde
+l'évaluation des positions déjà rencontrées, d'un coup à l'autre et d'un
+combat à l'autre dans le même processus, avec une éviction LRU pour borner
+la mémoire.
+
+Seul le hash 64 bits de la clé canonique est stocké: une entrée coûte
+quelques centaines d'octets au lieu de la clé complète, pour un risque de
+collision négligeable à cette taille de table.
+
+La table est partagée entre threads (IA expertes du serveur de jeu): un
+verrou rend chaque recherche et chaque enregistrement atomique, sans quoi
+une éviction entre la lecture d'une entrée et son déplacement en fin de
+file ferait échouer la recherche.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional
+
+
+# Nombre de positions gardées par défaut
+CAPACITE = 200_000
+
+
+class TableTransposition:
+    """Table LRU bornée: position -> [évaluations, somme des résultats]"""
+
+    __slots__ = ('capacite', 'succes', 'echecs', 'evictions', '__entrees', '__verrou')
+
+    def __init__(self, capacite: int = CAPACITE):
+        """
+        Args:
+            capacite: Nombre maximal de positions gardées
+        """
+        self.capacite = capacite
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.__entrees: 'OrderedDict[int, List[float]]' = OrderedDict()
+        self.__verrou = threading.Lock()
+
+    def chercher(self, cle: Hashable) -> Optional[List[float]]:
+        """
+        Retourne l'entrée [évaluations, somme des résultats] d'une position
+
+        Args:
+            cle: Clé canonique de la position, vue du joueur qui doit jouer (voir Combat.cle_etat)
+
+        Returns:
+            L'entrée (modifiable) ou None si la position est inconnue
+        """
+        empreinte = hash(cle)
+        with self.__verrou:
+            entree = self.__entrees.get(empreinte)
+            if entree is None:
+                self.echecs += 1
+                return None
+            self.succes += 1
+            self.__entrees.move_to_end(empreinte)
+            return entree
+
+    def enregistrer(self, cle: Hashable, resultat: float):
+        """Ajoute une évaluation d'une position (résultat entre 0 et 1)"""
+        empreinte = hash(cle)
+        with self.__verrou:
+            entree = self.__entrees.get(empreinte)
+            if entree is not None:
+                entree[0] += 1
+                entree[1] += resultat
+                self.__entrees.move_to_end(empreinte)
+                return
+
+            self.__entrees[empreinte] = [1, resultat]
+            if len(self.__entrees) > self.capacite:
+                self.__entrees.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def taux_succes(self) -> float:
+        recherches = self.succes + self.echecs
+        return self.succes / recherches if recherches else 0.0
+
+    def statistiques(self) -> Dict:
+        """Compteurs de la table (succès, échecs, évictions, taille)"""
+        return {
+            'positions': len(self.__entrees),
+            'capacite': self.capacite,
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'evictions': self.evictions,
+            'taux_succes': self.taux_succes
+        }
+
+    def vider(self):
+        """Oublie toutes les positions et remet les compteurs à zéro"""
+        with self.__verrou:
+            self.__entrees.clear()
+            self.succes = self.echecs = self.evictions = 0
+
+    def __len__(self):
+        return len(self.__entrees)
+
+
+# Table partagée par toutes les IA du processus
+TABLE_TRANSPOSITION = TableTransposition()
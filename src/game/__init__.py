@@ -2,9 +2,33 @@
 # -*- coding: utf-8 -*-
 """
 Package game - Gestion du jeu
+
+Les noms exportés sont importés à leur premier accès: importer un module
+du package (src.game.simulation par exemple) ne charge pas les autres
+(sauvegardes et SQLite, modes de jeu).
 """
 
-from src.game.game_manager import GameManager, GameMode
-from src.game.save_manager import SaveManager
+import importlib
+
+# Nom exporté -> module qui le définit
+_EXPORTS = {
+    'GameManager': 'src.game.game_manager',
+    'GameMode': 'src.game.game_manager',
+    'SaveManager': 'src.game.save_manager',
+    'Combat': 'src.game.simulation',
+    'simulate_battle': 'src.game.simulation'
+}
+
+__all__ = ['GameManager', 'GameMode', 'SaveManager', 'Combat', 'simulate_battle']
+
+
+def __getattr__(nom):
+    if nom not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(importlib.import_module(_EXPORTS[nom]), nom)
+    globals()[nom] = valeur
+    return valeur
+
 
-__all__ = ['GameManager', 'GameMode', 'SaveManager']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
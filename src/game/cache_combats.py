@@ -0,0 +1,197 @@
+"""
+Module du cache de combats - Résultats des combats headless sur disque
+
+Un combat seedé est entièrement déterminé par les configs des deux classes,
+la version du moteur, les IA, la graine et la limite de tours: son résultat
+est gardé dans une base SQLite sous le hash de ces éléments. Relancer une
+simulation après un changement sans rapport ne rejoue que les combats dont
+la clé a changé.
+
+Les recherches se font par lots (une requête pour des centaines de clés) et
+plusieurs processus peuvent lire et écrire en même temps (journal WAL). Le
+nombre d'entrées est borné: au-delà, les combats les moins récemment lus
+sont évincés.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Dict, Optional, Sequence, Tuple
+
+from src.game.simulation import VERSION_MOTEUR
+from src.models.registre import REGISTRE
+
+
+# Fichier du cache par défaut (relatif au répertoire courant)
+CHEMIN_CACHE = os.path.join('.cache', 'combats.sqlite')
+
+# Nombre de combats gardés par défaut
+TAILLE_MAX = 1_000_000
+
+# Une éviction ramène le cache à cette fraction de sa taille maximale (évite d'évincer à chaque lot)
+_REMPLISSAGE_APRES_EVICTION = 0.9
+
+# Clés par requête (sous la limite de paramètres de SQLite)
+_CLES_PAR_REQUETE = 500
+
+# Attente maximale d'un verrou tenu par un autre processus (secondes)
+_ATTENTE_VERROU = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS combats (cle BLOB PRIMARY KEY, resultat BLOB NOT NULL, acces INTEGER NOT NULL)
+    WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS combats_acces ON combats (acces);
+CREATE TABLE IF NOT EXISTS meta (nom TEXT PRIMARY KEY, valeur INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES ('entrees', 0);
+"""
+
+
+def cle_combat(class_a: str, class_b: str, seed: int, ias: Tuple[str, str], tours_max: int) -> bytes:
+    """
+    Clé d'un combat seedé (hash de tout ce qui détermine son résultat)
+
+    Args:
+        class_a: Classe du joueur 1
+        class_b: Classe du joueur 2
+        seed: Graine du combat
+        ias: Identifiants des IA des joueurs 1 et 2 (difficulté ou description de politique)
+        tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+    """
+    contenu = '|'.join([
+        str(VERSION_MOTEUR), class_a, REGISTRE.definition(class_a).empreinte,
+        class_b, REGISTRE.definition(class_b).empreinte, *ias, str(tours_max), str(seed)
+    ])
+    return hashlib.sha256(contenu.encode('utf-8')).digest()[:16]
+
+
+class CacheCombats:
+    """Résultats de combats sur disque (SQLite), partageable entre processus"""
+
+    __slots__ = ('chemin', 'taille_max', 'succes', 'echecs', 'evictions', '__connexion')
+
+    def __init__(self, chemin: str = CHEMIN_CACHE, taille_max: int = TAILLE_MAX):
+        """
+        Args:
+            chemin: Fichier de la base (créé au premier accès, avec son répertoire)
+            taille_max: Nombre maximal de combats gardés
+        """
+        self.chemin = chemin
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.__connexion: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self):
+        # Envoyé aux workers sans sa connexion: chacun ouvre la sienne au premier accès
+        return self.chemin, self.taille_max
+
+    def __setstate__(self, etat):
+        self.__init__(*etat)
+
+    @property
+    def connexion(self) -> sqlite3.Connection:
+        if self.__connexion is None:
+            dossier = os.path.dirname(self.chemin)
+            if dossier:
+                os.makedirs(dossier, exist_ok=True)
+            connexion = sqlite3.connect(self.chemin, timeout=_ATTENTE_VERROU, isolation_level=None)
+            connexion.execute('PRAGMA journal_mode=WAL')
+            connexion.execute('PRAGMA synchronous=NORMAL')
+            connexion.executescript(_SCHEMA)
+            self.__connexion = connexion
+        return self.__connexion
+
+    def chercher(self, cles: Sequence[bytes]) -> Dict[bytes, Dict]:
+        """
+        Cherche un lot de combats
+
+        Args:
+            cles: Clés des combats (voir cle_combat)
+
+        Returns:
+            Les résultats trouvés, par clé (les clés absentes sont des échecs)
+        """
+        connexion = self.connexion
+        trouves = {}
+        for debut in range(0, len(cles), _CLES_PAR_REQUETE):
+            lot = cles[debut:debut + _CLES_PAR_REQUETE]
+            marques = ','.join('?' * len(lot))
+            for cle, resultat in connexion.execute(f'SELECT cle, resultat FROM combats WHERE cle IN ({marques})', lot):
+                trouves[cle] = json.loads(zlib.decompress(resultat))
+
+        if trouves:
+            # Les combats lus redeviennent les plus récents (éviction LRU)
+            maintenant = time.time_ns()
+            connexion.execute('BEGIN IMMEDIATE')
+            try:
+                connexion.executemany('UPDATE combats SET acces = ? WHERE cle = ?',
+                                      ((maintenant, cle) for cle in trouves))
+                connexion.execute('COMMIT')
+            except BaseException:
+                connexion.execute('ROLLBACK')
+                raise
+
+        self.succes += len(trouves)
+        self.echecs += len(cles) - len(trouves)
+        return trouves
+
+    def enregistrer(self, resultats: Dict[bytes, Dict]):
+        """Ajoute des combats au cache (un combat déjà présent est ignoré), puis évince si besoin"""
+        if not resultats:
+            return
+        connexion = self.connexion
+        maintenant = time.time_ns()
+        lignes = [
+            (cle, zlib.compress(json.dumps(resultat, separators=(',', ':')).encode('utf-8'), 1), maintenant)
+            for cle, resultat in resultats.items()
+        ]
+
+        connexion.execute('BEGIN IMMEDIATE')
+        try:
+            avant = connexion.total_changes
+            connexion.executemany('INSERT OR IGNORE INTO combats VALUES (?, ?, ?)', lignes)
+            ajouts = connexion.total_changes - avant
+            connexion.execute("UPDATE meta SET valeur = valeur + ? WHERE nom = 'entrees'", (ajouts,))
+            entrees = connexion.execute("SELECT valeur FROM meta WHERE nom = 'entrees'").fetchone()[0]
+            if entrees > self.taille_max:
+                avant = connexion.total_changes
+                connexion.execute('DELETE FROM combats WHERE cle IN (SELECT cle FROM combats ORDER BY acces LIMIT ?)',
+                                  (entrees - int(self.taille_max * _REMPLISSAGE_APRES_EVICTION),))
+                evinces = connexion.total_changes - avant
+                connexion.execute("UPDATE meta SET valeur = valeur - ? WHERE nom = 'entrees'", (evinces,))
+                self.evictions += evinces
+            connexion.execute('COMMIT')
+        except BaseException:
+            connexion.execute('ROLLBACK')
+            raise
+
+    def vider(self):
+        """Oublie tous les combats"""
+        connexion = self.connexion
+        connexion.execute('BEGIN IMMEDIATE')
+        connexion.execute('DELETE FROM combats')
+        connexion.execute("UPDATE meta SET valeur = 0 WHERE nom = 'entrees'")
+        connexion.execute('COMMIT')
+
+    def fermer(self):
+        """Ferme la connexion (rouverte au prochain accès)"""
+        if self.__connexion is not None:
+            self.__connexion.close()
+            self.__connexion = None
+
+    def statistiques(self) -> Dict:
+        """Compteurs du cache (taille, succès, échecs, évictions)"""
+        return {
+            'combats': len(self),
+            'taille_max': self.taille_max,
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'evictions': self.evictions
+        }
+
+    def __len__(self):
+        return self.connexion.execute("SELECT valeur FROM meta WHERE nom = 'entrees'").fetchone()[0]
@@ -0,0 +1,391 @@
+"""
+Module du client de jeu - Jouer sur un serveur WiZ-Fight, ou le tester
+
+Le client terminal affiche les messages du serveur comme le jeu local
+(état du tour, menu des compétences) et envoie les choix du joueur. Le
+client automatique joue seul (une compétence disponible tirée au hasard)
+et mesure le temps de réponse du serveur: lancé en centaines
+d'exemplaires, il vérifie la tenue en charge d'un serveur local.
+
+En PvP, le client tient une réplique du combat (src.game.pvp): le
+serveur n'envoie que les coups joués, que la réplique applique et affiche
+comme une partie locale. Une connexion perdue est reprise avec le jeton
+de la partie.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.game.protocole import PORT, Canal, ConnexionFermee, ErreurProtocole
+from src.game.pvp import empreinte_tour, jouer_coup, repliquer
+from src.game.simulation import Combat
+from src.models.competence import Competence
+from src.models.evenements import SINK_NUL, SinkTerminal
+
+
+# Tentatives de reconnexion à une partie PvP après une coupure
+RECONNEXIONS = 5
+
+# Attente entre deux tentatives de reconnexion (secondes)
+DELAI_RECONNEXION = 1.0
+
+
+async def _saisir(invite: str) -> str:
+    # input() bloque: il attend dans un thread pour que la connexion reste servie
+    return await asyncio.to_thread(input, invite)
+
+
+def _afficher_tour(message: Dict):
+    """Affiche l'état du tour et le menu des compétences (comme InputHandler)"""
+    print(f"\n{'='*70}")
+    print(f"🎮 C'EST VOTRE TOUR - {message['joueur']['nom']} (tour {message['tour']})")
+    print(f"{'='*70}")
+    for titre, etat in (("VOS STATS", message['joueur']), ("ADVERSAIRE", message['adversaire'])):
+        print(f"\n📊 {titre} :")
+        print(f"   ❤️  HP: {etat['hp']}/{etat['hp_max']}")
+        print(f"   💙 PM: {etat['mp']}/{etat['mp_max']}")
+        print(f"   ⚔️  ATQ: {etat['attaque']} | 🛡️  DEF: {etat['defense']}")
+        if etat['buffs']:
+            print(f"   🔺 Buffs: {', '.join(etat['buffs'])}")
+        if etat['debuffs']:
+            print(f"   🔻 Debuffs: {', '.join(etat['debuffs'])}")
+
+    print(f"\n⚔️  COMPÉTENCES DISPONIBLES :")
+    print(f"{'='*70}")
+    for i, competence in enumerate(message['competences'], 1):
+        print(f"\n┌─ {i}. {competence['icone']} {competence['nom']}")
+        print(f"│  💙 Coût: {competence['cout_mp']} MP")
+        print(f"└─ {competence['statut']}")
+    print(f"\n{'='*70}")
+
+
+async def _repondre(canal: Canal, demande: Dict, afficher: bool):
+    """Demande au joueur sa réponse à une question ou son coup du tour"""
+    if demande['type'] == 'question':
+        choix = demande.get('choix')
+        invite = demande['texte'] + (f" ({' / '.join(choix)})" if choix else "") + " : "
+        canal.envoyer('reponse', valeur=await _saisir(invite))
+        return
+
+    if afficher:
+        _afficher_tour(demande)
+    competences = demande['competences']
+    saisie = (await _saisir(f"\nChoisissez une compétence (1-{len(competences)}): ")).strip()
+    index = int(saisie) - 1 if saisie.isdigit() else -1
+    # Un choix hors liste est envoyé tel quel: le serveur le refuse et le tour est redemandé
+    uid = competences[index]['id'] if 0 <= index < len(competences) else -1
+    canal.envoyer('skill', skill=uid, tour=demande['tour'])
+
+
+async def jouer_terminal(hote: str = '127.0.0.1', port: int = PORT):
+    """Joue une partie PvE en ligne depuis le terminal"""
+    canal = await Canal.ouvrir(hote, port)
+    demande: Optional[Dict] = None  # Dernière question ou dernier tour, redemandé après une erreur
+    try:
+        while True:
+            message = await canal.recevoir()
+            type_message = message['type']
+
+            if type_message == 'question' and message['champ'] == 'mode':
+                canal.envoyer('reponse', valeur='pve')  # Le PvP a son propre client (jouer_pvp_terminal)
+            elif type_message in ('question', 'tour'):
+                demande = message
+                await _repondre(canal, demande, afficher=True)
+            elif type_message == 'erreur':
+                print(message['texte'])
+                if demande is not None:
+                    await _repondre(canal, demande, afficher=False)
+            elif type_message in ('texte', 'complet', 'inactivite'):
+                print(message['texte'])
+            elif type_message == 'bienvenue':
+                print(f"\n🌐 Connecté ({message['sessions']}/{message['sessions_max']} sessions, "
+                      f"IA {message['difficulte']})")
+            elif type_message == 'debut':
+                print(f"\n🎲 Seed du combat : {message['seed']}")
+                print(f"🤖 Adversaire : {message['adversaire']['nom']} ({message['adversaire']['classe']})")
+            elif type_message == 'fin':
+                vainqueur = message['vainqueur']
+                print(f"\n🏆 {vainqueur} gagne en {message['tours']} tours !" if vainqueur
+                      else f"\n🤝 Match nul après {message['tours']} tours")
+    except (ConnexionFermee, EOFError):
+        pass  # Serveur parti, ou fin de l'entrée du joueur (Ctrl+D)
+    finally:
+        await canal.fermer()
+
+
+async def jouer_automatique(hote: str = '127.0.0.1', port: int = PORT, nom: str = 'Bot',
+                            classe: Optional[str] = None, seed: Optional[int] = None) -> Dict:
+    """
+    Joue une partie sans intervention et mesure les temps de réponse du serveur
+
+    Args:
+        hote: Adresse du serveur
+        port: Port du serveur
+        nom: Nom du joueur
+        classe: Classe jouée (tirée au hasard si None)
+        seed: Graine des choix du client
+
+    Returns:
+        {'resultat': message 'fin' (None si la session a été refusée ou coupée), 'latences_ms': [...]}
+    """
+    rng = random.Random(seed)
+    canal = await Canal.ouvrir(hote, port)
+    latences: List[float] = []
+    envoi = None
+    resultat = None
+    try:
+        while True:
+            message = await canal.recevoir()
+            type_message = message['type']
+            if type_message == 'question':
+                if message['champ'] == 'mode':
+                    valeur = 'pve'
+                else:
+                    valeur = nom if message['champ'] == 'nom' else (classe or rng.choice(message['choix']))
+                canal.envoyer('reponse', valeur=valeur)
+            elif type_message == 'tour':
+                if envoi is not None:
+                    # Aller-retour complet: choix envoyé -> coup de l'IA -> tour suivant du joueur
+                    latences.append((time.perf_counter() - envoi) * 1000)
+                disponibles = [c['id'] for c in message['competences'] if c['disponible']]
+                envoi = time.perf_counter()
+                canal.envoyer('skill', skill=rng.choice(disponibles), tour=message['tour'])
+            elif type_message == 'fin':
+                resultat = message
+            elif type_message in ('complet', 'inactivite'):
+                break
+    except ConnexionFermee:
+        pass
+    finally:
+        await canal.fermer()
+    return {'resultat': resultat, 'latences_ms': latences}
+
+
+class ClientPvP:
+    """Joueur d'une partie PvP: réplique locale du combat, reprise après coupure"""
+
+    def __init__(self, nom: str, classe: str, choisir: Callable[[Combat, List[Competence]], Awaitable[Competence]],
+                 hote: str = '127.0.0.1', port: int = PORT, afficher: bool = False, jeton: Optional[str] = None):
+        """
+        Args:
+            nom: Nom du joueur
+            classe: Classe choisie
+            choisir: Coroutine (réplique du combat, compétences utilisables) -> compétence jouée
+            hote: Adresse du serveur
+            port: Port du serveur
+            afficher: Affiche le combat et les messages du serveur dans le terminal
+            jeton: Jeton d'une partie en cours à reprendre
+        """
+        self.nom = nom
+        self.classe = classe
+        self.choisir = choisir
+        self.hote = hote
+        self.port = port
+        self.afficher = afficher
+        self.jeton = jeton
+
+        self.canal: Optional[Canal] = None
+        self.combat: Optional[Combat] = None
+        self.index = -1
+        self.resultat: Optional[Dict] = None
+        self.latences_ms: List[float] = []
+        self.reprises = 0
+        self.__envoi: Optional[float] = None
+
+    def __dire(self, texte: str):
+        if self.afficher:
+            print(texte)
+
+    async def jouer(self) -> Optional[Dict]:
+        """
+        Joue la partie jusqu'à sa fin, en se reconnectant après une coupure
+
+        Returns:
+            Message 'fin' de la partie (None si elle n'a pas pu être jouée ou reprise)
+        """
+        while self.resultat is None:
+            try:
+                self.canal = await Canal.ouvrir(self.hote, self.port)
+            except OSError:
+                if not await self.__attendre_reprise():
+                    break
+                continue
+            try:
+                if not await self.__suivre():
+                    break
+            except ConnexionFermee:
+                if self.resultat is None and not await self.__attendre_reprise():
+                    break
+            finally:
+                await self.canal.fermer()
+        return self.resultat
+
+    async def __attendre_reprise(self) -> bool:
+        """Prépare une nouvelle tentative de connexion (False si la partie est perdue pour ce client)"""
+        if self.jeton is None or self.reprises >= RECONNEXIONS:
+            return False
+        self.reprises += 1
+        self.__dire(f"\n🔌 Connexion perdue, reprise de la partie ({self.reprises}/{RECONNEXIONS})...")
+        await asyncio.sleep(DELAI_RECONNEXION)
+        return True
+
+    async def __suivre(self) -> bool:
+        """Suit une connexion jusqu'à la fin de la partie (False si le serveur refuse le joueur)"""
+        canal = self.canal
+        while True:
+            message = await canal.recevoir()
+            type_message = message['type']
+
+            if type_message == 'coup':
+                self.__appliquer(message)
+                await self.__tour_suivant()
+            elif type_message == 'partie':
+                self.jeton, self.index = message['jeton'], message['index']
+                self.combat = repliquer(message, SinkTerminal() if self.afficher else SINK_NUL)
+                adversaire = message['joueurs'][1 - self.index]
+                self.__dire(f"\n⚔️  {self.combat.joueurs[self.index].nom} VS {adversaire['nom']} "
+                            f"({adversaire['classe']}) - seed {message['seed']}, jeton de reprise {self.jeton}")
+                await self.__tour_suivant()
+            elif type_message == 'question':
+                if message['champ'] == 'mode' and self.jeton is not None:
+                    canal.envoyer('reprise', jeton=self.jeton)
+                else:
+                    valeurs = {'mode': 'pvp', 'nom': self.nom, 'classe': self.classe}
+                    canal.envoyer('reponse', valeur=valeurs[message['champ']])
+            elif type_message == 'erreur':
+                self.__dire(message['texte'])
+                combat = self.combat
+                if combat is not None and message.get('tour') == combat.tour and combat.index_actif == self.index:
+                    await self.__choisir([s for s in combat.attaquant.skills if combat.attaquant.can_use_skill(s)])
+            elif type_message == 'adversaire':
+                self.__dire("\n✅ L'adversaire est de retour" if message['connecte']
+                            else "\n🔌 L'adversaire s'est déconnecté, il a jusqu'à son tour pour revenir")
+            elif type_message == 'fin':
+                self.resultat = message
+                return True
+            elif type_message in ('attente', 'texte'):
+                self.__dire(message['texte'])
+            elif type_message in ('complet', 'inactivite', 'introuvable'):
+                self.__dire(message['texte'])
+                return False
+
+    def __appliquer(self, message: Dict):
+        """
+        Applique à la réplique un coup annoncé par le serveur
+
+        Raises:
+            ErreurProtocole: Si le coup ne suit pas la réplique ou si elle a divergé du serveur
+        """
+        combat = self.combat
+        if message['tour'] != combat.tour:
+            raise ErreurProtocole(f"Coup du tour {message['tour']} reçu au tour {combat.tour}")
+        if self.__envoi is not None:
+            self.latences_ms.append((time.perf_counter() - self.__envoi) * 1000)
+            self.__envoi = None
+        jouer_coup(combat, message['skill'])
+        if empreinte_tour(combat) != message['controle']:
+            raise ErreurProtocole(f"Réplique du combat désynchronisée au tour {message['tour']}")
+
+    async def __tour_suivant(self):
+        """Démarre le tour suivant sur la réplique, et le joue si c'est au tour de ce joueur"""
+        combat = self.combat
+        if combat.termine:
+            return
+        skills = combat.debut_tour()
+        if combat.index_actif != self.index:
+            return
+        if skills:
+            await self.__choisir(skills)
+        elif combat.defenseur.is_alive:
+            self.__dire(f"\n⚠️  {combat.attaquant.nom} n'a plus de PM pour utiliser ses compétences!")
+
+    async def __choisir(self, skills: List[Competence]):
+        skill = await self.choisir(self.combat, skills)
+        self.__envoi = time.perf_counter()
+        self.canal.envoyer('skill', skill=skill.uid, tour=self.combat.tour)
+
+
+async def jouer_pvp_terminal(nom: str, classe: str, hote: str = '127.0.0.1', port: int = PORT,
+                             jeton: Optional[str] = None):
+    """Joue une partie PvP depuis le terminal (le menu des compétences est celui du jeu local)"""
+    from src.utils.input_handler import InputHandler
+
+    async def choisir(combat: Combat, skills: List[Competence]) -> Competence:
+        return await asyncio.to_thread(InputHandler.choose_skill, combat.attaquant, combat.defenseur)
+
+    client = ClientPvP(nom, classe, choisir, hote, port, afficher=True, jeton=jeton)
+    try:
+        resultat = await client.jouer()
+    except EOFError:
+        return  # Fin de l'entrée du joueur (Ctrl+D): la partie se termine par abandon
+    if resultat is None:
+        print("\n❌ Partie interrompue" + (f" (jeton de reprise : {client.jeton})" if client.jeton else ""))
+    elif resultat['abandon']:
+        print(f"\n🏳️  {resultat['vainqueur']} gagne par abandon après {resultat['tours']} tours")
+    else:
+        vainqueur = resultat['vainqueur']
+        print(f"\n🏆 {vainqueur} gagne en {resultat['tours']} tours !" if vainqueur
+              else f"\n🤝 Match nul après {resultat['tours']} tours")
+
+
+def _percentile(valeurs: List[float], p: float) -> float:
+    """Percentile d'une liste triée (0 si elle est vide)"""
+    return valeurs[min(len(valeurs) - 1, int(p / 100 * len(valeurs)))] if valeurs else 0.0
+
+
+async def charge_pvp(paires: int, hote: str = '127.0.0.1', port: int = PORT, seed: int = 0) -> Dict:
+    """
+    Lance des parties PvP simultanées entre joueurs automatiques
+
+    Returns:
+        Parties terminées, durée totale et aller-retour moyen/p50/p99 d'un coup (ms)
+    """
+    def choix_aleatoire(rng: random.Random):
+        async def choisir(combat: Combat, skills: List[Competence]) -> Competence:
+            return rng.choice(skills)
+        return choisir
+
+    clients = [ClientPvP(f'Bot-{i}', ('sage', 'magicien')[i % 2], choix_aleatoire(random.Random(seed + i)),
+                         hote, port) for i in range(2 * paires)]
+    debut = time.perf_counter()
+    resultats = await asyncio.gather(*(client.jouer() for client in clients))
+    duree = time.perf_counter() - debut
+
+    latences = sorted(latence for client in clients for latence in client.latences_ms)
+    return {
+        'joueurs': len(clients),
+        'terminees': sum(resultat is not None for resultat in resultats),
+        'duree_s': duree,
+        'coups': len(latences),
+        'latence_moyenne_ms': statistics.fmean(latences) if latences else 0.0,
+        'latence_p50_ms': _percentile(latences, 50),
+        'latence_p99_ms': _percentile(latences, 99)
+    }
+
+
+async def charge_pve(sessions: int, hote: str = '127.0.0.1', port: int = PORT, seed: int = 0) -> Dict:
+    """
+    Lance des sessions automatiques simultanées contre un serveur
+
+    Returns:
+        Parties terminées, durée totale et latences moyenne/p50/p99 d'un tour (ms)
+    """
+    debut = time.perf_counter()
+    parties = await asyncio.gather(*(
+        jouer_automatique(hote, port, nom=f'Bot-{i}', seed=seed + i) for i in range(sessions)
+    ))
+    duree = time.perf_counter() - debut
+
+    latences = sorted(latence for partie in parties for latence in partie['latences_ms'])
+    return {
+        'sessions': sessions,
+        'terminees': sum(partie['resultat'] is not None for partie in parties),
+        'duree_s': duree,
+        'tours': len(latences),
+        'latence_moyenne_ms': statistics.fmean(latences) if latences else 0.0,
+        'latence_p50_ms': _percentile(latences, 50),
+        'latence_p99_ms': _percentile(latences, 99)
+    }
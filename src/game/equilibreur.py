@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module d'équilibrage automatique - Recherche de paramètres de skills par simulation
+
+L'équilibreur ajuste les valeurs numériques des skills (dégâts, coût en PM,
+cooldown, soin, valeur des effets) pour approcher un taux de victoire cible
+et une durée de combat comprise dans une fourchette de tours.
+
+Chaque génération tire des candidats autour du meilleur réglage connu puis
+les départage par élimination successive (successive halving) : tous les
+survivants jouent les mêmes graines, ceux dont l'intervalle de confiance
+est hors course sont éliminés, la moitié la moins bonne aussi, et les
+suivants rejouent deux fois plus de combats. La recherche s'arrête dès que
+la cible est atteinte avec confiance.
+
+Le pool de processus est créé une seule fois pour toute la recherche ; les
+workers ne reçoivent que les réglages (index de paramètre, valeur) et
+gardent en cache les configurations déjà compilées.
+"""
+
+import copy
+import math
+import os
+import random
+import time
+from collections import OrderedDict
+from multiprocessing import Pool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.game.monte_carlo import MOTEURS, RapportSimulation, _initialiser_worker
+from src.game.simulation import CLASSES, TOURS_MAX, simulate_battle
+from src.models.registre import REGISTRE, DefinitionPersonnage
+
+
+# Clés numériques des skills que l'équilibreur peut modifier
+CLES_AJUSTABLES = ('degats', 'cout_mp', 'cooldown', 'heal')
+
+# Quantile de la loi normale des intervalles de confiance (95%)
+Z_CONFIANCE = 1.96
+
+# Taille maximale d'un lot de combats envoyé à un worker
+TAILLE_LOT = 500
+
+# Nombre de configurations compilées gardées par worker
+CACHE_DEFINITIONS = 256
+
+# Réglage d'un candidat: couples (index du paramètre, valeur) triés
+Reglages = Tuple[Tuple[int, int], ...]
+
+
+class Parametre:
+    """Valeur numérique d'un skill que l'équilibreur peut modifier, avec ses bornes"""
+
+    __slots__ = ('classe', 'index_skill', 'skill', 'chemin', 'base', 'minimum', 'maximum')
+
+    def __init__(self, classe: str, index_skill: int, skill: str, chemin: Tuple, base: int,
+                 minimum: int, maximum: int):
+        self.classe = classe
+        self.index_skill = index_skill
+        self.skill = skill  # Identifiant du skill
+        self.chemin = chemin  # Clés menant à la valeur dans la définition du skill
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @property
+    def nom(self) -> str:
+        return f"{self.classe}/{self.skill}/{'.'.join(map(str, self.chemin))}"
+
+    @property
+    def pointeur(self) -> str:
+        """Pointeur JSON (RFC 6901) de la valeur dans le fichier de configuration"""
+        return '/skills/' + '/'.join(map(str, (self.index_skill,) + self.chemin))
+
+    def __repr__(self):
+        return f"Parametre({self.nom}={self.base}, [{self.minimum}, {self.maximum}])"
+
+
+def _bornes(cle: str, base: int) -> Tuple[int, int]:
+    """Bornes de recherche d'une valeur: du quart au quadruple, en gardant son signe"""
+    if cle == 'cooldown':
+        return 0, max(2 * base, base + 3)
+    if base < 0:
+        return 4 * base, min(-1, round(base / 4))
+    return max(1, round(base / 4)), max(4 * base, base + 4)
+
+
+def parametres_ajustables(classes: Sequence[str], cles: Sequence[str] = CLES_AJUSTABLES,
+                          effets: bool = True) -> List[Parametre]:
+    """
+    Liste les valeurs numériques modifiables des skills de plusieurs classes
+
+    Args:
+        classes: Identifiants des classes ('sage', 'magicien', ...)
+        cles: Clés des skills à ajuster
+        effets: Ajuste aussi la valeur des buffs/debuffs
+
+    Returns:
+        Les paramètres, avec la valeur actuelle de la config pour base
+    """
+    parametres = []
+    for classe in dict.fromkeys(classes):
+        for index_skill, skill in enumerate(REGISTRE.definition(classe).data['skills']):
+            skill_id = skill.get('id', skill['nom'])
+            valeurs = [((cle,), skill[cle]) for cle in cles if cle in skill]
+            if effets:
+                valeurs += [(('effets', i, 'valeur'), effet['valeur'])
+                            for i, effet in enumerate(skill.get('effets', ()))]
+
+            for chemin, base in valeurs:
+                if not isinstance(base, int) or isinstance(base, bool) or (base == 0 and chemin[-1] != 'cooldown'):
+                    continue
+                minimum, maximum = _bornes(chemin[-1], base)
+                parametres.append(Parametre(classe, index_skill, skill_id, chemin, base, minimum, maximum))
+    return parametres
+
+
+def appliquer_reglages(data: Dict, parametres: Sequence[Parametre], reglages: Reglages) -> Dict:
+    """
+    Retourne une copie d'une configuration de classe avec les réglages qui la concernent
+
+    Args:
+        data: Configuration JSON d'origine (non modifiée)
+        parametres: Paramètres auxquels se réfèrent les index des réglages
+        reglages: Couples (index du paramètre, valeur)
+    """
+    data = copy.deepcopy(data)
+    for index, valeur in reglages:
+        parametre = parametres[index]
+        cible = data['skills'][parametre.index_skill]
+        for cle in parametre.chemin[:-1]:
+            cible = cible[cle]
+        cible[parametre.chemin[-1]] = valeur
+    return data
+
+
+# État des workers: paramètres de la recherche et configurations compilées
+_parametres: List[Parametre] = []
+_definitions: 'OrderedDict[Tuple[str, Reglages], DefinitionPersonnage]' = OrderedDict()
+
+
+def _initialiser_worker_equilibrage(parametres: List[Parametre]):
+    """Compile les configurations de base et retient les paramètres de la recherche"""
+    global _parametres
+    _initialiser_worker()
+    _parametres = parametres
+    _definitions.clear()
+
+
+def _definition(classe: str, reglages: Reglages) -> DefinitionPersonnage:
+    """Définition compilée d'une classe pour un réglage (cache LRU par worker)"""
+    propres = tuple((index, valeur) for index, valeur in reglages if _parametres[index].classe == classe)
+    cle = (classe, propres)
+    definition = _definitions.get(cle)
+    if definition is not None:
+        _definitions.move_to_end(cle)
+        return definition
+
+    base = REGISTRE.definition(classe)
+    definition = DefinitionPersonnage(classe, appliquer_reglages(base.data, _parametres, propres))
+    definition.competences(CLASSES[classe])
+    _definitions[cle] = definition
+    if len(_definitions) > CACHE_DEFINITIONS:
+        _definitions.popitem(last=False)
+    return definition
+
+
+def _evaluer_lot(tache: Tuple) -> Tuple[int, RapportSimulation]:
+    """Simule un lot de combats pour un candidat et retourne (index du candidat, rapport partiel)"""
+    candidat, reglages, debut, fin, classes, difficulte, tours_max, moteur = tache
+    definitions = {classe: _definition(classe, reglages) for classe in set(classes)}
+
+    if moteur == 'numpy':
+        from src.game.vectorise import simuler_lot_vectorise  # NumPy n'est importé que s'il sert
+        return candidat, simuler_lot_vectorise(debut, fin, classes, difficulte, True, tours_max, definitions)
+
+    rapport = RapportSimulation()
+    for seed in range(debut, fin):
+        class_a, class_b = classes if seed % 2 == 0 else classes[::-1]
+        rapport.ajouter(simulate_battle(class_a, class_b, seed, difficulte, tours_max, definitions=definitions))
+    return candidat, rapport
+
+
+class Evaluation:
+    """Écart d'un candidat à la cible, avec son intervalle de confiance"""
+
+    __slots__ = ('parties', 'taux_victoire', 'tours_moyen', 'perte', 'perte_min', 'perte_max', 'ecart_marge')
+
+    def __init__(self, rapport: RapportSimulation, classes: Tuple[str, str], cible: float,
+                 tours: Tuple[float, float], poids_tours: float, z: float = Z_CONFIANCE):
+        classe, adversaire = classes
+        n = rapport.parties
+        self.parties = n
+        self.taux_victoire = p = rapport.taux_victoire(classe)
+        self.tours_moyen = t = rapport.tours_moyen
+
+        # Intervalle de Wilson du taux de victoire
+        centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+        demi = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        ecart_victoire = _distance_intervalle(p, centre - demi, centre + demi, cible, cible)
+
+        # Intervalle de la moyenne des tours, distance relative à la fourchette
+        demi = z * rapport.ecart_type_tours / math.sqrt(n)
+        ecart_tours = _distance_intervalle(t, t - demi, t + demi, tours[0], tours[1])
+        ecart_tours = tuple(poids_tours * ecart / tours[1] for ecart in ecart_tours)
+
+        self.perte, self.perte_min, self.perte_max = (v + w for v, w in zip(ecart_victoire, ecart_tours))
+
+        # Départage quand le taux de victoire plafonne (0% ou 100% partout): écart de PV restants
+        domination = (1 + rapport.pv_moyen(classe) - rapport.pv_moyen(adversaire)) / 2
+        self.ecart_marge = abs(domination - cible)
+
+    @property
+    def rang(self) -> Tuple[float, float]:
+        """Clé de tri des candidats (le plus petit est le meilleur)"""
+        return self.perte, self.ecart_marge
+
+    def to_dict(self) -> Dict:
+        return {nom: getattr(self, nom) for nom in self.__slots__}
+
+
+def _distance_intervalle(valeur: float, minimum: float, maximum: float, bas: float, haut: float):
+    """Distance de valeur à [bas, haut], et ses bornes quand la valeur parcourt [minimum, maximum]"""
+    def distance(x):
+        return max(0.0, bas - x, x - haut)
+    plus_proche = 0.0 if minimum <= haut and maximum >= bas else min(distance(minimum), distance(maximum))
+    return distance(valeur), plus_proche, max(distance(minimum), distance(maximum))
+
+
+class ResultatEquilibrage:
+    """Meilleur réglage trouvé et historique de la recherche"""
+
+    def __init__(self, classes: Tuple[str, str], cible: float, tours: Tuple[float, float],
+                 parametres: List[Parametre]):
+        self.classes = classes
+        self.cible = cible
+        self.tours = tours
+        self.parametres = parametres
+        self.reglages: Reglages = ()
+        self.evaluation: Optional[Evaluation] = None
+        self.evaluation_initiale: Optional[Evaluation] = None
+        self.historique: List[Dict] = []
+        self.parties = 0
+        self.temps = 0.0
+        self.atteinte = False  # Cible atteinte avec confiance
+
+    def diff(self) -> Dict[str, List[Dict]]:
+        """
+        Modifications à apporter aux fichiers de configuration
+
+        Returns:
+            Par classe, une liste d'opérations JSON Patch (RFC 6902) ; 'avant' rappelle l'ancienne valeur
+        """
+        diff: Dict[str, List[Dict]] = {}
+        for index, valeur in self.reglages:
+            parametre = self.parametres[index]
+            if valeur != parametre.base:
+                diff.setdefault(parametre.classe, []).append({
+                    'op': 'replace', 'path': parametre.pointeur, 'value': valeur, 'avant': parametre.base
+                })
+        return diff
+
+    def to_dict(self) -> Dict:
+        return {
+            'classes': list(self.classes),
+            'cible': {'taux_victoire': self.cible, 'tours': list(self.tours)},
+            'atteinte': self.atteinte,
+            'initial': self.evaluation_initiale.to_dict() if self.evaluation_initiale else None,
+            'meilleur': self.evaluation.to_dict() if self.evaluation else None,
+            'diff': {os.path.relpath(REGISTRE.chemin(classe)): operations
+                     for classe, operations in self.diff().items()},
+            'historique': self.historique,
+            'parties': self.parties,
+            'temps': self.temps
+        }
+
+    def afficher(self):
+        """Affiche le meilleur réglage et son écart à la cible"""
+        classe = self.classes[0]
+        print("\n" + "="*70)
+        print("🎚️  ÉQUILIBRAGE")
+        print("="*70)
+        print(f"\n🎯 Cible : {classe.title()} {self.cible:.1%} de victoires contre {self.classes[1].title()}, "
+              f"{self.tours[0]:g} à {self.tours[1]:g} tours")
+
+        for libelle, evaluation in (("Initial", self.evaluation_initiale), ("Meilleur", self.evaluation)):
+            if evaluation is not None:
+                print(f"   {libelle:<9} {evaluation.taux_victoire:7.2%} | {evaluation.tours_moyen:6.1f} tours"
+                      f" | écart {evaluation.perte:.3f} [{evaluation.perte_min:.3f}, {evaluation.perte_max:.3f}]"
+                      f" sur {evaluation.parties} combats")
+        print(f"   {'✅ Cible atteinte' if self.atteinte else '⚠️  Cible non atteinte avec confiance'}")
+
+        diff = self.diff()
+        print("\n📝 MODIFICATIONS :" if diff else "\n📝 Aucune modification")
+        for classe, operations in diff.items():
+            for operation in operations:
+                print(f"   {classe:<10} {operation['path']:<24} {operation['avant']:>6} → {operation['value']}")
+
+        print(f"\n⏱️  {self.parties:,} combats simulés en {self.temps:.1f}s")
+        print("\n" + "="*70 + "\n")
+
+
+class Equilibreur:
+    """Recherche un réglage des skills qui atteint une cible de taux de victoire et de durée"""
+
+    def __init__(self, classes: Tuple[str, str] = ('sage', 'magicien'), cible: float = 0.5,
+                 tours: Tuple[float, float] = (30, 80), parametres: Optional[List[Parametre]] = None,
+                 difficulte: str = 'normal', tours_max: int = TOURS_MAX, moteur: str = 'objet',
+                 workers: int = 1, seed: int = 0, tolerance: float = 0.02, poids_tours: float = 1.0):
+        """
+        Args:
+            classes: Classes qui s'affrontent (chacune commence un combat sur deux)
+            cible: Taux de victoire visé pour la première classe
+            tours: Fourchette visée pour le nombre moyen de tours
+            parametres: Paramètres ajustables (par défaut tous ceux des deux classes)
+            difficulte: Niveau de difficulté des IA
+            tours_max: Nombre de tours au-delà duquel un combat est déclaré nul
+            moteur: Moteur de simulation ('objet' ou 'numpy')
+            workers: Nombre de processus (1 pour tout simuler dans le processus courant)
+            seed: Graine de la recherche (tirage des candidats et graines des combats)
+            tolerance: Écart à la cible en dessous duquel la recherche s'arrête (borne haute de l'intervalle)
+            poids_tours: Poids de l'écart relatif à la fourchette de tours face à l'écart de taux de victoire
+        """
+        if moteur not in MOTEURS:
+            raise ValueError(f"Moteur inconnu : {moteur} (attendu : {', '.join(MOTEURS)})")
+        if classes[0] == classes[1]:
+            raise ValueError("L'équilibrage oppose deux classes différentes")
+        self.classes = tuple(classes)
+        self.cible = cible
+        self.tours = tuple(tours)
+        self.parametres = parametres if parametres is not None else parametres_ajustables(self.classes)
+        self.difficulte = difficulte
+        self.tours_max = tours_max
+        self.moteur = moteur
+        self.workers = workers
+        self.tolerance = tolerance
+        self.poids_tours = poids_tours
+        self.rng = random.Random(seed)
+        self.prochaine_seed = seed * 1_000_000_000  # Graines de combat, jamais réutilisées d'une ronde à l'autre
+
+    def lancer(self, generations: int = 5, candidats: int = 16, parties: int = 200, mutations: int = 2,
+               progression: Optional[Callable[[Dict], None]] = None) -> ResultatEquilibrage:
+        """
+        Lance la recherche
+
+        Args:
+            generations: Nombre maximal de générations de candidats
+            candidats: Candidats tirés par génération (le meilleur réglage connu en fait partie)
+            parties: Combats joués par chaque candidat à la première ronde (doublés à chaque ronde)
+            mutations: Nombre de paramètres modifiés par candidat
+            progression: Fonction appelée avec le résumé de chaque génération
+
+        Returns:
+            Le meilleur réglage trouvé
+        """
+        debut = time.perf_counter()
+        resultat = ResultatEquilibrage(self.classes, self.cible, self.tours, self.parametres)
+        meilleur: Reglages = ()
+
+        # Un seul pool pour toute la recherche (les workers gardent leurs configs compilées)
+        surveiller = REGISTRE.surveiller
+        if self.workers > 1:
+            pool = Pool(self.workers, initializer=_initialiser_worker_equilibrage, initargs=(self.parametres,))
+        else:
+            pool = None
+            _initialiser_worker_equilibrage(self.parametres)
+        try:
+            for generation in range(1, generations + 1):
+                population = [meilleur] + [self.__muter(meilleur, mutations) for _ in range(candidats - 1)]
+                gagnant, evaluation, combats = self.__eliminer(list(dict.fromkeys(population)), parties, pool)
+                resultat.parties += combats
+                if generation == 1:
+                    resultat.evaluation_initiale = evaluation.get(())
+
+                # Le réglage en place faisait partie des candidats: le gagnant l'a battu sur les mêmes graines
+                meilleur = resultat.reglages = gagnant
+                resultat.evaluation = evaluation[gagnant]
+
+                resume = {'generation': generation, 'candidats': len(set(population)), 'combats': combats,
+                          'perte': resultat.evaluation.perte, 'perte_max': resultat.evaluation.perte_max,
+                          'taux_victoire': resultat.evaluation.taux_victoire,
+                          'tours_moyen': resultat.evaluation.tours_moyen}
+                resultat.historique.append(resume)
+                if progression:
+                    progression(resume)
+
+                if resultat.evaluation.perte_max <= self.tolerance:
+                    resultat.atteinte = True
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            REGISTRE.surveiller = surveiller
+
+        resultat.temps = time.perf_counter() - debut
+        return resultat
+
+    def __muter(self, reglages: Reglages, mutations: int) -> Reglages:
+        """Tire un candidat voisin en modifiant quelques paramètres"""
+        valeurs = dict(reglages)
+        for index in self.rng.sample(range(len(self.parametres)), min(mutations, len(self.parametres))):
+            parametre = self.parametres[index]
+            actuelle = valeurs.get(index, parametre.base)
+            pas = max(1, round((parametre.maximum - parametre.minimum) / 4))
+            valeur = self.rng.randint(max(parametre.minimum, actuelle - pas), min(parametre.maximum, actuelle + pas))
+            valeurs[index] = valeur
+        return tuple(sorted((index, valeur) for index, valeur in valeurs.items()
+                            if valeur != self.parametres[index].base))
+
+    def __eliminer(self, population: List[Reglages], parties: int, pool) -> Tuple[Reglages, Dict, int]:
+        """
+        Élimination successive: rondes de combats communs, chaque ronde doublant le nombre de combats
+
+        Returns:
+            Le gagnant, l'évaluation de chaque candidat et le nombre de combats simulés
+        """
+        rapports = {reglages: RapportSimulation() for reglages in population}
+        evaluations: Dict[Reglages, Evaluation] = {}
+        survivants = population
+        combats = 0
+
+        while True:
+            self.__simuler(survivants, parties, rapports, pool)
+            combats += parties * len(survivants)
+            for reglages in survivants:
+                evaluations[reglages] = Evaluation(rapports[reglages], self.classes, self.cible, self.tours,
+                                                   self.poids_tours)
+
+            # Hors course: même dans le meilleur cas, moins bon que le meilleur dans son pire cas
+            reference = min(evaluations[reglages].perte_max for reglages in survivants)
+            survivants = [reglages for reglages in survivants if evaluations[reglages].perte_min <= reference]
+            survivants.sort(key=lambda reglages: evaluations[reglages].rang)
+            survivants = survivants[:math.ceil(len(survivants) / 2)]
+
+            if len(survivants) == 1 or evaluations[survivants[0]].perte_max <= self.tolerance:
+                return survivants[0], evaluations, combats
+            parties *= 2
+
+    def __simuler(self, population: List[Reglages], parties: int, rapports: Dict, pool):
+        """Fait jouer les mêmes graines à tous les candidats (nombres aléatoires communs)"""
+        debut = self.prochaine_seed
+        self.prochaine_seed += parties
+        taches = [
+            (index, reglages, lot, min(lot + TAILLE_LOT, debut + parties), self.classes, self.difficulte,
+             self.tours_max, self.moteur)
+            for index, reglages in enumerate(population)
+            for lot in range(debut, debut + parties, TAILLE_LOT)
+        ]
+        resultats = pool.imap_unordered(_evaluer_lot, taches) if pool is not None else map(_evaluer_lot, taches)
+        for index, partiel in resultats:
+            rapports[population[index]].fusionner(partiel)
@@ -0,0 +1,405 @@
+"""
+Module d'export colonnaire - Historique des parties pour l'analyse
+
+Les sauvegardes (fichiers JSON ou journal en segments) sont converties en
+deux tables typées, une colonne par champ:
+
+- parties: une ligne par partie (mode, classes, vainqueur, tours, dégâts,
+  critiques, PV finaux et une colonne par compétence et par joueur)
+- evenements: une ligne par événement des journaux de combat (partie, tour,
+  code, acteur, valeur numérique, nom)
+
+Chaque export ajoute une partie (un fichier par table) qui ne contient que
+les sauvegardes pas encore exportées; compacter() fusionne les parties. Le
+format est Parquet si pyarrow est installé, sinon .npz NumPy (compressé):
+les agrégats (taux de victoire par classe et par tranche de tours)
+s'exécutent sur des tableaux, en quelques secondes pour des millions de
+lignes.
+
+NumPy est nécessaire (pyarrow est optionnel); seul ce module en dépend.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    pa = pq = None
+
+from src.models.evenements import TypeEvenement
+
+if TYPE_CHECKING:
+    from src.game.save_manager import SaveManager
+
+
+# Formats d'export ('auto': Parquet si pyarrow est installé, sinon npz)
+FORMATS = ('auto', 'parquet', 'npz')
+
+# Tables exportées
+TABLES = ('parties', 'evenements')
+
+# Fichier qui liste les parties de l'export
+FICHIER_MANIFESTE = 'manifeste.json'
+
+# Version du format de l'export
+VERSION_EXPORT = 1
+
+# Sauvegardes lues entre deux écritures de partie (borne la mémoire d'un export)
+TAILLE_PARTIE = 100_000
+
+# Préfixe des colonnes de compteurs de compétences: 'j1:<nom>' / 'j2:<nom>'
+_PREFIXES_SKILLS = ('j1:', 'j2:')
+
+# Colonnes fixes de la table des parties et leur type NumPy
+_COLONNES_PARTIES = {
+    'id': 'int64', 'fichier': 'str', 'date': 'datetime64[us]', 'mode': 'str',
+    'classe_j1': 'str', 'classe_j2': 'str', 'classe_vainqueur': 'str',
+    'vainqueur': 'int8',  # 1 ou 2: joueur vainqueur, 0: nul, -1: inconnu (anciennes sauvegardes)
+    'tours': 'int32',
+    'degats_j1': 'int32', 'degats_j2': 'int32', 'critiques_j1': 'int32', 'critiques_j2': 'int32',
+    'hp_j1': 'int32', 'hp_j2': 'int32'
+}
+
+_COLONNES_EVENEMENTS = {
+    'partie': 'int64', 'tour': 'int32', 'code': 'int8',
+    'acteur': 'int8',  # 0 ou 1: joueur concerné, -1: autre
+    'valeur': 'float32',  # Valeur numérique principale de l'événement (NaN si aucune)
+    'nom': 'str'  # Compétence, effet, familier ou zone ('' si aucun)
+}
+
+# Par code d'événement: index de la valeur numérique et du nom dans ses valeurs (None si absents)
+_CHAMPS_EVENEMENTS = {
+    TypeEvenement.TOUR: (0, None),
+    TypeEvenement.SKILL: (4, 0),
+    TypeEvenement.DEGATS: (0, None),
+    TypeEvenement.SOIN: (0, None),
+    TypeEvenement.BUFF: (2, 0),
+    TypeEvenement.DEBUFF: (2, 0),
+    TypeEvenement.ZONE_DEBUFF: (2, 0),
+    TypeEvenement.INVOCATION: (None, 0),
+    TypeEvenement.ATTAQUE_FAMILIER: (1, 0),
+    TypeEvenement.ZONE_CREEE: (None, 0),
+    TypeEvenement.ZONE_DEGATS: (1, 0),
+    TypeEvenement.REGEN_MP: (0, None),
+    TypeEvenement.PASSIF_MP: (0, None),
+    TypeEvenement.RECUP_MP: (0, None),
+    TypeEvenement.NIVEAU: (0, None),
+}
+
+
+def _verifier_numpy():
+    if np is None:
+        raise ImportError("L'export colonnaire nécessite NumPy (pip install numpy)")
+
+
+def format_effectif(format_export: str) -> str:
+    """
+    Format réellement utilisé pour un format demandé
+
+    Raises:
+        ValueError: Si le format est inconnu
+        ImportError: Si Parquet est demandé sans pyarrow
+    """
+    if format_export not in FORMATS:
+        raise ValueError(f"Format inconnu : {format_export} (attendu : {', '.join(FORMATS)})")
+    if format_export == 'auto':
+        return 'parquet' if pa is not None else 'npz'
+    if format_export == 'parquet' and pa is None:
+        raise ImportError("L'export Parquet nécessite pyarrow (pip install pyarrow)")
+    return format_export
+
+
+def _nom_joueur(valeur) -> str:
+    return valeur.get('nom', '') if isinstance(valeur, dict) else (valeur or '')
+
+
+def _ligne_partie(identifiant: int, fichier: str, data: Dict) -> Dict:
+    """Ligne de la table des parties d'une sauvegarde (anciens et nouveaux formats)"""
+    joueurs = (data.get('joueur1'), data.get('joueur2'))
+    finales = (data.get('joueur1_final') or {}, data.get('joueur2_final') or {})
+    noms = [_nom_joueur(joueur) for joueur in joueurs]
+    classes = [joueur.get('classe', '') if isinstance(joueur, dict) else '' for joueur in joueurs]
+
+    vainqueur = _nom_joueur(data.get('vainqueur'))
+    if 'index_vainqueur' in data:
+        index = 0 if data['index_vainqueur'] is None else data['index_vainqueur'] + 1
+    elif not vainqueur:
+        index = 0
+    else:
+        # Anciennes sauvegardes: vainqueur retrouvé par son nom
+        index = noms.index(vainqueur) + 1 if vainqueur in noms else -1
+
+    ligne = {
+        'id': identifiant,
+        'fichier': fichier,
+        'date': data.get('metadata', {}).get('date') or 'NaT',
+        'mode': data.get('mode', ''),
+        'classe_j1': classes[0],
+        'classe_j2': classes[1],
+        'classe_vainqueur': classes[index - 1] if index > 0 else '',
+        'vainqueur': index,
+        'tours': data.get('nombre_tours', data.get('tours', 0))
+    }
+    for numero, finale in enumerate(finales, 1):
+        ligne[f'degats_j{numero}'] = finale.get('degats_infliges', 0)
+        ligne[f'critiques_j{numero}'] = finale.get('coups_critiques', 0)
+        ligne[f'hp_j{numero}'] = finale.get('hp', 0)
+        for skill, nombre in finale.get('skills_utilises', {}).items():
+            ligne[f'j{numero}:{skill}'] = nombre
+    return ligne
+
+
+def _lignes_evenements(identifiant: int, journal: Dict) -> List[tuple]:
+    """Lignes (partie, tour, code, acteur, valeur, nom) de la table des événements d'un journal"""
+    lignes = []
+    tour = 0
+    for code, acteur, *valeurs in journal.get('evenements', []):
+        if code == TypeEvenement.TOUR:
+            tour = valeurs[0]
+        index_valeur, index_nom = _CHAMPS_EVENEMENTS.get(code, (None, None))
+        valeur = valeurs[index_valeur] if index_valeur is not None and index_valeur < len(valeurs) else None
+        nom = valeurs[index_nom] if index_nom is not None and index_nom < len(valeurs) else ''
+        lignes.append((
+            identifiant, tour, code, acteur if isinstance(acteur, int) else -1,
+            float(valeur) if isinstance(valeur, (int, float)) else float('nan'), str(nom)
+        ))
+    return lignes
+
+
+def _colonnes(types: Dict[str, str], lignes: Sequence, par_nom: bool) -> Dict[str, 'np.ndarray']:
+    """Convertit des lignes (dictionnaires ou tuples dans l'ordre des types) en colonnes NumPy typées"""
+    colonnes = {}
+    for position, (nom, type_colonne) in enumerate(types.items()):
+        valeurs = [ligne[nom] for ligne in lignes] if par_nom else [ligne[position] for ligne in lignes]
+        colonnes[nom] = np.array(valeurs, dtype=str if type_colonne == 'str' else type_colonne)
+    return colonnes
+
+
+def _ecrire(chemin: str, colonnes: Dict[str, 'np.ndarray']):
+    """Écrit une table dans le format indiqué par l'extension du fichier"""
+    temporaire = f'{chemin}.tmp'
+    if chemin.endswith('.parquet'):
+        pq.write_table(pa.table({nom: pa.array(valeurs) for nom, valeurs in colonnes.items()}), temporaire)
+    else:
+        with open(temporaire, 'wb') as f:
+            np.savez_compressed(f, **colonnes)
+    os.replace(temporaire, chemin)
+
+
+def _lire(chemin: str, colonnes: Optional[Sequence[str]] = None) -> Dict[str, 'np.ndarray']:
+    """Lit tout ou partie des colonnes d'une table (les colonnes absentes du fichier sont ignorées)"""
+    if chemin.endswith('.parquet'):
+        if pq is None:
+            raise ImportError(f"Lire {chemin} nécessite pyarrow (pip install pyarrow)")
+        presentes = pq.read_schema(chemin).names
+        table = pq.read_table(chemin, columns=[nom for nom in (colonnes or presentes) if nom in presentes])
+        return {nom: table.column(nom).to_numpy(zero_copy_only=False) for nom in table.column_names}
+    with np.load(chemin, allow_pickle=False) as f:
+        return {nom: f[nom] for nom in (colonnes or f.files) if nom in f.files}
+
+
+class ExportColonnes:
+    """Export colonnaire incrémental de l'historique des parties"""
+
+    def __init__(self, dossier: str):
+        """
+        Args:
+            dossier: Répertoire de l'export (manifeste et fichiers des tables)
+        """
+        _verifier_numpy()
+        self.dossier = dossier
+
+    @property
+    def manifeste(self) -> Dict:
+        """Contenu du manifeste (vide si rien n'a encore été exporté)"""
+        chemin = os.path.join(self.dossier, FICHIER_MANIFESTE)
+        if not os.path.exists(chemin):
+            return {'version': VERSION_EXPORT, 'parties': [], 'prochain_id': 0, 'prochain_numero': 1}
+        with open(chemin, 'r', encoding='utf-8') as f:
+            manifeste = json.load(f)
+        if manifeste.get('version') != VERSION_EXPORT:
+            raise ValueError(f"Export d'un format inconnu : {chemin}")
+        return manifeste
+
+    def _ecrire_manifeste(self, manifeste: Dict):
+        chemin = os.path.join(self.dossier, FICHIER_MANIFESTE)
+        with open(f'{chemin}.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifeste, f, indent=2, ensure_ascii=False)
+        os.replace(f'{chemin}.tmp', chemin)
+
+    def fichiers_exportes(self) -> set:
+        """Sauvegardes déjà présentes dans l'export"""
+        return {str(fichier) for fichier in self.charger('parties', ['fichier']).get('fichier', ())}
+
+    def exporter(self, save_manager: 'SaveManager', format_export: str = 'auto') -> Dict:
+        """
+        Ajoute à l'export les sauvegardes qui n'y sont pas encore
+
+        Args:
+            save_manager: Gestionnaire dont l'historique est exporté (fichiers et segments)
+            format_export: 'auto', 'parquet' ou 'npz'
+
+        Returns:
+            Résumé: parties exportées, sauvegardes illisibles, fichiers écrits
+        """
+        extension = '.parquet' if format_effectif(format_export) == 'parquet' else '.npz'
+        os.makedirs(self.dossier, exist_ok=True)
+        manifeste = self.manifeste
+        deja = self.fichiers_exportes()
+        nouveaux = [save['filename'] for save in save_manager.lister_sauvegardes(tri='date', decroissant=False)
+                    if save['filename'] not in deja]
+
+        resume = {'exportees': 0, 'illisibles': 0, 'fichiers': []}
+        for debut in range(0, len(nouveaux), TAILLE_PARTIE):
+            parties, evenements = [], []
+            for fichier in nouveaux[debut:debut + TAILLE_PARTIE]:
+                try:
+                    data = save_manager.charger_partie(fichier)
+                except (OSError, ValueError):
+                    resume['illisibles'] += 1
+                    continue
+                identifiant = manifeste['prochain_id'] + len(parties)
+                parties.append(_ligne_partie(identifiant, fichier, data))
+                if 'journal' in data:
+                    evenements.extend(_lignes_evenements(identifiant, data['journal']))
+            if not parties:
+                continue
+
+            fichiers = self.__ecrire_partie(manifeste['prochain_numero'], extension, parties, evenements)
+            manifeste['parties'].append({'fichiers': fichiers, 'lignes': len(parties), 'evenements': len(evenements)})
+            manifeste['prochain_id'] += len(parties)
+            manifeste['prochain_numero'] += 1
+            # Manifeste réécrit une fois la partie complète: un export interrompu ne laisse rien à moitié
+            self._ecrire_manifeste(manifeste)
+            resume['exportees'] += len(parties)
+            resume['fichiers'].extend(fichiers.values())
+
+        return resume
+
+    def __ecrire_partie(self, numero: int, extension: str, parties: List[Dict], evenements: List[tuple]) -> Dict:
+        """Écrit une partie de l'export (une table par fichier) et retourne ses fichiers par table"""
+        skills = sorted({nom for ligne in parties for nom in ligne if nom.startswith(_PREFIXES_SKILLS)})
+        for ligne in parties:
+            for nom in skills:
+                ligne.setdefault(nom, 0)
+
+        tables = {
+            'parties': _colonnes(dict(_COLONNES_PARTIES, **{nom: 'int32' for nom in skills}), parties, True),
+            'evenements': _colonnes(_COLONNES_EVENEMENTS, evenements, False)
+        }
+        fichiers = {}
+        for table, colonnes in tables.items():
+            fichiers[table] = f'{table}-{numero:05d}{extension}'
+            _ecrire(os.path.join(self.dossier, fichiers[table]), colonnes)
+        return fichiers
+
+    def charger(self, table: str = 'parties', colonnes: Optional[Sequence[str]] = None) -> Dict[str, 'np.ndarray']:
+        """
+        Charge une table complète (toutes les parties de l'export mises bout à bout)
+
+        Args:
+            table: 'parties' ou 'evenements'
+            colonnes: Colonnes à lire (None pour toutes)
+
+        Returns:
+            Les colonnes, par nom (les compteurs de compétences absents d'une partie valent 0)
+        """
+        if table not in TABLES:
+            raise ValueError(f"Table inconnue : {table} (attendu : {', '.join(TABLES)})")
+        morceaux = [_lire(os.path.join(self.dossier, partie['fichiers'][table]), colonnes)
+                    for partie in self.manifeste['parties']]
+        morceaux = [morceau for morceau in morceaux if morceau]
+        if not morceaux:
+            return {}
+
+        noms = list(dict.fromkeys(nom for morceau in morceaux for nom in morceau))
+        resultat = {}
+        for nom in noms:
+            reference = next(morceau[nom] for morceau in morceaux if nom in morceau)
+            resultat[nom] = np.concatenate([
+                morceau[nom] if nom in morceau else np.zeros(len(next(iter(morceau.values()))), reference.dtype)
+                for morceau in morceaux
+            ])
+        return resultat
+
+    def compacter(self, format_export: str = 'auto') -> Dict:
+        """
+        Fusionne toutes les parties de l'export en une seule (par table)
+
+        Returns:
+            Résumé: parties fusionnées, lignes
+        """
+        manifeste = self.manifeste
+        anciennes = manifeste['parties']
+        if len(anciennes) <= 1:
+            return {'fusionnees': len(anciennes), 'lignes': sum(partie['lignes'] for partie in anciennes)}
+
+        extension = '.parquet' if format_effectif(format_export) == 'parquet' else '.npz'
+        tables = {table: self.charger(table) for table in TABLES}
+        numero = manifeste['prochain_numero']
+        manifeste['prochain_numero'] += 1
+        fichiers = {}
+        for table, colonnes in tables.items():
+            fichiers[table] = f'{table}-{numero:05d}{extension}'
+            _ecrire(os.path.join(self.dossier, fichiers[table]), colonnes)
+
+        manifeste['parties'] = [{
+            'fichiers': fichiers,
+            'lignes': sum(partie['lignes'] for partie in anciennes),
+            'evenements': sum(partie['evenements'] for partie in anciennes)
+        }]
+        self._ecrire_manifeste(manifeste)
+        for partie in anciennes:
+            for fichier in partie['fichiers'].values():
+                os.remove(os.path.join(self.dossier, fichier))
+        return {'fusionnees': len(anciennes), 'lignes': manifeste['parties'][0]['lignes']}
+
+    def statistiques(self, largeur_tranche: int = 10) -> Dict:
+        """
+        Taux de victoire par classe, au total et par tranche de nombre de tours
+
+        Args:
+            largeur_tranche: Largeur des tranches de tours
+
+        Returns:
+            {'parties', 'par_classe': {classe: {...}}, 'par_tranche': {'0-9': {classe: taux}, ...}}
+        """
+        table = self.charger('parties', ['classe_j1', 'classe_j2', 'classe_vainqueur', 'tours'])
+        if not table:
+            return {'parties': 0, 'par_classe': {}, 'par_tranche': {}}
+
+        tranches = table['tours'] // largeur_tranche
+        nombre_tranches = int(tranches.max()) + 1 if len(tranches) else 0
+        classes = sorted({str(classe) for colonne in ('classe_j1', 'classe_j2')
+                          for classe in np.unique(table[colonne])} - {''})
+
+        par_classe = {}
+        par_tranche = {tranche: {} for tranche in range(nombre_tranches)}
+        for classe in classes:
+            # Une partie miroir compte deux participations pour une victoire
+            participations = (np.bincount(tranches[table['classe_j1'] == classe], minlength=nombre_tranches)
+                              + np.bincount(tranches[table['classe_j2'] == classe], minlength=nombre_tranches))
+            victoires = np.bincount(tranches[table['classe_vainqueur'] == classe], minlength=nombre_tranches)
+            total = int(participations.sum())
+            par_classe[classe] = {
+                'participations': total,
+                'victoires': int(victoires.sum()),
+                'taux_victoire': float(victoires.sum() / total) if total else 0.0
+            }
+            for tranche in np.flatnonzero(participations):
+                par_tranche[int(tranche)][classe] = float(victoires[tranche] / participations[tranche])
+
+        return {
+            'parties': len(tranches),
+            'par_classe': par_classe,
+            'par_tranche': {f'{tranche * largeur_tranche}-{(tranche + 1) * largeur_tranche - 1}': taux
+                            for tranche, taux in par_tranche.items() if taux}
+        }
@@ -0,0 +1,202 @@
+"""
+Module du journal en segments - Stockage des parties en ajout seul
+
+Chaque processus écrivain ajoute ses enregistrements (une ligne JSON
+compacte par partie) à ses propres fichiers segments, créés en mode
+exclusif avec un nom unique: plusieurs processus écrivent en même temps
+sans verrou ni collision. Un segment qui dépasse sa taille maximale est
+fermé et un nouveau est ouvert.
+
+Chaque enregistrement est écrit en un seul appel système (visible aussitôt
+par les lecteurs), mais fsync n'est appelé que tous les N enregistrements
+ou à la première écriture après T secondes, et à la fermeture: un arrêt
+brutal du système perd au plus le dernier lot. Une ligne tronquée en fin
+de segment est ignorée à la lecture.
+"""
+
+import atexit
+import json
+import os
+import time
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Taille au-delà de laquelle un segment est fermé (octets)
+TAILLE_SEGMENT = 64 * 1024 * 1024
+
+# Enregistrements écrits entre deux fsync
+LOT_FSYNC = 256
+
+# Délai après le dernier fsync au-delà duquel l'écriture suivante synchronise (secondes)
+INTERVALLE_FSYNC = 1.0
+
+_PREFIXE = 'segment-'
+_EXTENSION = '.jsonl'
+
+# Journaux ouverts du processus, fermés (et synchronisés) à la sortie
+_OUVERTS: 'weakref.WeakSet[JournalSegments]' = weakref.WeakSet()
+
+
+@atexit.register
+def _fermer_journaux():
+    for journal in list(_OUVERTS):
+        journal.fermer()
+
+
+class JournalSegments:
+    """Journal d'enregistrements JSON en ajout seul, réparti en segments"""
+
+    def __init__(self, dossier: str, taille_segment: int = TAILLE_SEGMENT, lot_fsync: int = LOT_FSYNC,
+                 intervalle_fsync: float = INTERVALLE_FSYNC):
+        """
+        Args:
+            dossier: Répertoire des segments (créé s'il n'existe pas)
+            taille_segment: Taille au-delà de laquelle un segment est fermé (octets)
+            lot_fsync: Enregistrements écrits entre deux fsync (1 pour synchroniser chaque écriture)
+            intervalle_fsync: Délai après le dernier fsync au-delà duquel une écriture synchronise (secondes)
+        """
+        self.dossier = dossier
+        self.taille_segment = taille_segment
+        self.lot_fsync = lot_fsync
+        self.intervalle_fsync = intervalle_fsync
+
+        self._fichier = None
+        self._segment: Optional[str] = None
+        self._taille = 0
+        self._en_attente = 0  # Enregistrements écrits depuis le dernier fsync
+        self._dernier_fsync = 0.0
+        self._pid = os.getpid()
+
+        os.makedirs(dossier, exist_ok=True)
+
+    def ajouter(self, enregistrement: Dict) -> str:
+        """
+        Ajoute un enregistrement au segment courant
+
+        Args:
+            enregistrement: Données sérialisables en JSON
+
+        Returns:
+            L'adresse de l'enregistrement ('<segment>#<position>'), à passer à charger()
+        """
+        ligne = (json.dumps(enregistrement, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+        # Un processus issu d'un fork n'écrit jamais dans le segment de son parent
+        if self._fichier is None or self._pid != os.getpid() or self._taille >= self.taille_segment:
+            self.__ouvrir_segment()
+
+        position = self._taille
+        self._fichier.write(ligne)
+        self._taille += len(ligne)
+        self._en_attente += 1
+
+        if self._en_attente >= self.lot_fsync or time.monotonic() - self._dernier_fsync >= self.intervalle_fsync:
+            self.synchroniser()
+        return f'{self._segment}#{position}'
+
+    def synchroniser(self):
+        """Force l'écriture sur disque (fsync) des enregistrements du segment courant"""
+        if self._fichier is not None and self._en_attente:
+            os.fsync(self._fichier.fileno())
+        self._en_attente = 0
+        self._dernier_fsync = time.monotonic()
+
+    def fermer(self):
+        """Synchronise et ferme le segment courant (le prochain ajout en ouvre un nouveau)"""
+        if self._fichier is None:
+            return
+        if self._pid == os.getpid():
+            self.synchroniser()
+        self._fichier.close()
+        self._fichier = None
+        self._segment = None
+        _OUVERTS.discard(self)
+
+    def __ouvrir_segment(self):
+        if self._fichier is not None:
+            self.fermer()
+        self._pid = os.getpid()
+
+        # Nom unique: horodatage (ordre de création), processus et suffixe aléatoire; 'x' refuse un nom déjà pris
+        while True:
+            nom = f'{_PREFIXE}{time.time_ns():020d}-{self._pid}-{os.urandom(4).hex()}{_EXTENSION}'
+            try:
+                self._fichier = open(os.path.join(self.dossier, nom), 'xb', buffering=0)
+                break
+            except FileExistsError:
+                continue
+
+        self._segment = nom
+        self._taille = 0
+        self._en_attente = 0
+        self._dernier_fsync = time.monotonic()
+        _OUVERTS.add(self)
+
+    def segments(self) -> List[str]:
+        """Noms des segments, du plus ancien au plus récent"""
+        return sorted(nom for nom in os.listdir(self.dossier)
+                      if nom.startswith(_PREFIXE) and nom.endswith(_EXTENSION))
+
+    def lire_segment(self, segment: str, debut: int = 0) -> Iterator[Tuple[int, Dict]]:
+        """
+        Parcourt les enregistrements complets d'un segment
+
+        Args:
+            segment: Nom du segment
+            debut: Position de départ (octets, début d'un enregistrement)
+
+        Yields:
+            (position, enregistrement)
+        """
+        with open(os.path.join(self.dossier, segment), 'rb') as f:
+            f.seek(debut)
+            position = debut
+            for ligne in f:
+                if not ligne.endswith(b'\n'):
+                    break  # Enregistrement en cours d'écriture ou tronqué par un arrêt brutal
+                try:
+                    enregistrement = json.loads(ligne)
+                except ValueError:
+                    enregistrement = None  # Ligne endommagée: seul cet enregistrement est perdu
+                if enregistrement is not None:
+                    yield position, enregistrement
+                position += len(ligne)
+
+    def lire(self, avec_adresses: bool = False) -> Iterator:
+        """
+        Parcourt tous les enregistrements, segment par segment
+
+        L'ordre d'écriture est respecté pour chaque écrivain; les segments de
+        processus différents se suivent dans leur ordre de création.
+
+        Args:
+            avec_adresses: Produit des couples (adresse, enregistrement) au lieu des enregistrements seuls
+        """
+        for segment in self.segments():
+            for position, enregistrement in self.lire_segment(segment):
+                yield (f'{segment}#{position}', enregistrement) if avec_adresses else enregistrement
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.lire()
+
+    def charger(self, adresse: str) -> Dict:
+        """
+        Relit un enregistrement à partir de son adresse
+
+        Raises:
+            FileNotFoundError: Si le segment n'existe pas
+            ValueError: Si l'adresse ne désigne pas un enregistrement complet
+        """
+        segment, _, position = adresse.partition('#')
+        if not segment.startswith(_PREFIXE) or not position.isdigit():
+            raise ValueError(f"Adresse d'enregistrement invalide : {adresse}")
+        for _, enregistrement in self.lire_segment(segment, int(position)):
+            return enregistrement
+        raise ValueError(f"Aucun enregistrement complet à l'adresse {adresse}")
+
+    def __enter__(self) -> 'JournalSegments':
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module Monte Carlo - Simulation massive de combats sur plusieurs cœurs
+"""
+
+import math
+import time
+from collections import Counter
+from multiprocessing import Pool
+from typing import Callable, Dict, Optional, Tuple
+
+from src.game.cache_combats import CacheCombats, cle_combat
+from src.game.simulation import CLASSES, TOURS_MAX, simulate_battle
+from src.models.registre import REGISTRE
+
+
+# Taille maximale d'un lot de combats envoyé à un worker
+TAILLE_LOT_MAX = 5000
+
+# Moteurs de simulation: un objet Personnage par combattant, ou tableaux NumPy (src.game.vectorise)
+MOTEURS = ('objet', 'numpy')
+
+# Le moteur NumPy gagne à traiter de gros lots d'un coup
+TAILLE_LOT_MAX_NUMPY = 50000
+
+
+class RapportSimulation:
+    """Statistiques agrégées d'une série de combats, fusionnables entre workers"""
+
+    def __init__(self):
+        self.parties = 0
+        self.nuls = 0
+        self.victoires: Counter = Counter()
+        self.victoires_premier = 0
+        self.tours: Counter = Counter()  # Histogramme nombre de tours -> parties
+        self.skills: Dict[str, Counter] = {}
+        self.pv_restants: Counter = Counter()  # Somme des fractions de PV en fin de combat, par classe
+        self.depuis_cache = 0  # Combats lus dans le cache au lieu d'être simulés
+
+    def ajouter(self, resultat: Dict):
+        """Ajoute le résultat d'un combat au rapport"""
+        self.parties += 1
+        self.tours[resultat['tours']] += 1
+
+        if resultat['classe_vainqueur'] is None:
+            self.nuls += 1
+        else:
+            self.victoires[resultat['classe_vainqueur']] += 1
+            if resultat['vainqueur'] == resultat['joueur1']['nom']:
+                self.victoires_premier += 1
+
+        for joueur in (resultat['joueur1'], resultat['joueur2']):
+            self.skills.setdefault(joueur['classe'], Counter()).update(joueur['skills_utilises'])
+            self.pv_restants[joueur['classe']] += joueur['hp'] / joueur['hp_max']
+
+    def fusionner(self, autre: 'RapportSimulation'):
+        """Fusionne un rapport partiel dans celui-ci"""
+        self.parties += autre.parties
+        self.nuls += autre.nuls
+        self.victoires.update(autre.victoires)
+        self.victoires_premier += autre.victoires_premier
+        self.tours.update(autre.tours)
+        self.pv_restants.update(autre.pv_restants)
+        self.depuis_cache += autre.depuis_cache
+        for classe, compteur in autre.skills.items():
+            self.skills.setdefault(classe, Counter()).update(compteur)
+
+    def taux_victoire(self, classe: str) -> float:
+        """Retourne le taux de victoire d'une classe sur l'ensemble des parties"""
+        return self.victoires[classe] / self.parties if self.parties else 0.0
+
+    def pv_moyen(self, classe: str) -> float:
+        """Fraction moyenne des PV d'une classe en fin de combat (par personnage de la classe)"""
+        personnages = self.parties * (1 if len(self.skills) > 1 else 2)
+        return self.pv_restants[classe] / personnages if personnages else 0.0
+
+    @property
+    def tours_moyen(self) -> float:
+        if not self.parties:
+            return 0.0
+        return sum(tours * nb for tours, nb in self.tours.items()) / self.parties
+
+    @property
+    def ecart_type_tours(self) -> float:
+        """Écart-type (corrigé) du nombre de tours, depuis l'histogramme"""
+        if self.parties < 2:
+            return 0.0
+        moyenne = self.tours_moyen
+        variance = sum(nb * (tours - moyenne) ** 2 for tours, nb in self.tours.items()) / (self.parties - 1)
+        return math.sqrt(variance)
+
+    def percentile_tours(self, p: float) -> int:
+        """
+        Retourne le percentile du nombre de tours depuis l'histogramme
+
+        Args:
+            p: Percentile voulu, entre 0 et 100
+        """
+        if not self.parties:
+            return 0
+        rang = max(1, round(p / 100 * self.parties))
+        cumul = 0
+        for tours in sorted(self.tours):
+            cumul += self.tours[tours]
+            if cumul >= rang:
+                return tours
+        return max(self.tours)
+
+    def to_dict(self) -> Dict:
+        """Retourne le rapport sous forme sérialisable"""
+        return {
+            'parties': self.parties,
+            'nuls': self.nuls,
+            'cache': {'lus': self.depuis_cache, 'simules': self.parties - self.depuis_cache},
+            'taux_victoire': {classe: self.taux_victoire(classe) for classe in sorted(self.skills)},
+            'taux_victoire_premier': self.victoires_premier / self.parties if self.parties else 0.0,
+            'tours': {
+                'moyenne': self.tours_moyen,
+                'p50': self.percentile_tours(50),
+                'p90': self.percentile_tours(90),
+                'p99': self.percentile_tours(99),
+                'max': max(self.tours) if self.tours else 0
+            },
+            'skills': {classe: dict(compteur.most_common()) for classe, compteur in self.skills.items()}
+        }
+
+    def afficher(self):
+        """Affiche le rapport de simulation"""
+        rapport = self.to_dict()
+
+        print("\n" + "="*70)
+        print("📊 RAPPORT DE SIMULATION")
+        print("="*70)
+        print(f"\n🎲 Parties simulées : {self.parties} (nuls : {self.nuls})")
+        if self.depuis_cache:
+            print(f"💾 Cache : {self.depuis_cache} lues, {self.parties - self.depuis_cache} simulées")
+
+        print(f"\n🏆 TAUX DE VICTOIRE :")
+        for classe, taux in rapport['taux_victoire'].items():
+            print(f"   {classe.title():<10} {taux:7.2%}")
+        print(f"   {'1er joueur':<10} {rapport['taux_victoire_premier']:7.2%}")
+
+        tours = rapport['tours']
+        print(f"\n⏱️  TOURS : moyenne {tours['moyenne']:.1f} | p50 {tours['p50']} | "
+              f"p90 {tours['p90']} | p99 {tours['p99']} | max {tours['max']}")
+
+        for classe, compteur in rapport['skills'].items():
+            total = sum(compteur.values()) or 1
+            print(f"\n⚔️  COMPÉTENCES - {classe.title()} :")
+            for nom, nb in compteur.items():
+                print(f"   {nom:<30} {nb:>10} ({nb / total:6.2%})")
+
+        print("\n" + "="*70 + "\n")
+
+
+def _initialiser_worker():
+    """Charge et compile les configurations une seule fois au démarrage du worker"""
+    for classe, type_personnage in CLASSES.items():
+        REGISTRE.definition(classe).competences(type_personnage)
+    # Les configs ne changent pas pendant une simulation: plus aucun stat() par combat
+    REGISTRE.surveiller = False
+
+
+def _simuler_lot(lot: Tuple[int, int, Tuple[str, str], str, bool, int, str, Optional[CacheCombats]]
+                 ) -> RapportSimulation:
+    """Simule un lot de combats consécutifs (sauf ceux déjà en cache) et retourne son rapport partiel"""
+    debut, fin, classes, difficulte, alterner, tours_max, moteur, cache = lot
+    if moteur == 'numpy':
+        from src.game.vectorise import simuler_lot_vectorise  # NumPy n'est importé que s'il sert
+        return simuler_lot_vectorise(debut, fin, classes, difficulte, alterner, tours_max)
+
+    rapport = RapportSimulation()
+    combats = []
+    for seed in range(debut, fin):
+        class_a, class_b = classes
+        if alterner and seed % 2:
+            class_a, class_b = class_b, class_a
+        combats.append((class_a, class_b, seed))
+
+    if cache is None:
+        for class_a, class_b, seed in combats:
+            rapport.ajouter(simulate_battle(class_a, class_b, seed, difficulte, tours_max))
+        return rapport
+
+    cles = [cle_combat(class_a, class_b, seed, (difficulte, difficulte), tours_max)
+            for class_a, class_b, seed in combats]
+    connus = cache.chercher(cles)
+    nouveaux = {}
+    for cle, (class_a, class_b, seed) in zip(cles, combats):
+        resultat = connus.get(cle)
+        if resultat is None:
+            resultat = nouveaux[cle] = simulate_battle(class_a, class_b, seed, difficulte, tours_max)
+        rapport.ajouter(resultat)
+    cache.enregistrer(nouveaux)
+    cache.fermer()
+    rapport.depuis_cache = len(connus)
+
+    return rapport
+
+
+def lancer_simulation(parties: int, workers: int = 1, classes: Tuple[str, str] = ('sage', 'magicien'),
+                      difficulte: str = 'normal', seed_base: int = 0, alterner: bool = True,
+                      tours_max: int = TOURS_MAX, moteur: str = 'objet',
+                      cache: Optional[CacheCombats] = None,
+                      progression: Optional[Callable[[RapportSimulation], None]] = None) -> RapportSimulation:
+    """
+    Simule un grand nombre de combats seedés, répartis sur un pool de processus
+
+    Args:
+        parties: Nombre total de combats à simuler
+        workers: Nombre de processus (1 pour tout simuler dans le processus courant)
+        classes: Classes qui s'affrontent
+        difficulte: Niveau de difficulté des IA
+        seed_base: Graine du premier combat (les suivantes sont consécutives)
+        alterner: Alterne le joueur qui commence d'un combat à l'autre
+        tours_max: Nombre de tours au-delà duquel un combat est déclaré nul
+        moteur: 'objet' (combats rejouables seed par seed) ou 'numpy' (lots vectorisés, mêmes
+            statistiques mais pas les mêmes combats)
+        cache: Cache des combats déjà simulés (ignoré par le moteur NumPy et l'IA experte, non reproductibles
+            combat par combat)
+        progression: Fonction appelée avec le rapport cumulé après chaque lot
+
+    Returns:
+        Le rapport fusionné de tous les combats
+    """
+    if moteur not in MOTEURS:
+        raise ValueError(f"Moteur inconnu : {moteur} (attendu : {', '.join(MOTEURS)})")
+
+    if moteur == 'numpy' or difficulte == 'expert':
+        cache = None
+
+    taille_max = TAILLE_LOT_MAX_NUMPY if moteur == 'numpy' else TAILLE_LOT_MAX
+    taille_lot = max(1, min(taille_max, parties // (workers * 8) or 1))
+    lots = [
+        (debut, min(debut + taille_lot, seed_base + parties), tuple(classes), difficulte, alterner, tours_max,
+         moteur, cache)
+        for debut in range(seed_base, seed_base + parties, taille_lot)
+    ]
+
+    rapport = RapportSimulation()
+
+    if workers <= 1:
+        surveiller = REGISTRE.surveiller
+        _initialiser_worker()
+        try:
+            for partiel in map(_simuler_lot, lots):
+                rapport.fusionner(partiel)
+                if progression:
+                    progression(rapport)
+        finally:
+            REGISTRE.surveiller = surveiller
+        return rapport
+
+    with Pool(workers, initializer=_initialiser_worker) as pool:
+        for partiel in pool.imap_unordered(_simuler_lot, lots):
+            rapport.fusionner(partiel)
+            if progression:
+                progression(rapport)
+
+    return rapport
+
+
+def main_simulation(parties: int, workers: int, **options) -> RapportSimulation:
+    """Lance une simulation en affichant la progression puis le rapport final"""
+    debut = time.perf_counter()
+
+    def afficher_progression(rapport: RapportSimulation):
+        ecoule = time.perf_counter() - debut
+        vitesse = rapport.parties / ecoule if ecoule > 0 else 0
+        print(f"\r   ⏳ {rapport.parties}/{parties} combats ({vitesse:,.0f} combats/s)", end='', flush=True)
+
+    print(f"\n🎲 Simulation de {parties} combats sur {workers} processus...")
+    rapport = lancer_simulation(parties, workers, progression=afficher_progression, **options)
+    print(f"\n   ✅ Terminé en {time.perf_counter() - debut:.1f}s")
+
+    rapport.afficher()
+    return rapport
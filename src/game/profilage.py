@@ -0,0 +1,214 @@
+"""
+Module de profilage - Temps passé dans chaque phase d'un tour de combat
+
+Le profilage est optionnel (python main.py --profile, ou la variable
+d'environnement WIZFIGHT_PROFILE). Activé, il remplace les méthodes des
+phases d'un tour (Personnage.start_turn et ses étapes, use_skill,
+AIPlayer.choose_skill) par des enveloppes qui mesurent chaque appel; à la
+désactivation, les méthodes d'origine sont remises en place. Désactivé, il
+ne coûte donc rien: aucun test ni aucune indirection dans la boucle de jeu.
+
+Les mesures sont agrégées par phase (appels, temps total et maximal) et
+chaque appel est aussi gardé (dans la limite de EVENEMENTS_MAX) pour écrire
+une trace au format Chrome (chrome://tracing, ui.perfetto.dev).
+"""
+
+import functools
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.ai.ai_player import AIPlayer
+from src.models.personnage_v2 import Personnage
+
+
+# Variable d'environnement qui active le profilage (chemin de la trace, ou 1 pour le fichier par défaut)
+VARIABLE_PROFIL = 'WIZFIGHT_PROFILE'
+
+# Fichier de trace par défaut
+TRACE_DEFAUT = 'profil.json'
+
+# Appels gardés au plus pour la trace (les agrégats comptent tous les appels)
+EVENEMENTS_MAX = 500_000
+
+# Phases mesurées: (nom, classe, méthode, phase englobante)
+PHASES: Tuple[Tuple[str, type, str, Optional[str]], ...] = (
+    ('start_turn', Personnage, 'start_turn', None),
+    ('attaque_familiers', Personnage, 'attaque_familiers', 'start_turn'),
+    ('mettre_a_jour_zones', Personnage, 'mettre_a_jour_zones', 'start_turn'),
+    ('mettre_a_jour_effets', Personnage, 'mettre_a_jour_effets', 'start_turn'),
+    ('mettre_a_jour_cooldowns', Personnage, 'mettre_a_jour_cooldowns', 'start_turn'),
+    ('use_skill', Personnage, 'use_skill', None),
+    ('choix_ia', AIPlayer, 'choose_skill', None),
+)
+
+# Profileur installé (un seul à la fois: les enveloppes sont posées sur les classes)
+_ACTIF: Optional['Profileur'] = None
+
+
+def trace_demandee(option: Optional[str] = None) -> Optional[str]:
+    """
+    Fichier de trace demandé par l'option --profile ou, à défaut, par la variable d'environnement
+
+    Returns:
+        Le chemin de la trace, ou None si le profilage n'est pas demandé
+    """
+    if option:
+        return option
+    valeur = os.environ.get(VARIABLE_PROFIL, '').strip()
+    if not valeur or valeur == '0':
+        return None
+    return TRACE_DEFAUT if valeur == '1' else valeur
+
+
+class Profileur:
+    """Mesure des phases d'un tour de combat, activable autour d'un combat ou d'une simulation"""
+
+    def __init__(self, evenements_max: int = EVENEMENTS_MAX):
+        """
+        Args:
+            evenements_max: Appels gardés au plus pour la trace
+        """
+        self.evenements_max = evenements_max
+        self.tours = 0  # Appels de start_turn, un par tour joué
+        self.evenements_perdus = 0
+        self.duree_ns = 0  # Durée totale pendant laquelle le profileur était actif
+        self.__stats: Dict[str, List[int]] = {nom: [0, 0, 0] for nom, _, _, _ in PHASES}  # appels, total, max
+        self.__evenements: List[Tuple[str, int, int, int]] = []  # (phase, début, durée, tour)
+        self.__originales: List[Tuple[type, str, Callable]] = []
+        self.__debut = 0
+
+    @property
+    def actif(self) -> bool:
+        return bool(self.__originales)
+
+    def activer(self):
+        """
+        Installe les mesures sur les classes
+
+        Raises:
+            RuntimeError: Si un autre profileur est déjà actif
+        """
+        global _ACTIF
+        if self.actif:
+            return
+        if _ACTIF is not None:
+            raise RuntimeError("Un profileur est déjà actif")
+
+        for nom, classe, methode, _ in PHASES:
+            originale = classe.__dict__[methode]
+            self.__originales.append((classe, methode, originale))
+            setattr(classe, methode, self.__envelopper(nom, originale))
+        _ACTIF = self
+        self.__debut = time.perf_counter_ns()
+
+    def desactiver(self):
+        """Remet les méthodes d'origine en place (les mesures sont gardées)"""
+        global _ACTIF
+        if not self.actif:
+            return
+        self.duree_ns += time.perf_counter_ns() - self.__debut
+        for classe, methode, originale in reversed(self.__originales):
+            setattr(classe, methode, originale)
+        self.__originales.clear()
+        _ACTIF = None
+
+    def __envelopper(self, nom: str, fonction: Callable) -> Callable:
+        stats = self.__stats[nom]
+        evenements = self.__evenements
+        horloge = time.perf_counter_ns
+        profileur = self
+        debut_tour = nom == 'start_turn'
+
+        @functools.wraps(fonction)
+        def mesure(*args, **kwargs):
+            if debut_tour:
+                profileur.tours += 1
+            debut = horloge()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                duree = horloge() - debut
+                stats[0] += 1
+                stats[1] += duree
+                if duree > stats[2]:
+                    stats[2] = duree
+                if len(evenements) < profileur.evenements_max:
+                    evenements.append((nom, debut, duree, profileur.tours))
+                else:
+                    profileur.evenements_perdus += 1
+
+        return mesure
+
+    def __enter__(self) -> 'Profileur':
+        self.activer()
+        return self
+
+    def __exit__(self, *exc):
+        self.desactiver()
+
+    def to_dict(self) -> Dict:
+        """Agrégats par phase (temps en microsecondes)"""
+        tours = self.tours or 1
+        return {
+            'tours': self.tours,
+            'duree_ms': self.duree_ns / 1e6,
+            'evenements_perdus': self.evenements_perdus,
+            'phases': {
+                nom: {
+                    'appels': appels,
+                    'appels_par_tour': appels / tours,
+                    'total_us': total / 1e3,
+                    'moyenne_us': total / appels / 1e3 if appels else 0.0,
+                    'max_us': maximum / 1e3,
+                    'par_tour_us': total / tours / 1e3
+                }
+                for nom, (appels, total, maximum) in self.__stats.items()
+            }
+        }
+
+    def afficher(self):
+        """Affiche le tableau récapitulatif des phases"""
+        resume = self.to_dict()
+        duree_us = resume['duree_ms'] * 1e3 or 1
+
+        print("\n" + "="*70)
+        print("⏱️  PROFIL DES PHASES D'UN TOUR")
+        print("="*70)
+        print(f"\n🔁 {resume['tours']} tours mesurés en {resume['duree_ms']:.1f} ms")
+        print(f"\n   {'Phase':<27}{'Appels':>9}{'/tour':>7}{'Total ms':>10}{'%':>7}{'Moy. µs':>9}{'Max µs':>9}")
+        for nom, _, _, englobante in PHASES:
+            phase = resume['phases'][nom]
+            libelle = f"  {nom}" if englobante else nom
+            print(f"   {libelle:<27}{phase['appels']:>9}{phase['appels_par_tour']:>7.2f}"
+                  f"{phase['total_us'] / 1e3:>10.2f}{phase['total_us'] / duree_us:>7.1%}"
+                  f"{phase['moyenne_us']:>9.2f}{phase['max_us']:>9.1f}")
+        if self.evenements_perdus:
+            print(f"\n   ⚠️  Trace limitée aux {self.evenements_max} premiers appels "
+                  f"({self.evenements_perdus} non tracés)")
+        print("\n" + "="*70 + "\n")
+
+    def ecrire_trace(self, chemin: str):
+        """
+        Écrit les appels mesurés au format Chrome Trace Event (lisible par Perfetto)
+
+        Args:
+            chemin: Fichier JSON de la trace
+        """
+        # Chaque appel est enregistré à sa fin: une phase englobante suit ses étapes, d'où le tri par début
+        evenements = sorted(self.__evenements, key=lambda evenement: evenement[1])
+        origine = evenements[0][1] if evenements else 0
+        pid = os.getpid()
+        categories = {nom: 'ia' if classe is AIPlayer else 'tour' for nom, classe, _, _ in PHASES}
+        trace = {
+            'traceEvents': [
+                {'name': nom, 'cat': categories[nom], 'ph': 'X', 'pid': pid, 'tid': 0,
+                 'ts': (debut - origine) / 1e3, 'dur': duree / 1e3, 'args': {'tour': tour}}
+                for nom, debut, duree, tour in evenements
+            ],
+            'displayTimeUnit': 'ns',
+            'otherData': {'tours': self.tours, 'evenements_perdus': self.evenements_perdus}
+        }
+        with open(chemin, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, separators=(',', ':'))
@@ -0,0 +1,109 @@
+"""
+Module du protocole réseau - Messages JSON échangés ligne par ligne
+
+Chaque message est un objet JSON compact terminé par un saut de ligne,
+avec un champ 'type'. Le même format sert dans les deux sens, entre le
+serveur de jeu (src.game.serveur) et ses clients (src.game.client).
+"""
+
+import asyncio
+import json
+from typing import Dict, Optional
+
+
+# Port par défaut du serveur de jeu
+PORT = 8765
+
+# Taille maximale d'un message (octets): une ligne plus longue ferme la connexion
+TAILLE_MESSAGE_MAX = 64 * 1024
+
+
+class ErreurProtocole(Exception):
+    """Message illisible, trop long ou sans type"""
+
+
+class ConnexionFermee(Exception):
+    """L'autre extrémité a fermé la connexion"""
+
+
+def encoder(message: Dict) -> bytes:
+    """Sérialise un message en une ligne JSON compacte"""
+    return (json.dumps(message, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def decoder(ligne: bytes) -> Dict:
+    """
+    Relit une ligne reçue
+
+    Raises:
+        ErreurProtocole: Si la ligne n'est pas un objet JSON avec un champ 'type'
+    """
+    try:
+        message = json.loads(ligne)
+    except ValueError as erreur:
+        raise ErreurProtocole(f"Message illisible : {erreur}") from None
+    if not isinstance(message, dict) or not isinstance(message.get('type'), str):
+        raise ErreurProtocole("Message sans type")
+    return message
+
+
+class Canal:
+    """Connexion TCP qui échange des messages (un par ligne)"""
+
+    __slots__ = ('lecteur', 'ecrivain')
+
+    def __init__(self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter):
+        self.lecteur = lecteur
+        self.ecrivain = ecrivain
+
+    @classmethod
+    async def ouvrir(cls, hote: str, port: int = PORT) -> 'Canal':
+        """Se connecte à un serveur"""
+        lecteur, ecrivain = await asyncio.open_connection(hote, port, limit=TAILLE_MESSAGE_MAX)
+        return cls(lecteur, ecrivain)
+
+    def envoyer(self, type_message: str, **champs):
+        """Met un message en file d'envoi (sans attendre: voir vider)"""
+        if not self.ecrivain.is_closing():
+            self.ecrivain.write(encoder({'type': type_message, **champs}))
+
+    async def vider(self):
+        """Attend que les messages en file soient passés au système (contrôle de flux)"""
+        try:
+            await self.ecrivain.drain()
+        except ConnectionError:
+            raise ConnexionFermee() from None
+
+    async def recevoir(self, delai: Optional[float] = None) -> Dict:
+        """
+        Attend le prochain message
+
+        Args:
+            delai: Attente maximale (secondes, None pour attendre indéfiniment)
+
+        Raises:
+            asyncio.TimeoutError: Si rien n'arrive dans le délai
+            ConnexionFermee: Si la connexion est fermée
+            ErreurProtocole: Si le message est illisible ou trop long
+        """
+        await self.vider()
+        try:
+            ligne = await asyncio.wait_for(self.lecteur.readline(), delai)
+        except ValueError:
+            raise ErreurProtocole("Message trop long") from None
+        except ConnectionError:
+            raise ConnexionFermee() from None
+        if not ligne.endswith(b'\n'):
+            raise ConnexionFermee()
+        return decoder(ligne)
+
+    async def fermer(self):
+        """Envoie ce qui reste en file et ferme la connexion"""
+        if self.ecrivain.is_closing():
+            return
+        try:
+            await self.ecrivain.drain()
+            self.ecrivain.close()
+            await self.ecrivain.wait_closed()
+        except ConnectionError:
+            pass
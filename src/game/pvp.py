@@ -0,0 +1,283 @@
+"""
+Module du PvP en réseau - Parties Joueur vs Joueur sur le serveur de jeu
+
+Le serveur fait autorité: il déroule le combat avec les vraies règles de
+Personnage, valide chaque coup et l'annonce aux deux joueurs. Un coup ne
+circule que sous forme compacte (numéro du tour, identifiant de la
+compétence, empreinte de l'état après le coup): chaque client garde une
+réplique du combat, reconstruite à partir de la graine et rejouée coup par
+coup. Le combat étant déterministe pour une graine donnée, la réplique
+affiche exactement ce qu'afficherait une partie locale; l'empreinte
+détecte une divergence (configs différentes entre client et serveur).
+
+Un joueur déconnecté garde sa place: il revient avec le jeton reçu au
+début de la partie et le serveur lui renvoie la graine et la liste des
+coups joués, qu'il rejoue pour retrouver l'état courant. S'il ne joue pas
+son tour dans le délai d'inactivité, il perd la partie par abandon.
+"""
+
+import asyncio
+import secrets
+import zlib
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.game.protocole import Canal, ConnexionFermee
+from src.game.simulation import CLASSES, VERSION_MOTEUR, Combat
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence
+from src.models.evenements import SINK_NUL, SinkCombat, SinkJournal
+from src.models.registre import REGISTRE
+
+
+# Identifiant de coup d'un tour passé faute de compétence utilisable
+PASSE = -1
+
+
+def empreinte_tour(combat: Combat) -> int:
+    """Empreinte compacte de l'état du combat (PV, PM, position du générateur), comparée par les clients"""
+    joueur1, joueur2 = combat.joueurs
+    etat = (combat.tour, joueur1.current_hp, joueur1.current_mp, joueur2.current_hp, joueur2.current_mp,
+            combat.rng.etat()[1][-1])
+    return zlib.crc32(repr(etat).encode('ascii'))
+
+
+def creer_combat(joueurs: List[Dict], seed: int, tours_max: int, sink: SinkCombat = SINK_NUL) -> Combat:
+    """
+    Construit le combat d'une partie (identique sur le serveur et chez chaque client)
+
+    Args:
+        joueurs: [{'nom': ..., 'classe': ...}] dans l'ordre du combat
+        seed: Graine du combat
+        tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+        sink: Sortie des événements des deux personnages
+    """
+    personnages = [CLASSES[joueur['classe']](joueur['nom']) for joueur in joueurs]
+    for personnage in personnages:
+        personnage.sink = sink
+    return Combat(*personnages, tours_max=tours_max, rng=Aleatoire(seed))
+
+
+def jouer_coup(combat: Combat, uid: int):
+    """Termine le tour en cours (debut_tour déjà appelé) avec le coup annoncé"""
+    combat.jouer(combat.attaquant.skills[uid] if uid != PASSE else None)
+
+
+def repliquer(partie: Dict, sink: SinkCombat = SINK_NUL) -> Combat:
+    """
+    Reconstruit chez un client le combat décrit par un message 'partie'
+
+    Les coups déjà joués sont rejoués sans affichage; le sink n'est posé
+    qu'ensuite, pour la suite du combat.
+
+    Raises:
+        ValueError: Si le moteur ou les configs des classes diffèrent de ceux du serveur
+    """
+    if partie['version_moteur'] != VERSION_MOTEUR:
+        raise ValueError(f"Moteur du serveur en version {partie['version_moteur']} (client : {VERSION_MOTEUR})")
+    for joueur in partie['joueurs']:
+        if REGISTRE.definition(joueur['classe']).empreinte != joueur['empreinte']:
+            raise ValueError(f"La config de la classe {joueur['classe']} diffère de celle du serveur")
+
+    combat = creer_combat(partie['joueurs'], partie['seed'], partie['tours_max'])
+    for uid in partie['coups']:
+        combat.debut_tour()
+        jouer_coup(combat, uid)
+    for personnage in combat.joueurs:
+        personnage.sink = sink
+    return combat
+
+
+class PartiePvP:
+    """Partie entre deux joueurs connectés, déroulée par le serveur"""
+
+    def __init__(self, joueurs: List[Dict], tours_max: int, delai_coup: float):
+        """
+        Args:
+            joueurs: [{'nom': ..., 'classe': ...}] dans l'ordre du combat
+            tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+            delai_coup: Temps laissé à un joueur (connecté ou non) pour jouer son tour (secondes)
+        """
+        self.joueurs = [dict(joueur, empreinte=REGISTRE.definition(joueur['classe']).empreinte)
+                        for joueur in joueurs]
+        self.delai_coup = delai_coup
+        self.jetons = [secrets.token_hex(16) for _ in joueurs]
+        self.canaux: List[Optional[Canal]] = [None, None]
+        self.coups: List[int] = []
+        self.abandon: Optional[int] = None  # Index du joueur qui a perdu par abandon
+        self.terminee = False
+
+        self.journal = SinkJournal(tuple(joueur['nom'] for joueur in joueurs))
+        self.combat = creer_combat(joueurs, Aleatoire().seed, tours_max, self.journal)
+        self.__files = [asyncio.Queue(), asyncio.Queue()]
+
+    def description(self, index: int) -> Dict:
+        """Message 'partie' d'un joueur: de quoi répliquer le combat jusqu'au dernier coup"""
+        return {
+            'index': index, 'jeton': self.jetons[index], 'seed': self.combat.rng.seed,
+            'tours_max': self.combat.tours_max, 'version_moteur': VERSION_MOTEUR,
+            'joueurs': self.joueurs, 'coups': self.coups
+        }
+
+    def connecter(self, index: int, canal: Canal):
+        """(Re)branche un joueur: il reçoit la partie, l'adversaire est prévenu"""
+        ancien = self.canaux[index]
+        if ancien is not None and ancien is not canal:
+            ancien.ecrivain.close()  # Coupure pas encore détectée par le serveur: la session remplacée s'arrête
+        self.canaux[index] = canal
+        canal.envoyer('partie', **self.description(index))
+        self.__envoyer(1 - index, 'adversaire', connecte=True)
+
+    def deconnecter(self, index: int, canal: Canal):
+        """Débranche un joueur (sans effet si sa place a déjà été reprise par une autre connexion)"""
+        if self.canaux[index] is canal:
+            self.canaux[index] = None
+            if not self.terminee:
+                self.__envoyer(1 - index, 'adversaire', connecte=False)
+
+    def recevoir(self, index: int, canal: Canal, message: Dict):
+        """Transmet un message d'un joueur à la partie"""
+        if self.canaux[index] is canal and message['type'] == 'skill':
+            self.__files[index].put_nowait(message)
+
+    def __envoyer(self, index: int, type_message: str, **champs):
+        canal = self.canaux[index]
+        if canal is not None:
+            canal.envoyer(type_message, **champs)
+
+    async def __vider(self):
+        for canal in self.canaux:
+            if canal is not None:
+                try:
+                    await canal.vider()
+                except ConnexionFermee:
+                    pass
+
+    async def __attendre_coup(self, index: int) -> Optional[Competence]:
+        """Attend un coup valide du joueur actif (None s'il n'a pas joué dans le délai)"""
+        boucle = asyncio.get_running_loop()
+        limite = boucle.time() + self.delai_coup
+        attaquant, tour = self.combat.attaquant, self.combat.tour
+        file = self.__files[index]
+        while True:
+            try:
+                message = await asyncio.wait_for(file.get(), max(0.0, limite - boucle.time()))
+            except asyncio.TimeoutError:
+                return None
+            uid = message.get('skill')
+            if message.get('tour') != tour:
+                self.__envoyer(index, 'erreur', tour=tour, texte=f"Coup attendu pour le tour {tour}")
+            elif not isinstance(uid, int) or not 0 <= uid < len(attaquant.skills):
+                self.__envoyer(index, 'erreur', tour=tour, texte="Compétence inconnue")
+            elif not attaquant.can_use_skill(attaquant.skills[uid]):
+                self.__envoyer(index, 'erreur', tour=tour, texte="Compétence indisponible (PM ou cooldown)")
+            else:
+                return attaquant.skills[uid]
+
+    async def jouer(self, sauvegarder: Callable[[Dict], Awaitable[None]]):
+        """
+        Déroule la partie jusqu'à sa fin
+
+        Args:
+            sauvegarder: Coroutine appelée avec les données de sauvegarde (mode 'PvP'), avant que
+                la fin ne soit annoncée aux joueurs
+        """
+        combat = self.combat
+        while not combat.termine:
+            skills = combat.debut_tour()
+            uid = PASSE
+            if skills:
+                skill = await self.__attendre_coup(combat.index_actif)
+                if skill is None:
+                    self.abandon = combat.index_actif
+                    break
+                uid = skill.uid
+            tour = combat.tour
+            jouer_coup(combat, uid)
+            self.coups.append(uid)
+            for index in (0, 1):
+                self.__envoyer(index, 'coup', tour=tour, skill=uid, controle=empreinte_tour(combat))
+            await self.__vider()
+
+        self.terminee = True
+        donnees = combat.donnees_sauvegarde('PvP', self.journal)
+        if self.abandon is not None:
+            donnees['vainqueur'] = self.joueurs[1 - self.abandon]['nom']
+            donnees['index_vainqueur'] = 1 - self.abandon
+            donnees['perdant'] = self.joueurs[self.abandon]['nom']
+            donnees['abandon'] = True
+        await sauvegarder(donnees)
+        for index in (0, 1):
+            self.__envoyer(index, 'fin', vainqueur=donnees['vainqueur'], tours=donnees['nombre_tours'],
+                           abandon=self.abandon is not None)
+        for canal in self.canaux:
+            if canal is not None:
+                await canal.fermer()
+
+
+class SalonPvP:
+    """Appariement des joueurs PvP et parties en cours, retrouvées par jeton"""
+
+    def __init__(self, tours_max: int, delai_coup: float):
+        self.tours_max = tours_max
+        self.delai_coup = delai_coup
+        self.__attente: Optional[Tuple[Dict, asyncio.Future]] = None
+        self.__parties: Dict[str, Tuple[PartiePvP, int]] = {}
+        self.taches: Set[asyncio.Task] = set()
+
+    async def entrer(self, nom: str, classe: str, canal: Canal, delai: float,
+                     sauvegarder: Callable[[Dict], Awaitable[None]]) -> Tuple[Optional[PartiePvP], int]:
+        """
+        Apparie un joueur avec celui qui attend, ou le fait attendre le suivant
+
+        Args:
+            nom: Nom du joueur
+            classe: Classe choisie
+            canal: Connexion du joueur (un message ou une déconnexion pendant l'attente l'annule)
+            delai: Attente maximale d'un adversaire (secondes)
+            sauvegarder: Coroutine appelée avec les données de sauvegarde de la partie terminée
+
+        Returns:
+            (partie, index du joueur), ou (None, -1) si personne n'est venu
+        """
+        if self.__attente is not None:
+            joueur1, attente = self.__attente
+            self.__attente = None
+            if nom == joueur1['nom']:
+                nom = f"{nom} (2)"
+            partie = PartiePvP([joueur1, {'nom': nom, 'classe': classe}], self.tours_max, self.delai_coup)
+            for index, jeton in enumerate(partie.jetons):
+                self.__parties[jeton] = (partie, index)
+            tache = asyncio.create_task(self.__derouler(partie, sauvegarder))
+            self.taches.add(tache)
+            tache.add_done_callback(self.taches.discard)
+            attente.set_result(partie)
+            return partie, 1
+
+        attente = asyncio.get_running_loop().create_future()
+        self.__attente = ({'nom': nom, 'classe': classe}, attente)
+        lecture = asyncio.ensure_future(canal.recevoir())
+        try:
+            await asyncio.wait({attente, lecture}, timeout=delai, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # La lecture doit être finie avant que la session ne relise la connexion
+            lecture.cancel()
+            await asyncio.wait({lecture})
+            if not lecture.cancelled():
+                lecture.exception()  # Message ou déconnexion pendant l'attente: abandon de l'attente
+        if attente.done():
+            return attente.result(), 0
+        if self.__attente is not None and self.__attente[1] is attente:
+            self.__attente = None
+        attente.cancel()
+        return None, -1
+
+    def retrouver(self, jeton: str) -> Tuple[Optional[PartiePvP], int]:
+        """Partie en cours et place du joueur désignés par un jeton ((None, -1) si inconnu ou terminée)"""
+        return self.__parties.get(jeton, (None, -1))
+
+    async def __derouler(self, partie: PartiePvP, sauvegarder: Callable[[Dict], Awaitable[None]]):
+        try:
+            await partie.jouer(sauvegarder)
+        finally:
+            for jeton in partie.jetons:
+                self.__parties.pop(jeton, None)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module de replay - Reconstruction d'un combat à partir de son journal d'événements
+"""
+
+from typing import Dict, List, Tuple
+
+from src.models.evenements import FORMATS
+
+
+class Replay:
+    """Lecture tour par tour d'un journal d'événements sauvegardé"""
+
+    def __init__(self, journal: Dict):
+        """
+        Initialise le replay
+
+        Args:
+            journal: Journal tel que produit par SinkJournal.to_dict()
+        """
+        self.noms: List[str] = journal['joueurs']
+        self.evenements: List[List] = journal['evenements']
+        self.index_tours: List[int] = journal['index_tours']
+
+    @property
+    def nombre_tours(self) -> int:
+        return len(self.index_tours)
+
+    def evenements_tour(self, numero: int) -> List[List]:
+        """
+        Retourne les événements d'un tour sans parcourir les tours précédents
+
+        Args:
+            numero: Numéro du tour (à partir de 1)
+        """
+        self._verifier_tour(numero)
+        debut = self.index_tours[numero - 1]
+        fin = self.index_tours[numero] if numero < self.nombre_tours else len(self.evenements)
+        return self.evenements[debut:fin]
+
+    def etat_tour(self, numero: int) -> Tuple[int, int, int, int]:
+        """
+        Retourne l'état des joueurs au début d'un tour
+
+        Returns:
+            (hp_joueur1, mp_joueur1, hp_joueur2, mp_joueur2)
+        """
+        self._verifier_tour(numero)
+        evenement_tour = self.evenements[self.index_tours[numero - 1]]
+        return tuple(evenement_tour[3:7])
+
+    def _verifier_tour(self, numero: int):
+        """Lève IndexError si le tour n'existe pas dans le journal"""
+        if not 1 <= numero <= self.nombre_tours:
+            raise IndexError(f"Tour {numero} inexistant (1-{self.nombre_tours})")
+
+    def _nom_acteur(self, acteur) -> str:
+        """Retrouve le nom d'un acteur stocké par index"""
+        return self.noms[acteur] if isinstance(acteur, int) else acteur
+
+    def lignes_tour(self, numero: int) -> List[str]:
+        """Retourne le texte affichable des événements d'un tour"""
+        lignes = []
+        for code, acteur, *valeurs in self.evenements_tour(numero):
+            texte = FORMATS[code](self._nom_acteur(acteur), *valeurs)
+            if texte is not None:
+                lignes.append(texte)
+        return lignes
+
+    def compter(self, code: int) -> int:
+        """Compte les événements d'un type donné sur tout le combat"""
+        return sum(1 for evenement in self.evenements if evenement[0] == code)
+
+    def afficher_tour(self, numero: int):
+        """Affiche un tour avec l'état des joueurs à son début"""
+        hp1, mp1, hp2, mp2 = self.etat_tour(numero)
+        print(f"\n📍 Début du tour {numero} - {self.noms[0]}: {hp1} HP / {mp1} MP | "
+              f"{self.noms[1]}: {hp2} HP / {mp2} MP")
+        print("\n".join(self.lignes_tour(numero)))
+
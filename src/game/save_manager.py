@@ -2,25 +2,107 @@
 # -*- coding: utf-8 -*-
 """
 Module de gestion des sauvegardes
+
+Chaque partie est un fichier JSON dans le répertoire des sauvegardes. Un
+index SQLite (date, mode, vainqueur, durée) est tenu à jour par save_game:
+l'historique se liste, se trie, se filtre et se pagine sans ouvrir les
+fichiers. Les fichiers ajoutés ou supprimés à la main sont rattrapés dès
+que la date de modification du répertoire change.
+
+Le stockage 'segments' ajoute plutôt chaque partie en une ligne JSON à un
+journal en segments (voir journal_segments), pour les lancements
+automatisés et parallèles: l'index en rattrape la fin à la lecture de
+l'historique.
 """
 
 import json
 import os
+import sqlite3
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from src.game.journal_segments import JournalSegments
+
+
+# Fichier de l'index, dans le répertoire des sauvegardes
+FICHIER_INDEX = 'index.sqlite'
+
+# Stockages des parties: un fichier JSON par partie, ou journal en segments
+STOCKAGES = ('fichiers', 'segments')
+
+# Sous-répertoire du journal en segments (préfixe des adresses de ses parties)
+DOSSIER_SEGMENTS = 'segments'
+
+# Colonnes selon lesquelles l'historique peut être trié
+TRIS = ('date', 'mode', 'vainqueur', 'duree_tours')
+
+# Parties affichées par page de l'historique
+PAR_PAGE = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sauvegardes (
+    filename TEXT PRIMARY KEY, date TEXT, mode TEXT NOT NULL, vainqueur TEXT NOT NULL, duree_tours INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sauvegardes_date ON sauvegardes (date);
+CREATE INDEX IF NOT EXISTS sauvegardes_mode ON sauvegardes (mode, date);
+CREATE INDEX IF NOT EXISTS sauvegardes_vainqueur ON sauvegardes (vainqueur, date);
+CREATE INDEX IF NOT EXISTS sauvegardes_duree ON sauvegardes (duree_tours);
+CREATE TABLE IF NOT EXISTS meta (nom TEXT PRIMARY KEY, valeur INTEGER NOT NULL);
+"""
+
+
+def _nom(valeur, defaut: str = 'Inconnu') -> str:
+    """Retourne un nom de joueur, qu'il soit stocké comme texte ou comme dictionnaire"""
+    if isinstance(valeur, dict):
+        return valeur.get('nom', defaut)
+    return valeur or defaut
+
+
+def _nombre_tours(data: Dict) -> int:
+    """Retourne la durée d'une partie (les anciennes sauvegardes utilisent 'tours')"""
+    return data.get('nombre_tours', data.get('tours', 0))
+
+
+def _entree_index(filename: str, data: Dict) -> Tuple:
+    """Ligne de l'index d'une sauvegarde: (filename, date, mode, vainqueur, durée)"""
+    return (filename, data.get('metadata', {}).get('date'), data.get('mode', 'Inconnu'),
+            _nom(data.get('vainqueur')), _nombre_tours(data))
+
+
+def _filtres(mode: Optional[str], vainqueur: Optional[str], tours_min: Optional[int], tours_max: Optional[int],
+             date_min: Optional[str], date_max: Optional[str]) -> Tuple[str, List]:
+    """Clause WHERE (et ses paramètres) des filtres de l'historique"""
+    conditions = []
+    parametres = []
+    for condition, valeur in (('mode = ?', mode), ('vainqueur = ?', vainqueur),
+                              ('duree_tours >= ?', tours_min), ('duree_tours <= ?', tours_max),
+                              ('date >= ?', date_min), ('date <= ?', date_max)):
+        if valeur is not None:
+            conditions.append(condition)
+            parametres.append(valeur)
+    return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), parametres
 
 
 class SaveManager:
     """Gestionnaire de sauvegardes des parties"""
     
-    def __init__(self, save_dir="saves"):
+    def __init__(self, save_dir="saves", stockage: str = 'fichiers'):
         """
         Initialise le gestionnaire de sauvegardes
         
         Args:
             save_dir: Répertoire où stocker les sauvegardes
+            stockage: 'fichiers' (un JSON lisible par partie) ou 'segments' (journal en ajout seul)
+        
+        Raises:
+            ValueError: Si le stockage est inconnu
         """
+        if stockage not in STOCKAGES:
+            raise ValueError(f"Stockage inconnu : {stockage} (attendu : {', '.join(STOCKAGES)})")
         self.save_dir = save_dir
+        self.stockage = stockage
+        self._index: Optional[sqlite3.Connection] = None
+        self._journal: Optional[JournalSegments] = None
         self._ensure_save_dir()
     
     def _ensure_save_dir(self):
@@ -28,6 +110,95 @@ class SaveManager:
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
     
+    @property
+    def index(self) -> sqlite3.Connection:
+        """Connexion à l'index des sauvegardes (créé et rempli au premier accès)"""
+        if self._index is None:
+            self._ensure_save_dir()
+            connexion = sqlite3.connect(os.path.join(self.save_dir, FICHIER_INDEX), timeout=60)
+            # Journal gardé entre deux écritures: écrire l'index ne change pas la date du répertoire
+            connexion.execute('PRAGMA journal_mode=PERSIST')
+            connexion.executescript(_SCHEMA)
+            self._index = connexion
+        return self._index
+    
+    @property
+    def journal(self) -> JournalSegments:
+        """Journal en segments (créé au premier accès)"""
+        if self._journal is None:
+            self._journal = JournalSegments(os.path.join(self.save_dir, DOSSIER_SEGMENTS))
+        return self._journal
+    
+    def _date_repertoire(self) -> int:
+        return os.stat(self.save_dir).st_mtime_ns
+    
+    def _date_memorisee(self) -> Optional[int]:
+        ligne = self.index.execute("SELECT valeur FROM meta WHERE nom = 'date_repertoire'").fetchone()
+        return None if ligne is None else ligne[0]
+    
+    def _memoriser_date_repertoire(self, date: int):
+        with self.index:
+            self.index.execute("INSERT OR REPLACE INTO meta VALUES ('date_repertoire', ?)", (date,))
+    
+    def synchroniser_index(self, complet: bool = False):
+        """
+        Rattrape dans l'index les fichiers ajoutés ou supprimés sans passer par le gestionnaire
+        
+        Args:
+            complet: Relit toutes les sauvegardes même si le répertoire n'a pas changé
+        """
+        if complet:
+            with self.index:
+                self.index.execute('DELETE FROM sauvegardes')
+                self.index.execute('DELETE FROM meta')
+        self._synchroniser_segments()
+        
+        # Date lue avant la liste: un fichier écrit pendant la relecture change la date et sera vu à la suivante
+        date = self._date_repertoire()
+        if self._date_memorisee() == date:
+            return
+        
+        fichiers = {filename for filename in os.listdir(self.save_dir) if filename.endswith('.json')}
+        with self.index:
+            indexes = {filename for (filename,) in self.index.execute(
+                "SELECT filename FROM sauvegardes WHERE filename NOT LIKE ?", (f'{DOSSIER_SEGMENTS}/%',))}
+            self.index.executemany('DELETE FROM sauvegardes WHERE filename = ?',
+                                   ((filename,) for filename in indexes - fichiers))
+            
+            lignes = []
+            for filename in sorted(fichiers - indexes):
+                try:
+                    with open(os.path.join(self.save_dir, filename), 'r', encoding='utf-8') as f:
+                        lignes.append(_entree_index(filename, json.load(f)))
+                except Exception:
+                    continue
+            self.index.executemany('INSERT OR REPLACE INTO sauvegardes VALUES (?, ?, ?, ?, ?)', lignes)
+        self._memoriser_date_repertoire(date)
+    
+    def _synchroniser_segments(self):
+        """Indexe les parties ajoutées au journal en segments depuis la dernière lecture (par tout processus)"""
+        if not os.path.isdir(os.path.join(self.save_dir, DOSSIER_SEGMENTS)):
+            return
+        
+        # Par segment: taille déjà vue et position de la dernière partie indexée (-1 si aucune)
+        connus = dict(self.index.execute("SELECT nom, valeur FROM meta WHERE nom LIKE 'segment:%'"))
+        for segment in self.journal.segments():
+            taille = os.path.getsize(os.path.join(self.journal.dossier, segment))
+            if connus.get(f'segment:{segment}:taille') == taille:
+                continue
+            
+            derniere = connus.get(f'segment:{segment}:position', -1)
+            lignes = []
+            for position, data in self.journal.lire_segment(segment, max(derniere, 0)):
+                if position > derniere:
+                    lignes.append(_entree_index(f'{DOSSIER_SEGMENTS}/{segment}#{position}', data))
+                    derniere = position
+            with self.index:
+                self.index.executemany('INSERT OR REPLACE INTO sauvegardes VALUES (?, ?, ?, ?, ?)', lignes)
+                self.index.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                                       ((f'segment:{segment}:taille', taille),
+                                        (f'segment:{segment}:position', derniere)))
+    
     def save_game(self, game_data: Dict) -> str:
         """
         Saves a completed game
@@ -36,11 +207,9 @@ class SaveManager:
             game_data: Dictionary containing game data
             
         Returns:
-            Path to save file
+            Path to save file ('<save_dir>/segments/<segment>#<position>' with segment storage)
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"combat_{timestamp}.json"
-        filepath = os.path.join(self.save_dir, filename)
         
         # Add metadata
         game_data['metadata'] = {
@@ -49,9 +218,29 @@ class SaveManager:
             'version': '2.0.0'
         }
         
+        if self.stockage == 'segments':
+            # Ni fichier ni index par partie: l'index rattrape les segments à la lecture
+            adresse = self.journal.ajouter(game_data)
+            return os.path.join(self.save_dir, f'{DOSSIER_SEGMENTS}/{adresse}')
+        
+        # Les fichiers déposés à la main depuis la dernière écriture sont indexés avant
+        self.synchroniser_index()
+        a_jour = self._date_memorisee() == self._date_repertoire()
+        
+        filename = f"combat_{timestamp}.json"
+        filepath = os.path.join(self.save_dir, filename)
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(game_data, f, indent=2, ensure_ascii=False)
         
+        with self.index:
+            self.index.execute('INSERT OR REPLACE INTO sauvegardes VALUES (?, ?, ?, ?, ?)',
+                               _entree_index(filename, game_data))
+        # Si un autre processus a écrit depuis la synchronisation, la date mémorisée reste l'ancienne:
+        # la prochaine lecture relira le répertoire au lieu de croire l'index complet
+        if a_jour:
+            self._memoriser_date_repertoire(self._date_repertoire())
+        
         return filepath
     
     def charger_partie(self, filename: str) -> Dict:
@@ -59,51 +248,91 @@ class SaveManager:
         Charge une partie sauvegardée
         
         Args:
-            filename: Nom du fichier de sauvegarde
+            filename: Nom du fichier de sauvegarde, ou adresse 'segments/<segment>#<position>'
             
         Returns:
             Les données de la partie
         """
+        if filename.startswith(f'{DOSSIER_SEGMENTS}/') and '#' in filename:
+            return self.journal.charger(filename[len(DOSSIER_SEGMENTS) + 1:])
+        
         filepath = os.path.join(self.save_dir, filename)
         
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     
-    def lister_sauvegardes(self) -> List[Dict]:
+    def lister_sauvegardes(self, page: int = 1, par_page: Optional[int] = None, tri: str = 'date',
+                           decroissant: bool = True, mode: Optional[str] = None, vainqueur: Optional[str] = None,
+                           tours_min: Optional[int] = None, tours_max: Optional[int] = None,
+                           date_min: Optional[str] = None, date_max: Optional[str] = None) -> List[Dict]:
         """
-        Liste toutes les sauvegardes disponibles
+        Liste les sauvegardes depuis l'index, sans ouvrir les fichiers
         
+        Args:
+            page: Numéro de la page (à partir de 1)
+            par_page: Sauvegardes par page (None pour tout lister)
+            tri: Colonne de tri ('date', 'mode', 'vainqueur' ou 'duree_tours')
+            decroissant: Trie du plus grand au plus petit (plus récent d'abord pour la date)
+            mode: Ne garde que ce mode de jeu ('PvE', 'PvP', 'Auto')
+            vainqueur: Ne garde que les parties gagnées par ce joueur
+            tours_min: Durée minimale en tours
+            tours_max: Durée maximale en tours
+            date_min: Date ISO minimale (incluse)
+            date_max: Date ISO maximale (incluse, un préfixe comme '2025-11-30' s'arrête au début du jour)
+            
         Returns:
             Liste de dictionnaires avec les infos des sauvegardes
+            
+        Raises:
+            ValueError: Si la colonne de tri est inconnue
         """
-        sauvegardes = []
-        
+        if tri not in TRIS:
+            raise ValueError(f"Tri inconnu : {tri} (attendu : {', '.join(TRIS)})")
         if not os.path.exists(self.save_dir):
-            return sauvegardes
+            return []
+        self.synchroniser_index()
         
-        for filename in os.listdir(self.save_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.save_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        sauvegardes.append({
-                            'filename': filename,
-                            'date': data.get('metadata', {}).get('date', 'Inconnue'),
-                            'vainqueur': data.get('vainqueur', {}).get('nom', 'Inconnu'),
-                            'mode': data.get('mode', 'Inconnu'),
-                            'duree_tours': data.get('nombre_tours', 0)
-                        })
-                except Exception:
-                    continue
+        where, parametres = _filtres(mode, vainqueur, tours_min, tours_max, date_min, date_max)
+        sens = 'DESC' if decroissant else 'ASC'
+        requete = (f'SELECT filename, date, mode, vainqueur, duree_tours FROM sauvegardes{where} '
+                   f'ORDER BY {tri} IS NULL, {tri} {sens}, filename {sens}')
+        if par_page is not None:
+            requete += ' LIMIT ? OFFSET ?'
+            parametres += [par_page, (max(page, 1) - 1) * par_page]
         
-        # Trier par date décroissante
-        sauvegardes.sort(key=lambda x: x['date'], reverse=True)
-        return sauvegardes
+        return [
+            {
+                'filename': filename,
+                'date': date or 'Inconnue',
+                'vainqueur': vainqueur,
+                'mode': mode,
+                'duree_tours': duree_tours
+            }
+            for filename, date, mode, vainqueur, duree_tours in self.index.execute(requete, parametres)
+        ]
+    
+    def compter_sauvegardes(self, mode: Optional[str] = None, vainqueur: Optional[str] = None,
+                            tours_min: Optional[int] = None, tours_max: Optional[int] = None,
+                            date_min: Optional[str] = None, date_max: Optional[str] = None) -> int:
+        """Nombre de sauvegardes qui passent les filtres (mêmes filtres que lister_sauvegardes)"""
+        if not os.path.exists(self.save_dir):
+            return 0
+        self.synchroniser_index()
+        where, parametres = _filtres(mode, vainqueur, tours_min, tours_max, date_min, date_max)
+        return self.index.execute(f'SELECT COUNT(*) FROM sauvegardes{where}', parametres).fetchone()[0]
     
-    def afficher_historique(self):
-        """Affiche l'historique des parties"""
-        sauvegardes = self.lister_sauvegardes()
+    def afficher_historique(self, page: int = 1, par_page: int = PAR_PAGE, **options):
+        """
+        Affiche une page de l'historique des parties
+        
+        Args:
+            page: Numéro de la page (à partir de 1)
+            par_page: Parties par page
+            **options: Tri et filtres de lister_sauvegardes
+        """
+        filtres = {cle: valeur for cle, valeur in options.items() if cle not in ('tri', 'decroissant')}
+        total = self.compter_sauvegardes(**filtres)
+        sauvegardes = self.lister_sauvegardes(page, par_page, **options)
         
         if not sauvegardes:
             print("\n📂 Aucune partie sauvegardée.\n")
@@ -113,65 +342,99 @@ class SaveManager:
         print("📂 HISTORIQUE DES PARTIES")
         print("="*80)
         
-        for i, save in enumerate(sauvegardes, 1):
+        premier = (page - 1) * par_page
+        for i, save in enumerate(sauvegardes, premier + 1):
             print(f"\n{i}. {save['filename']}")
             print(f"   📅 Date: {save['date'][:19]}")
             print(f"   🎮 Mode: {save['mode']}")
             print(f"   👑 Vainqueur: {save['vainqueur']}")
             print(f"   ⏱️  Durée: {save['duree_tours']} tours")
         
+        pages = (total + par_page - 1) // par_page
+        print(f"\n📄 Page {page}/{pages} ({total} parties)")
         print("\n" + "="*80 + "\n")
     
-    def afficher_replay(self, filename: str):
+    def afficher_replay(self, filename: str, tour: Optional[int] = None, pas_a_pas: bool = False):
         """
         Affiche le replay d'une partie
         
         Args:
             filename: Nom du fichier de sauvegarde
+            tour: Numéro d'un tour à afficher seul (None pour tout le combat)
+            pas_a_pas: Attend une validation entre chaque tour
         """
+        from src.game.replay import Replay
+        
         try:
             data = self.charger_partie(filename)
             
+            nom_j1 = _nom(data.get('joueur1'), 'Joueur 1')
+            nom_j2 = _nom(data.get('joueur2'), 'Joueur 2')
+            
             print("\n" + "="*80)
             print("🎬 REPLAY DE LA PARTIE")
             print("="*80)
             
             print(f"\n📅 Date: {data.get('metadata', {}).get('date', 'Inconnue')}")
             print(f"🎮 Mode: {data.get('mode', 'Inconnu')}")
-            print(f"\n⚔️  {data.get('joueur1', {}).get('nom', 'Joueur 1')} VS {data.get('joueur2', {}).get('nom', 'Joueur 2')}")
+            print(f"\n⚔️  {nom_j1} VS {nom_j2}")
+            
+            # Déroulement du combat, tour par tour
+            if 'journal' in data:
+                replay = Replay(data['journal'])
+                tours = [tour] if tour is not None else range(1, replay.nombre_tours + 1)
+                for numero in tours:
+                    replay.afficher_tour(numero)
+                    if pas_a_pas and numero < replay.nombre_tours:
+                        input("\n⏎ Appuyez sur Entrée pour le tour suivant...")
+            elif tour is not None:
+                print("\n⚠️  Cette sauvegarde ne contient pas de journal de combat.")
             
             print(f"\n📊 STATISTIQUES FINALES:")
             print("="*80)
             
-            # Joueur 1
-            j1 = data.get('joueur1_final', {})
-            print(f"\n{data.get('joueur1', {}).get('nom', 'Joueur 1')}:")
-            print(f"   ❤️  HP: {j1.get('hp', 0)}/{j1.get('hp_max', 0)}")
-            print(f"   💙 MP: {j1.get('mp', 0)}/{j1.get('mp_max', 0)}")
-            print(f"   ✨ Dégâts infligés: {j1.get('degats_infliges', 0)}")
-            print(f"   🎯 Coups critiques: {j1.get('coups_critiques', 0)}")
-            
-            # Joueur 2
-            j2 = data.get('joueur2_final', {})
-            print(f"\n{data.get('joueur2', {}).get('nom', 'Joueur 2')}:")
-            print(f"   ❤️  HP: {j2.get('hp', 0)}/{j2.get('hp_max', 0)}")
-            print(f"   💙 MP: {j2.get('mp', 0)}/{j2.get('mp_max', 0)}")
-            print(f"   ✨ Dégâts infligés: {j2.get('degats_infliges', 0)}")
-            print(f"   🎯 Coups critiques: {j2.get('coups_critiques', 0)}")
-            
-            print(f"\n👑 VAINQUEUR: {data.get('vainqueur', {}).get('nom', 'Inconnu')}")
-            print(f"⏱️  Nombre de tours: {data.get('nombre_tours', 0)}")
+            for nom, final in ((nom_j1, data.get('joueur1_final', {})), (nom_j2, data.get('joueur2_final', {}))):
+                print(f"\n{nom}:")
+                print(f"   ❤️  HP: {final.get('hp', 0)}/{final.get('hp_max', 0)}")
+                print(f"   💙 MP: {final.get('mp', 0)}/{final.get('mp_max', 0)}")
+                print(f"   ✨ Dégâts infligés: {final.get('degats_infliges', 0)}")
+                print(f"   🎯 Coups critiques: {final.get('coups_critiques', 0)}")
+            
+            print(f"\n👑 VAINQUEUR: {_nom(data.get('vainqueur'))}")
+            print(f"⏱️  Nombre de tours: {_nombre_tours(data)}")
             
             print("\n" + "="*80 + "\n")
             
         except FileNotFoundError:
             print(f"❌ Fichier de sauvegarde '{filename}' introuvable.")
+        except IndexError as e:
+            print(f"❌ {e}")
         except Exception as e:
             print(f"❌ Erreur lors du chargement du replay: {e}")
     
+    def exporter(self, dossier: str, format_export: str = 'auto', compacter: bool = False) -> Dict:
+        """
+        Exporte les sauvegardes pas encore exportées au format colonnaire (voir export_colonnes)
+        
+        Args:
+            dossier: Répertoire de l'export
+            format_export: 'auto' (Parquet si pyarrow est installé, sinon npz), 'parquet' ou 'npz'
+            compacter: Fusionne ensuite toutes les parties de l'export en une seule
+            
+        Returns:
+            Résumé de l'export
+        """
+        from src.game.export_colonnes import ExportColonnes  # NumPy n'est importé que s'il sert
+        
+        export = ExportColonnes(dossier)
+        resume = export.exporter(self, format_export)
+        if compacter:
+            resume['compactage'] = export.compacter(format_export)
+        return resume
+    
     def supprimer_sauvegarde(self, filename: str) -> bool:
         """
-        Supprime une sauvegarde
+        Supprime une sauvegarde (les parties du journal en segments, en ajout seul, ne se suppriment pas)
         
         Args:
             filename: Nom du fichier à supprimer
@@ -183,7 +446,12 @@ class SaveManager:
         
         try:
             if os.path.exists(filepath):
+                a_jour = self._date_memorisee() == self._date_repertoire()
                 os.remove(filepath)
+                with self.index:
+                    self.index.execute('DELETE FROM sauvegardes WHERE filename = ?', (filename,))
+                if a_jour:  # Comme dans save_game: ne pas masquer les écritures d'un autre processus
+                    self._memoriser_date_repertoire(self._date_repertoire())
                 return True
             return False
         except Exception:
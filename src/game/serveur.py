@@ -0,0 +1,412 @@
+"""
+Module du serveur de jeu - Parties PvE et PvP simultanées sur TCP (asyncio)
+
+Chaque connexion est une session: le serveur demande le mode de jeu, le
+nom et la classe du joueur. En PvE, il déroule le combat contre l'IA dans
+la coroutine de la session; en PvP, il apparie le joueur avec le suivant
+et la partie se déroule à part (src.game.pvp), les sessions des deux
+joueurs ne faisant que lui transmettre leurs coups. Les
+invites de InputHandler deviennent des messages (src.game.protocole): à
+son tour, le joueur reçoit l'état du combat et ses compétences, et répond
+avec l'identifiant de la compétence choisie et le numéro du tour.
+
+Une boucle d'événements unique sert toutes les sessions. Les IA à base de
+règles répondent en quelques microsecondes et jouent directement; l'IA
+experte (MCTS, plusieurs centaines de millisecondes par coup) réfléchit
+dans un thread pour ne pas bloquer les autres sessions. Les parties
+terminées sont sauvegardées par un thread dédié (journal en segments par
+défaut, fait pour les écritures concurrentes).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from src.ai.ai_player import AIPlayer
+from src.ai.mcts import BUDGET_MS
+from src.game.protocole import PORT, TAILLE_MESSAGE_MAX, Canal, ConnexionFermee, ErreurProtocole
+from src.game.pvp import PartiePvP, SalonPvP
+from src.game.save_manager import SaveManager
+from src.game.simulation import CLASSES, TOURS_MAX, Combat
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence
+from src.models.evenements import FORMATS, SinkCombat, SinkJournal
+from src.models.personnage_v2 import Personnage
+
+
+# Adresse d'écoute par défaut (connexions locales seulement)
+HOTE = '127.0.0.1'
+
+# Sessions simultanées au plus par processus: les suivantes sont refusées
+SESSIONS_MAX = 500
+
+# Délai sans réponse du joueur au-delà duquel sa session est fermée (secondes)
+DELAI_INACTIVITE = 300.0
+
+# Threads de réflexion de l'IA experte
+THREADS_IA = 4
+
+# Longueur maximale d'un nom de joueur
+LONGUEUR_NOM_MAX = 30
+
+# Nom de l'IA adverse en PvE
+NOM_IA = "AI"
+
+# Modes proposés à la connexion
+MODES = ['pve', 'pvp']
+
+
+class SinkSession(SinkCombat):
+    """Regroupe le texte des événements d'un tour et l'envoie en un seul message"""
+
+    __slots__ = ('canal', 'lignes')
+
+    def __init__(self, canal: Canal):
+        self.canal = canal
+        self.lignes: List[str] = []
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        texte = FORMATS[code](acteur, *valeurs)
+        if texte is not None:
+            self.lignes.append(texte)
+
+    def flush(self):
+        if self.lignes:
+            self.canal.envoyer('texte', texte='\n'.join(self.lignes))
+            self.lignes.clear()
+
+
+def etat_personnage(personnage: Personnage) -> Dict:
+    """État visible d'un personnage (équivalent de display_stats)"""
+    return {
+        'nom': personnage.nom,
+        'hp': personnage.current_hp,
+        'hp_max': personnage.hp_max,
+        'mp': personnage.current_mp,
+        'mp_max': personnage.mp_max,
+        'attaque': personnage.attack,
+        'defense': personnage.defense,
+        'niveau': personnage.level,
+        'buffs': [effet.nom for effet in personnage.buffs],
+        'debuffs': [effet.nom for effet in personnage.debuffs],
+        'familiers': [familier.nom for familier in personnage.familiers]
+    }
+
+
+def etat_competences(personnage: Personnage) -> List[Dict]:
+    """Compétences d'un personnage et leur disponibilité (équivalent du menu de InputHandler)"""
+    competences = []
+    for skill in personnage.skills:
+        cooldown = personnage.cooldown_restant(skill)
+        if personnage.can_use_skill(skill):
+            statut = "✅ Disponible"
+        elif personnage.current_mp < skill.cout_mp:
+            statut = "❌ MP insuffisants"
+        else:
+            statut = f"⏳ Cooldown : {cooldown} tours"
+        competences.append({
+            'id': skill.uid, 'nom': skill.nom, 'icone': skill.icone, 'type': skill.type,
+            'cout_mp': skill.cout_mp, 'cooldown': cooldown, 'disponible': personnage.can_use_skill(skill),
+            'statut': statut
+        })
+    return competences
+
+
+class SessionTerminee(Exception):
+    """Le joueur est parti, inactif trop longtemps ou a envoyé un message invalide"""
+
+
+class Session:
+    """Une connexion de joueur: partie contre l'IA, ou place dans une partie PvP"""
+
+    def __init__(self, serveur: 'ServeurJeu', canal: Canal):
+        self.serveur = serveur
+        self.canal = canal
+        self.combat: Optional[Combat] = None
+
+    async def demander(self, champ: str, texte: str, choix: Optional[List[str]] = None) -> str:
+        """Pose une question au joueur et retourne sa réponse (équivalent d'un input())"""
+        self.canal.envoyer('question', champ=champ, texte=texte, choix=choix)
+        while True:
+            message = await self.recevoir()
+            if message['type'] != 'reponse':
+                self.canal.envoyer('erreur', texte=f"Réponse attendue pour « {champ} »")
+                continue
+            valeur = str(message.get('valeur', '')).strip()
+            if choix is None or valeur in choix:
+                return valeur
+            self.canal.envoyer('erreur', texte=f"Choix invalide. Choisissez parmi : {', '.join(choix)}")
+
+    async def recevoir(self) -> Dict:
+        """Attend le prochain message du joueur"""
+        try:
+            return await self.canal.recevoir(self.serveur.delai_inactivite)
+        except asyncio.TimeoutError:
+            self.canal.envoyer('inactivite', texte="Session fermée après une trop longue inactivité")
+            raise SessionTerminee() from None
+        except (ConnexionFermee, ErreurProtocole):
+            raise SessionTerminee() from None
+
+    async def choisir_joueur(self, joueur: Personnage, adversaire: Personnage) -> Competence:
+        """Envoie l'état du tour au joueur et attend une compétence utilisable (équivalent de InputHandler)"""
+        tour = self.combat.tour
+        self.canal.envoyer('tour', tour=tour, joueur=etat_personnage(joueur), adversaire=etat_personnage(adversaire),
+                           competences=etat_competences(joueur))
+        while True:
+            message = await self.recevoir()
+            if message['type'] != 'skill' or message.get('tour') != tour:
+                self.canal.envoyer('erreur', texte=f"Compétence attendue pour le tour {tour}")
+                continue
+            uid = message.get('skill')
+            if not isinstance(uid, int) or not 0 <= uid < len(joueur.skills):
+                self.canal.envoyer('erreur', texte=f"Choix invalide. Choisissez entre 0 et {len(joueur.skills) - 1}.")
+                continue
+            skill = joueur.skills[uid]
+            if joueur.can_use_skill(skill):
+                return skill
+            if joueur.current_mp < skill.cout_mp:
+                self.canal.envoyer('erreur', texte=f"❌ MP insuffisants ! ({joueur.current_mp}/{skill.cout_mp})")
+            else:
+                self.canal.envoyer('erreur', texte=f"❌ Compétence en cooldown ! "
+                                                   f"({joueur.cooldown_restant(skill)} tours restants)")
+
+    async def choisir_ia(self, ia: AIPlayer, skills: List[Competence], adversaire: Personnage) -> Competence:
+        """Coup de l'IA: l'IA experte réfléchit dans un thread, les autres répondent aussitôt"""
+        if ia.recherche is None:
+            return ia.choose_skill(skills, adversaire)
+        boucle = asyncio.get_running_loop()
+        return await boucle.run_in_executor(self.serveur.threads_ia, ia.choose_skill, skills, adversaire)
+
+    async def jouer(self):
+        """Déroule la session selon le mode choisi (une reprise PvP peut répondre à la question du mode)"""
+        self.canal.envoyer('question', champ='mode', texte="Choisissez le mode de jeu", choix=MODES)
+        while True:
+            message = await self.recevoir()
+            if message['type'] == 'reprise':
+                await self.reprendre_pvp(str(message.get('jeton', '')))
+                return
+            valeur = str(message.get('valeur', '')).strip() if message['type'] == 'reponse' else None
+            if valeur in MODES:
+                break
+            self.canal.envoyer('erreur', texte=f"Choix invalide. Choisissez parmi : {', '.join(MODES)}")
+
+        nom = (await self.demander('nom', "Entrez votre nom")) or "Joueur"
+        nom = nom[:LONGUEUR_NOM_MAX]
+        classe = await self.demander('classe', "Choisissez votre personnage", list(CLASSES))
+        if valeur == 'pvp':
+            await self.jouer_pvp(nom, classe)
+        else:
+            await self.jouer_pve(nom, classe)
+
+    async def jouer_pve(self, nom: str, classe: str):
+        """Combat contre l'IA et sauvegarde"""
+        classe_ia = next((c for c in CLASSES if c != classe), classe)
+        if nom == NOM_IA:
+            nom = f"{nom} (2)"  # Comme en PvP: deux combattants homonymes se confondraient dans l'historique
+        joueur = CLASSES[classe](nom)
+        adversaire = CLASSES[classe_ia](NOM_IA)
+        ia = AIPlayer(adversaire, difficulte=self.serveur.difficulte, budget_ms=self.serveur.budget_ms)
+
+        journal = SinkJournal((joueur.nom, adversaire.nom), suivant=SinkSession(self.canal))
+        joueur.sink = adversaire.sink = journal
+        self.combat = combat = Combat(joueur, adversaire, tours_max=self.serveur.tours_max, rng=Aleatoire())
+        self.canal.envoyer('debut', seed=combat.rng.seed, joueur=etat_personnage(joueur),
+                           adversaire=dict(etat_personnage(adversaire), classe=classe_ia))
+
+        while not combat.termine:
+            skills = combat.debut_tour()
+            skill = None
+            if skills:
+                if combat.attaquant is joueur:
+                    skill = await self.choisir_joueur(joueur, adversaire)
+                else:
+                    skill = await self.choisir_ia(ia, skills, joueur)
+            combat.jouer(skill)
+            await self.canal.vider()
+
+        vainqueur = combat.vainqueur
+        self.canal.envoyer('fin', vainqueur=vainqueur.nom if vainqueur else None, tours=combat.tour - 1,
+                           joueur=joueur.get_final_stats(), adversaire=adversaire.get_final_stats())
+        await self.serveur.sauvegarder(combat.donnees_sauvegarde('PvE', journal))
+
+    async def jouer_pvp(self, nom: str, classe: str):
+        """Attend un adversaire, puis suit la partie PvP"""
+        self.canal.envoyer('attente', texte="⏳ En attente d'un adversaire...")
+        await self.canal.vider()
+        partie, index = await self.serveur.salon.entrer(nom, classe, self.canal, self.serveur.delai_inactivite,
+                                                        self.serveur.sauvegarder)
+        if partie is None:
+            self.canal.envoyer('inactivite', texte="Aucun adversaire ne s'est présenté")
+            return
+        await self.suivre_pvp(partie, index)
+
+    async def reprendre_pvp(self, jeton: str):
+        """Reprend la place d'un joueur dans une partie PvP en cours"""
+        partie, index = self.serveur.salon.retrouver(jeton)
+        if partie is None:
+            self.canal.envoyer('introuvable', texte="Partie introuvable ou déjà terminée")
+            return
+        await self.suivre_pvp(partie, index)
+
+    async def suivre_pvp(self, partie: PartiePvP, index: int):
+        """
+        Transmet les coups du joueur à sa partie jusqu'à la fin de celle-ci
+
+        Pas de délai d'inactivité ici: la partie laisse à chaque joueur un
+        temps limité pour jouer son tour, connecté ou non.
+        """
+        partie.connecter(index, self.canal)
+        try:
+            while not partie.terminee:
+                partie.recevoir(index, self.canal, await self.canal.recevoir())
+        except (ConnexionFermee, ErreurProtocole):
+            pass
+        finally:
+            partie.deconnecter(index, self.canal)
+
+
+class ServeurJeu:
+    """Serveur TCP de parties PvE et PvP, une coroutine par session"""
+
+    def __init__(self, hote: str = HOTE, port: int = PORT, sessions_max: int = SESSIONS_MAX,
+                 delai_inactivite: float = DELAI_INACTIVITE, difficulte: str = 'normal',
+                 budget_ms: float = BUDGET_MS, tours_max: int = TOURS_MAX,
+                 save_manager: Optional[SaveManager] = None):
+        """
+        Args:
+            hote: Adresse d'écoute
+            port: Port d'écoute (0 pour un port libre, lu ensuite dans self.port)
+            sessions_max: Sessions simultanées au plus
+            delai_inactivite: Délai sans réponse du joueur avant de fermer sa session, ou de lui faire
+                perdre sa partie PvP (secondes)
+            difficulte: Niveau de l'IA adverse
+            budget_ms: Temps de réflexion par coup de l'IA experte (millisecondes)
+            tours_max: Nombre de tours au-delà duquel un combat est déclaré nul
+            save_manager: Destination des parties terminées (None pour ne rien sauvegarder)
+        """
+        self.hote = hote
+        self.port = port
+        self.sessions_max = sessions_max
+        self.delai_inactivite = delai_inactivite
+        self.difficulte = difficulte
+        self.budget_ms = budget_ms
+        self.tours_max = tours_max
+        self.save_manager = save_manager
+
+        self.sessions: Set[Session] = set()
+        self.salon = SalonPvP(tours_max, delai_inactivite)
+        self.parties_terminees = 0
+        self.refusees = 0
+        self.threads_ia = ThreadPoolExecutor(THREADS_IA, thread_name_prefix='ia')
+        # Un seul thread d'écriture: l'index SQLite du SaveManager n'est utilisé que par lui
+        self.thread_sauvegarde = ThreadPoolExecutor(1, thread_name_prefix='sauvegarde')
+        self.__serveur: Optional[asyncio.AbstractServer] = None
+
+    async def demarrer(self):
+        """Ouvre le port d'écoute (les sessions sont servies dès que la boucle tourne)"""
+        self.__serveur = await asyncio.start_server(self.__accueillir, self.hote, self.port,
+                                                    limit=TAILLE_MESSAGE_MAX, backlog=max(100, self.sessions_max))
+        self.port = self.__serveur.sockets[0].getsockname()[1]
+
+    async def servir(self):
+        """Démarre le serveur si besoin et sert les sessions jusqu'à l'annulation"""
+        if self.__serveur is None:
+            await self.demarrer()
+        try:
+            await self.__serveur.serve_forever()
+        finally:
+            await self.arreter()
+
+    async def arreter(self):
+        """Ferme le port d'écoute et attend la fin des sauvegardes en cours"""
+        if self.__serveur is not None:
+            self.__serveur.close()
+            await self.__serveur.wait_closed()
+            self.__serveur = None
+        self.threads_ia.shutdown(wait=False, cancel_futures=True)
+        self.thread_sauvegarde.shutdown(wait=True)
+
+    async def sauvegarder(self, donnees: Dict):
+        """Sauvegarde une partie terminée (PvE ou PvP) sans bloquer la boucle"""
+        self.parties_terminees += 1
+        if self.save_manager is not None:
+            boucle = asyncio.get_running_loop()
+            await boucle.run_in_executor(self.thread_sauvegarde, self.save_manager.save_game, donnees)
+
+    async def __accueillir(self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter):
+        canal = Canal(lecteur, ecrivain)
+        if len(self.sessions) >= self.sessions_max:
+            self.refusees += 1
+            canal.envoyer('complet', texte=f"Serveur complet ({self.sessions_max} sessions), réessayez plus tard")
+            await canal.fermer()
+            return
+
+        session = Session(self, canal)
+        self.sessions.add(session)
+        try:
+            canal.envoyer('bienvenue', sessions=len(self.sessions), sessions_max=self.sessions_max,
+                          difficulte=self.difficulte)
+            await session.jouer()
+        except (SessionTerminee, ConnexionFermee):
+            pass
+        finally:
+            self.sessions.discard(session)
+            await canal.fermer()
+
+    def statistiques(self) -> Dict:
+        """Compteurs du serveur"""
+        return {
+            'sessions': len(self.sessions),
+            'sessions_max': self.sessions_max,
+            'parties_terminees': self.parties_terminees,
+            'refusees': self.refusees
+        }
+
+
+def demarrer_en_fond(**options) -> ServeurJeu:
+    """
+    Lance un serveur de jeu dans un thread (démon) du processus, le temps d'y jouer
+
+    Returns:
+        Le serveur, une fois son port ouvert (options: voir ServeurJeu)
+
+    Raises:
+        OSError: Si le port ne peut pas être ouvert
+    """
+    serveur = ServeurJeu(**options)
+    pret = threading.Event()
+    erreurs: List[OSError] = []
+
+    async def principal():
+        try:
+            await serveur.demarrer()
+        except OSError as erreur:
+            erreurs.append(erreur)
+            return
+        finally:
+            pret.set()
+        await serveur.servir()
+
+    threading.Thread(target=asyncio.run, args=(principal(),), name='serveur', daemon=True).start()
+    pret.wait()
+    if erreurs:
+        raise erreurs[0]
+    return serveur
+
+
+def lancer_serveur(**options):
+    """Lance un serveur de jeu jusqu'à Ctrl+C (options: voir ServeurJeu)"""
+    serveur = ServeurJeu(**options)
+
+    async def principal():
+        await serveur.demarrer()
+        print(f"\n🌐 Serveur WiZ-Fight sur {serveur.hote}:{serveur.port} "
+              f"({serveur.sessions_max} sessions au plus, IA {serveur.difficulte})")
+        await serveur.servir()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+    print(f"\n👋 Serveur arrêté ({serveur.parties_terminees} parties terminées, {serveur.refusees} refusées)")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module de simulation headless - Combats IA vs IA sans entrée/sortie
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from src.ai.ai_player import AIPlayer
+from src.ai.politiques import Politique
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence
+from src.models.evenements import SINK_NUL, SinkJournal, TypeEvenement
+from src.models.magicien import Magicien
+from src.models.personnage_v2 import Personnage
+from src.models.registre import REGISTRE, DefinitionPersonnage
+from src.models.sage import Sage
+
+
+# Classes jouables indexées par leur identifiant de configuration
+CLASSES = {
+    'sage': Sage,
+    'magicien': Magicien
+}
+
+# Garde-fou contre les combats qui ne se terminent jamais (match nul)
+TOURS_MAX = 1000
+
+# Version des règles de combat: à incrémenter quand un même combat seedé change d'issue
+VERSION_MOTEUR = 1
+
+
+class Combat:
+    """Déroulement d'un combat tour par tour, sans aucune interaction"""
+
+    def __init__(self, joueur1: Personnage, joueur2: Personnage, tours_max: int = TOURS_MAX,
+                 rng: Optional[Aleatoire] = None):
+        """
+        Initialise le combat
+
+        Args:
+            joueur1: Personnage qui joue en premier
+            joueur2: Personnage qui joue en second
+            tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+            rng: Générateur aléatoire partagé par les deux joueurs (celui du joueur 1 par défaut)
+        """
+        self.rng = rng if rng is not None else joueur1.rng
+        joueur1.rng = joueur2.rng = self.rng
+        # Un journal reçoit l'index de chaque joueur, pas seulement son nom (les deux peuvent être homonymes)
+        for index, joueur in enumerate((joueur1, joueur2)):
+            if isinstance(joueur.sink, SinkJournal):
+                joueur.sink = joueur.sink.pour(index)
+        self.joueurs = (joueur1, joueur2)
+        self.tours_max = tours_max
+        self.tour = 1
+        self.index_actif = 0
+
+    @property
+    def attaquant(self) -> Personnage:
+        return self.joueurs[self.index_actif]
+
+    @property
+    def defenseur(self) -> Personnage:
+        return self.joueurs[1 - self.index_actif]
+
+    @property
+    def termine(self) -> bool:
+        """Vérifie si le combat est terminé (KO ou limite de tours)"""
+        joueur1, joueur2 = self.joueurs
+        return not (joueur1.is_alive and joueur2.is_alive) or self.tour > self.tours_max
+
+    @property
+    def vainqueur(self) -> Optional[Personnage]:
+        """Retourne le vainqueur, ou None si le combat est nul ou en cours"""
+        joueur1, joueur2 = self.joueurs
+        if joueur1.is_alive and not joueur2.is_alive:
+            return joueur1
+        if joueur2.is_alive and not joueur1.is_alive:
+            return joueur2
+        return None
+
+    def debut_tour(self) -> List[Competence]:
+        """
+        Démarre le tour de l'attaquant
+
+        Returns:
+            Liste des compétences utilisables (vide si le défenseur est KO)
+        """
+        attaquant = self.attaquant
+        joueur1, joueur2 = self.joueurs
+        attaquant.sink.emettre(TypeEvenement.TOUR, attaquant.nom, self.tour,
+                               joueur1.current_hp, joueur1.current_mp, joueur2.current_hp, joueur2.current_mp)
+        attaquant.start_turn(self.defenseur)
+
+        if not self.defenseur.is_alive:
+            return []
+
+        return [s for s in attaquant.skills if attaquant.can_use_skill(s)]
+
+    def jouer(self, skill: Optional[Competence]):
+        """
+        Termine le tour de l'attaquant avec la compétence choisie
+
+        Args:
+            skill: Compétence à utiliser, ou None pour passer le tour
+        """
+        attaquant = self.attaquant
+        if skill is not None and self.defenseur.is_alive:
+            attaquant.use_skill(skill, self.defenseur)
+        attaquant.end_turn()
+
+        self.tour += 1
+        self.index_actif = 1 - self.index_actif
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture l'état complet du combat: personnages, tour en cours et générateur aléatoire
+
+        Returns:
+            État immuable, à passer à restore()
+        """
+        joueur1, joueur2 = self.joueurs
+        return (self.tour, self.index_actif, joueur1.snapshot(), joueur2.snapshot(), self.rng.etat())
+
+    def restore(self, etat: Tuple):
+        """Restaure un état obtenu avec snapshot() sur ce même combat"""
+        self.tour, self.index_actif, etat1, etat2, etat_rng = etat
+        joueur1, joueur2 = self.joueurs
+        joueur1.restore(etat1)
+        joueur2.restore(etat2)
+        self.rng.restaurer(etat_rng)
+
+    def cle_etat(self) -> Tuple:
+        """
+        Clé canonique de la position, vue du joueur qui doit jouer
+
+        Le numéro du tour et l'état du générateur aléatoire n'en font pas partie.
+        """
+        return (self.attaquant.cle_etat(), self.defenseur.cle_etat())
+
+    def cloner(self) -> 'Combat':
+        """Retourne un combat indépendant dans le même état (compétences partagées)"""
+        joueur1, joueur2 = (joueur.cloner() for joueur in self.joueurs)
+        combat = Combat(joueur1, joueur2, self.tours_max, self.rng.cloner())
+        combat.tour = self.tour
+        combat.index_actif = self.index_actif
+        return combat
+
+    def donnees_sauvegarde(self, mode: str, journal: Optional[SinkJournal] = None) -> Dict:
+        """
+        Construit les données de sauvegarde du combat terminé
+
+        Args:
+            mode: Mode de jeu ('PvE', 'Auto', ...)
+            journal: Journal des événements à inclure pour le replay
+
+        Returns:
+            Dictionnaire prêt à être passé à SaveManager.save_game
+        """
+        joueur1, joueur2 = self.joueurs
+        vainqueur = self.vainqueur
+        index_vainqueur = None if vainqueur is None else self.joueurs.index(vainqueur)
+        perdant = None if vainqueur is None else self.joueurs[1 - index_vainqueur]
+
+        donnees = {
+            'mode': mode,
+            'seed': self.rng.seed,
+            'vainqueur': vainqueur.nom if vainqueur else None,
+            'index_vainqueur': index_vainqueur,  # 0 ou 1 (les noms peuvent être homonymes), None si nul
+            'perdant': perdant.nom if perdant else None,
+            'nombre_tours': self.tour - 1,
+            'joueur1': {'nom': joueur1.nom, 'classe': getattr(joueur1, 'classe', type(joueur1).__name__)},
+            'joueur2': {'nom': joueur2.nom, 'classe': getattr(joueur2, 'classe', type(joueur2).__name__)},
+            'joueur1_final': joueur1.get_final_stats(),
+            'joueur2_final': joueur2.get_final_stats()
+        }
+        if journal is not None:
+            donnees['journal'] = journal.to_dict()
+        return donnees
+
+
+def simulate_battle(class_a: str, class_b: str, seed: Optional[int] = None,
+                    difficulty: str = 'normal', tours_max: int = TOURS_MAX,
+                    journal: bool = False,
+                    definitions: Optional[Dict[str, DefinitionPersonnage]] = None,
+                    politiques: Optional[Tuple[Politique, Politique]] = None) -> Dict:
+    """
+    Simule un combat complet IA vs IA sans aucune entrée/sortie terminal
+
+    Args:
+        class_a: Classe du joueur 1 ('sage' ou 'magicien'), qui joue en premier
+        class_b: Classe du joueur 2
+        seed: Graine aléatoire du combat (None pour en tirer une au hasard)
+        difficulty: Niveau de difficulté des deux IA
+        tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+        journal: Enregistre le flux d'événements du combat dans le résultat
+        definitions: Définitions à utiliser à la place de celles du registre, par identifiant de classe
+        politiques: Politiques des IA des joueurs 1 et 2 (difficulty est alors ignoré)
+
+    Returns:
+        Dictionnaire décrivant le résultat du combat
+    """
+    rng = Aleatoire(seed)
+    definitions = definitions or {}
+    joueur1 = CLASSES[class_a](f"IA-{class_a.title()}-1", definitions.get(class_a) or REGISTRE.definition(class_a))
+    joueur2 = CLASSES[class_b](f"IA-{class_b.title()}-2", definitions.get(class_b) or REGISTRE.definition(class_b))
+    sink_journal = SinkJournal((joueur1.nom, joueur2.nom)) if journal else None
+    joueur1.sink = joueur2.sink = sink_journal or SINK_NUL
+    joueur1.rng = joueur2.rng = rng
+    if politiques is None:
+        ias = (AIPlayer(joueur1, difficulte=difficulty), AIPlayer(joueur2, difficulte=difficulty))
+    else:
+        ias = (politiques[0].creer(joueur1), politiques[1].creer(joueur2))
+
+    combat = Combat(joueur1, joueur2, tours_max, rng)
+    while not combat.termine:
+        ia = ias[combat.index_actif]
+        available_skills = combat.debut_tour()
+        skill = ia.choose_skill(available_skills, combat.defenseur) if available_skills else None
+        combat.jouer(skill)
+
+    vainqueur = combat.vainqueur
+    classes = (class_a, class_b)
+
+    resultat = {
+        'vainqueur': vainqueur.nom if vainqueur else None,
+        'classe_vainqueur': classes[combat.joueurs.index(vainqueur)] if vainqueur else None,
+        'tours': combat.tour - 1,
+        'seed': rng.seed,
+        'difficulte': difficulty,
+        'joueur1': dict(joueur1.get_final_stats(), classe=class_a, nom=joueur1.nom),
+        'joueur2': dict(joueur2.get_final_stats(), classe=class_b, nom=joueur2.nom)
+    }
+    if politiques is not None:
+        resultat['politiques'] = [politique.nom for politique in politiques]
+    if sink_journal is not None:
+        resultat['journal'] = sink_journal.to_dict()
+    return resultat
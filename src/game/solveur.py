@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module du solveur exact - Probabilités de victoire par programmation dynamique
+
+Au lieu d'échantillonner des combats, le solveur suit la distribution exacte
+des positions tour par tour sous la politique de AIPlayer. Chaque tirage
+aléatoire (coup critique, décision de l'IA, choix de familier) devient un
+embranchement pondéré par sa probabilité, et les positions de même clé
+canonique (Personnage.cle_etat) atteintes au même tour sont fusionnées :
+chacune n'est jouée qu'une fois, quel que soit le nombre de chemins qui y
+mènent.
+
+Les règles ne sont pas réécrites : chaque embranchement rejoue le vrai tour
+de jeu avec un générateur qui impose la suite de tirages à suivre.
+
+Le nombre de positions croît vite avec la longueur du combat. Au-delà du
+budget de positions, ou sous le seuil de probabilité, la masse non résolue
+est comptée à part : les probabilités retournées sont alors des bornes
+exactes (le résultat vrai est dans l'intervalle).
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.ai.ai_player import AIPlayer
+from src.game.simulation import CLASSES, TOURS_MAX, Combat
+from src.models.aleatoire import Aleatoire
+from src.models.evenements import SINK_NUL
+from src.models.registre import REGISTRE
+
+
+# Nombre maximal de positions distinctes dans un tour avant d'abandonner la résolution
+ETATS_MAX = 50_000
+
+# Difficultés dont la politique ne dépend que de la position (pas du temps de réflexion)
+DIFFICULTES = ('facile', 'normal', 'difficile')
+
+
+class AleatoireEnumere(Aleatoire):
+    """
+    Générateur qui impose une suite de tirages et note les embranchements rencontrés
+
+    Chaque tirage est identifié par l'index de l'issue retenue parmi ses
+    issues possibles ; les tirages au-delà de la suite imposée prennent la
+    première issue de probabilité non nulle.
+    """
+
+    def __init__(self):
+        self.seed = None
+        self.imposes: Sequence[int] = ()
+        self.issues: List[int] = []
+        self.probabilites: List[Tuple[float, ...]] = []
+
+    def rejouer(self, imposes: Sequence[int]):
+        """Prépare une nouvelle branche qui commence par les tirages imposés"""
+        self.imposes = imposes
+        self.issues = []
+        self.probabilites = []
+
+    def __tirer(self, probabilites: Tuple[float, ...]) -> int:
+        rang = len(self.issues)
+        if rang < len(self.imposes):
+            issue = self.imposes[rang]
+        else:
+            issue = next(i for i, p in enumerate(probabilites) if p > 0)
+        self.issues.append(issue)
+        self.probabilites.append(probabilites)
+        return issue
+
+    def chance(self, probabilite: float) -> bool:
+        probabilite = min(max(probabilite, 0.0), 1.0)
+        return self.__tirer((probabilite, 1.0 - probabilite)) == 0
+
+    def choix(self, sequence: Sequence):
+        n = len(sequence)
+        return sequence[self.__tirer((1.0 / n,) * n)]
+
+    def probabilite_branche(self) -> float:
+        """Probabilité de la suite de tirages de la branche jouée"""
+        probabilite = 1.0
+        for issue, probabilites in zip(self.issues, self.probabilites):
+            probabilite *= probabilites[issue]
+        return probabilite
+
+    def branche_suivante(self) -> Optional[Tuple[int, ...]]:
+        """Tirages imposés de la branche suivante (ordre lexicographique), None après la dernière"""
+        for rang in range(len(self.issues) - 1, -1, -1):
+            probabilites = self.probabilites[rang]
+            for issue in range(self.issues[rang] + 1, len(probabilites)):
+                if probabilites[issue] > 0:
+                    return tuple(self.issues[:rang]) + (issue,)
+        return None
+
+    def etat(self) -> tuple:
+        """Position dans la branche: tirages imposés, issues déjà tirées et leurs probabilités"""
+        return tuple(self.imposes), tuple(self.issues), tuple(self.probabilites)
+
+    def restaurer(self, etat: tuple):
+        imposes, issues, probabilites = etat
+        self.imposes = imposes
+        self.issues = list(issues)
+        self.probabilites = list(probabilites)
+
+    def cloner(self) -> 'AleatoireEnumere':
+        clone = AleatoireEnumere()
+        clone.restaurer(self.etat())
+        return clone
+
+
+class ResultatSolveur:
+    """Distribution exacte des issues d'un combat (ou ses bornes si elle n'est pas entièrement résolue)"""
+
+    def __init__(self, classes: Tuple[str, str], difficulte: str):
+        self.classes = classes
+        self.difficulte = difficulte
+        self.victoires = [0.0, 0.0]  # Probabilité de victoire de chaque joueur
+        self.nuls = 0.0  # Probabilité d'atteindre la limite de tours
+        self.non_resolu = 0.0  # Masse abandonnée (budget dépassé ou sous le seuil)
+        self.esperance_tours = 0.0  # Somme des tours * probabilité (tour minimal pour la masse non résolue)
+        self.tours_resolus = 0  # Dernier tour entièrement résolu
+
+        # Statistiques de la résolution
+        self.etats = 0  # Positions distinctes jouées (taille cumulée de la table)
+        self.etats_max_tour = 0  # Plus grande table d'un tour
+        self.branches = 0  # Tours de jeu rejoués
+        self.temps = 0.0  # Secondes
+
+    @property
+    def complet(self) -> bool:
+        return self.non_resolu == 0.0
+
+    def intervalle_victoire(self, joueur: int) -> Tuple[float, float]:
+        """Bornes exactes de la probabilité de victoire d'un joueur (0 ou 1)"""
+        return self.victoires[joueur], min(1.0, self.victoires[joueur] + self.non_resolu)
+
+    @property
+    def tours_moyen(self) -> float:
+        """Espérance du nombre de tours (borne inférieure si le combat n'est pas entièrement résolu)"""
+        return self.esperance_tours
+
+    def to_dict(self) -> Dict:
+        """Résultat sérialisable en JSON"""
+        return {
+            'classes': list(self.classes),
+            'difficulte': self.difficulte,
+            'complet': self.complet,
+            'victoires': [
+                dict(zip(('classe', 'min', 'max'), (classe,) + self.intervalle_victoire(index)))
+                for index, classe in enumerate(self.classes)
+            ],
+            'nuls': self.nuls,
+            'non_resolu': self.non_resolu,
+            'tours_moyen': self.tours_moyen,
+            'tours_resolus': self.tours_resolus,
+            'etats': self.etats,
+            'etats_max_tour': self.etats_max_tour,
+            'branches': self.branches,
+            'temps': self.temps
+        }
+
+    def afficher(self):
+        """Affiche le résultat de la résolution"""
+        print("\n" + "="*70)
+        print("🧮 RÉSOLUTION EXACTE")
+        print("="*70)
+        print(f"\n⚔️  {self.classes[0].title()} (joue en premier) vs {self.classes[1].title()}"
+              f" - IA {self.difficulte}")
+
+        print("\n🏆 PROBABILITÉ DE VICTOIRE :")
+        for index, classe in enumerate(self.classes):
+            minimum, maximum = self.intervalle_victoire(index)
+            libelle = f"J{index + 1} {classe.title()}"
+            if self.complet:
+                print(f"   {libelle:<13} {minimum:.6%}")
+            else:
+                print(f"   {libelle:<13} entre {minimum:.6%} et {maximum:.6%}")
+        print(f"   {'Nul':<13} {self.nuls:.6%}")
+
+        prefixe = "" if self.complet else "≥ "
+        print(f"\n⏱️  TOURS : espérance {prefixe}{self.tours_moyen:.3f}")
+        if not self.complet:
+            print(f"   ⚠️  Masse non résolue : {self.non_resolu:.6%} (résolu jusqu'au tour {self.tours_resolus})")
+
+        print(f"\n📐 TABLE : {self.etats:,} positions ({self.etats_max_tour:,} au plus dans un tour), "
+              f"{self.branches:,} branches en {self.temps:.2f}s")
+        print("\n" + "="*70 + "\n")
+
+
+class SolveurExact:
+    """Calcule la distribution exacte des issues d'un combat IA vs IA"""
+
+    def __init__(self, class_a: str, class_b: str, difficulte: str = 'normal', tours_max: int = TOURS_MAX,
+                 etats_max: int = ETATS_MAX, seuil: float = 0.0, temps_max: Optional[float] = None):
+        """
+        Args:
+            class_a: Classe du joueur 1, qui joue en premier
+            class_b: Classe du joueur 2
+            difficulte: Niveau de difficulté des deux IA ('facile', 'normal', 'difficile')
+            tours_max: Nombre de tours au-delà duquel le combat est déclaré nul
+            etats_max: Nombre maximal de positions distinctes dans un tour
+            seuil: Probabilité en dessous de laquelle une position est abandonnée (0 pour tout garder)
+            temps_max: Durée maximale de la résolution en secondes, vérifiée à chaque tour (None: sans limite)
+        """
+        if difficulte not in DIFFICULTES:
+            raise ValueError(f"Difficulté non résoluble : {difficulte} (attendu : {', '.join(DIFFICULTES)})")
+        self.classes = (class_a, class_b)
+        self.difficulte = difficulte
+        self.tours_max = tours_max
+        self.etats_max = etats_max
+        self.seuil = seuil
+        self.temps_max = temps_max
+
+        # Combat de travail, rejoué pour chaque branche
+        self.rng = AleatoireEnumere()
+        joueurs = [CLASSES[classe](f"IA-{classe.title()}-{index + 1}", REGISTRE.definition(classe))
+                   for index, classe in enumerate(self.classes)]
+        for joueur in joueurs:
+            joueur.sink = SINK_NUL
+        self.combat = Combat(joueurs[0], joueurs[1], tours_max, self.rng)
+        self.ias = tuple(AIPlayer(joueur, difficulte, rng=self.rng) for joueur in joueurs)
+        self.__depart = tuple(joueur.snapshot() for joueur in joueurs)
+
+    def resoudre(self, combat: Optional[Combat] = None,
+                 agressives: Optional[Tuple[bool, bool]] = None) -> ResultatSolveur:
+        """
+        Résout le combat depuis le début ou depuis une position donnée
+
+        Args:
+            combat: Position de départ (None pour un nouveau combat), qui n'est pas modifiée
+            agressives: Stratégie agressive de chaque IA (None pour les deux tirages à 50%)
+
+        Returns:
+            Le résultat, exact si complet, sinon sous forme de bornes
+        """
+        debut = time.perf_counter()
+        resultat = ResultatSolveur(self.classes, self.difficulte)
+        joueurs = self.combat.joueurs
+
+        if combat is not None:
+            for joueur, depart in zip(joueurs, combat.joueurs):
+                joueur.restore(depart.snapshot())
+            tour, actif = combat.tour, combat.index_actif
+        else:
+            for joueur, etat in zip(joueurs, self.__depart):
+                joueur.restore(etat)
+            tour, actif = 1, 0
+
+        options = [agressives] if agressives is not None else \
+            [(a, b) for a in (True, False) for b in (True, False)]
+        positions = {}
+        for strategies in options:
+            self.__ajouter(positions, strategies, 1.0 / len(options), tour, resultat)
+
+        while positions and tour <= self.tours_max:
+            ecoule = time.perf_counter() - debut
+            if len(positions) > self.etats_max or (self.temps_max is not None and ecoule > self.temps_max):
+                masse = sum(position[0] for position in positions.values())
+                resultat.non_resolu += masse
+                resultat.esperance_tours += masse * tour
+                positions = {}
+                break
+
+            resultat.etats += len(positions)
+            resultat.etats_max_tour = max(resultat.etats_max_tour, len(positions))
+            suivantes = {}
+            for probabilite, etats, strategies in positions.values():
+                self.__jouer_tour(tour, actif, probabilite, etats, strategies, suivantes, resultat)
+
+            positions = suivantes
+            resultat.tours_resolus = tour
+            tour += 1
+            actif = 1 - actif
+
+        # Positions encore en jeu à la limite de tours: combats nuls
+        masse = sum(position[0] for position in positions.values())
+        resultat.nuls += masse
+        resultat.esperance_tours += masse * self.tours_max
+        resultat.temps = time.perf_counter() - debut
+        return resultat
+
+    def __ajouter(self, positions: Dict, strategies: Tuple[bool, bool], probabilite: float, tour: int,
+                  resultat: ResultatSolveur):
+        """Ajoute la position courante du combat de travail à la table du tour à jouer"""
+        if probabilite < self.seuil:
+            resultat.non_resolu += probabilite
+            resultat.esperance_tours += probabilite * tour
+            return
+
+        joueur1, joueur2 = self.combat.joueurs
+        cle = (strategies, joueur1.cle_etat(), joueur2.cle_etat())
+        position = positions.get(cle)
+        if position is None:
+            positions[cle] = [probabilite, (joueur1.snapshot(), joueur2.snapshot()), strategies]
+        else:
+            position[0] += probabilite
+
+    def __jouer_tour(self, tour: int, actif: int, probabilite: float, etats: Tuple, strategies: Tuple[bool, bool],
+                     suivantes: Dict, resultat: ResultatSolveur):
+        """Joue toutes les branches d'un tour depuis une position"""
+        combat, rng = self.combat, self.rng
+        joueur1, joueur2 = combat.joueurs
+        ia = self.ias[actif]
+        imposes = ()
+
+        while imposes is not None:
+            joueur1.restore(etats[0])
+            joueur2.restore(etats[1])
+            self.ias[0].strategie_agressive, self.ias[1].strategie_agressive = strategies
+            combat.tour, combat.index_actif = tour, actif
+            rng.rejouer(imposes)
+
+            skills = combat.debut_tour()
+            skill = ia.choose_skill(skills, combat.defenseur) if skills else None
+            combat.jouer(skill)
+            resultat.branches += 1
+
+            probabilite_branche = probabilite * rng.probabilite_branche()
+            if joueur1.is_alive and joueur2.is_alive:
+                self.__ajouter(suivantes, strategies, probabilite_branche, tour + 1, resultat)
+            else:
+                resultat.victoires[0 if joueur1.is_alive else 1] += probabilite_branche
+                resultat.esperance_tours += probabilite_branche * tour
+
+            imposes = rng.branche_suivante()
+
+
+def position_apres(class_a: str, class_b: str, seed: int, tours: int,
+                   difficulte: str = 'normal') -> Tuple[Combat, Tuple[bool, bool]]:
+    """
+    Joue les premiers tours d'un combat seedé (comme simulate_battle) pour en résoudre la fin
+
+    Args:
+        class_a: Classe du joueur 1
+        class_b: Classe du joueur 2
+        seed: Graine du combat
+        tours: Nombre de tours joués avant de s'arrêter
+        difficulte: Niveau de difficulté des deux IA
+
+    Returns:
+        Le combat arrêté et la stratégie agressive de chaque IA, à passer à SolveurExact.resoudre
+    """
+    rng = Aleatoire(seed)
+    joueur1 = CLASSES[class_a](f"IA-{class_a.title()}-1", REGISTRE.definition(class_a))
+    joueur2 = CLASSES[class_b](f"IA-{class_b.title()}-2", REGISTRE.definition(class_b))
+    joueur1.sink = joueur2.sink = SINK_NUL
+    joueur1.rng = joueur2.rng = rng
+    ias = (AIPlayer(joueur1, difficulte=difficulte), AIPlayer(joueur2, difficulte=difficulte))
+
+    combat = Combat(joueur1, joueur2, rng=rng)
+    while not combat.termine and combat.tour <= tours:
+        skills = combat.debut_tour()
+        skill = ias[combat.index_actif].choose_skill(skills, combat.defenseur) if skills else None
+        combat.jouer(skill)
+    return combat, (ias[0].strategie_agressive, ias[1].strategie_agressive)
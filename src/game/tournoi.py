@@ -0,0 +1,413 @@
+"""
+Module des tournois - Classement Elo des politiques d'IA
+
+Chaque paire de politiques s'affronte sur les deux attributions de classes
+et K graines (le joueur qui commence alterne d'une graine à l'autre). Les
+rencontres sont réparties sur un pool de processus.
+
+Les résultats sont gardés dans un fichier de reprise, réécrit au fil du
+tournoi et indexé par l'empreinte de la configuration (version du moteur,
+contenu des configs, politiques, graines): un tournoi interrompu reprend là
+où il s'était arrêté, et un tournoi qui partage des rencontres avec un
+précédent ne les rejoue pas.
+
+Le classement est l'estimation du maximum de vraisemblance du modèle de
+Bradley-Terry sur l'échelle Elo (un nul compte pour une demi-victoire), avec
+des intervalles de confiance tirés de l'information de Fisher.
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+from itertools import combinations
+from multiprocessing import Pool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.ai.politiques import Politique
+from src.game.monte_carlo import _initialiser_worker
+from src.game.simulation import TOURS_MAX, VERSION_MOTEUR, simulate_battle
+from src.models.registre import REGISTRE
+
+
+# Classement moyen des politiques
+ELO_BASE = 1500
+
+# Points Elo par unité de log-force du modèle de Bradley-Terry
+_ECHELLE_ELO = 400 / math.log(10)
+
+# Quantile normal des intervalles de confiance à 95%
+Z_CONFIANCE = 1.96
+
+# Nuls fictifs ajoutés à chaque paire: un score parfait garde un classement fini
+NULS_A_PRIORI = 1
+
+# Combats au plus par tâche envoyée à un worker (granularité de la reprise)
+TAILLE_LOT = 50
+
+# Délai minimal entre deux écritures du fichier de reprise (secondes)
+INTERVALLE_SAUVEGARDE = 2.0
+
+# Version du format du fichier de reprise
+VERSION_REPRISE = 1
+
+# Tâche: (clé, politiques (i, j), classes (de i, de j), première graine, graine de fin, tours max)
+Tache = Tuple[str, Tuple[Politique, Politique], Tuple[str, str], int, int, int]
+
+
+def _jouer_rencontres(tache: Tache) -> Tuple[str, List[int]]:
+    """
+    Joue un lot de combats entre deux politiques
+
+    Returns:
+        La clé de la tâche et [victoires de i, victoires de j, nuls, total des tours]
+    """
+    cle, (politique_i, politique_j), (classe_i, classe_j), debut, fin, tours_max = tache
+    compteurs = [0, 0, 0, 0]
+
+    for seed in range(debut, fin):
+        # Graine paire: i joue en premier, impaire: j joue en premier
+        premier = seed % 2
+        politiques = (politique_i, politique_j) if not premier else (politique_j, politique_i)
+        classes = (classe_i, classe_j) if not premier else (classe_j, classe_i)
+        resultat = simulate_battle(classes[0], classes[1], seed, tours_max=tours_max, politiques=politiques)
+
+        vainqueur = resultat['vainqueur']
+        if vainqueur is None:
+            compteurs[2] += 1
+        else:
+            joueur = 0 if vainqueur == resultat['joueur1']['nom'] else 1
+            compteurs[joueur ^ premier] += 1
+        compteurs[3] += resultat['tours']
+
+    return cle, compteurs
+
+
+def _inverser(matrice: List[List[float]]) -> List[List[float]]:
+    """Inverse une petite matrice carrée par élimination de Gauss-Jordan (pivot partiel)"""
+    n = len(matrice)
+    lignes = [list(ligne) + [1.0 if i == j else 0.0 for j in range(n)] for i, ligne in enumerate(matrice)]
+
+    for colonne in range(n):
+        pivot = max(range(colonne, n), key=lambda i: abs(lignes[i][colonne]))
+        if abs(lignes[pivot][colonne]) < 1e-12:
+            raise ValueError("Matrice singulière")
+        lignes[colonne], lignes[pivot] = lignes[pivot], lignes[colonne]
+
+        facteur = lignes[colonne][colonne]
+        lignes[colonne] = [valeur / facteur for valeur in lignes[colonne]]
+        for i in range(n):
+            if i != colonne and lignes[i][colonne]:
+                coefficient = lignes[i][colonne]
+                lignes[i] = [a - coefficient * b for a, b in zip(lignes[i], lignes[colonne])]
+
+    return [ligne[n:] for ligne in lignes]
+
+
+def classement_elo(noms: Sequence[str], scores: Dict[Tuple[int, int], Tuple[float, float]],
+                   nuls_a_priori: float = NULS_A_PRIORI,
+                   iterations_max: int = 10000) -> Tuple[List[float], List[float]]:
+    """
+    Estime les classements Elo par maximum de vraisemblance (Bradley-Terry)
+
+    Args:
+        noms: Noms des politiques (seul leur nombre compte)
+        scores: (i, j) avec i < j -> (points de i, nombre de parties), un nul valant un demi-point
+        nuls_a_priori: Nuls fictifs ajoutés à chaque paire qui a joué
+        iterations_max: Nombre maximal d'itérations de l'algorithme MM
+
+    Returns:
+        Les classements Elo (moyenne ELO_BASE) et leurs écarts-types
+    """
+    n = len(noms)
+    parties = [[0.0] * n for _ in range(n)]
+    points = [0.0] * n
+    for (i, j), (points_i, nombre) in scores.items():
+        if not nombre:
+            continue
+        parties[i][j] = parties[j][i] = nombre + nuls_a_priori
+        points[i] += points_i + nuls_a_priori / 2
+        points[j] += nombre - points_i + nuls_a_priori / 2
+
+    # Algorithme MM de Hunter: convergence monotone vers le maximum de vraisemblance
+    forces = [1.0] * n
+    for _ in range(iterations_max):
+        nouvelles = []
+        for i in range(n):
+            denominateur = sum(parties[i][j] / (forces[i] + forces[j]) for j in range(n) if parties[i][j])
+            nouvelles.append(points[i] / denominateur if denominateur else forces[i])
+        echelle = math.exp(sum(math.log(force) for force in nouvelles) / n)
+        nouvelles = [force / echelle for force in nouvelles]
+        ecart = max(abs(math.log(a / b)) for a, b in zip(nouvelles, forces))
+        forces = nouvelles
+        if ecart < 1e-10:
+            break
+    log_forces = [math.log(force) for force in forces]
+
+    # Information de Fisher: Laplacien pondéré, inversé sur le sous-espace de somme nulle
+    information = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and parties[i][j]:
+                p = forces[i] / (forces[i] + forces[j])
+                poids = parties[i][j] * p * (1 - p)
+                information[i][j] -= poids
+                information[i][i] += poids
+    try:
+        covariance = _inverser([[valeur + 1 / n for valeur in ligne] for ligne in information])
+        ecarts = [_ECHELLE_ELO * math.sqrt(max(0.0, covariance[i][i] - 1 / n)) for i in range(n)]
+    except ValueError:
+        # Politiques qui n'ont jamais joué les unes contre les autres: incertitude non bornée
+        ecarts = [math.inf] * n
+
+    return [ELO_BASE + _ECHELLE_ELO * log_force for log_force in log_forces], ecarts
+
+
+class ResultatTournoi:
+    """Classement d'un tournoi et résultats de chaque paire de politiques"""
+
+    def __init__(self, noms: Sequence[str], classes: Tuple[str, str], graines: int):
+        self.noms = list(noms)
+        self.classes = classes
+        self.graines = graines
+        self.victoires = [[0] * len(noms) for _ in noms]  # victoires[i][j]: victoires de i contre j
+        self.nuls = [[0] * len(noms) for _ in noms]
+        self.tours_total = 0
+        self.combats_simules = 0
+        self.combats_repris = 0
+        self.temps = 0.0
+        self.elo: List[float] = []
+        self.ecarts: List[float] = []
+
+    def ajouter(self, i: int, j: int, compteurs: Sequence[int], repris: bool = False):
+        """Ajoute le résultat d'une tâche ([victoires de i, victoires de j, nuls, total des tours])"""
+        victoires_i, victoires_j, nuls, tours = compteurs
+        self.victoires[i][j] += victoires_i
+        self.victoires[j][i] += victoires_j
+        self.nuls[i][j] += nuls
+        self.nuls[j][i] += nuls
+        self.tours_total += tours
+        if repris:
+            self.combats_repris += victoires_i + victoires_j + nuls
+        else:
+            self.combats_simules += victoires_i + victoires_j + nuls
+
+    @property
+    def parties(self) -> int:
+        return self.combats_simules + self.combats_repris
+
+    def parties_de(self, i: int) -> int:
+        return sum(self.victoires[i]) + sum(self.victoires[j][i] for j in range(len(self.noms))) + sum(self.nuls[i])
+
+    def score(self, i: int) -> float:
+        """Fraction des points marqués par une politique (un nul vaut un demi-point)"""
+        parties = self.parties_de(i)
+        return (sum(self.victoires[i]) + sum(self.nuls[i]) / 2) / parties if parties else 0.0
+
+    def calculer_classement(self):
+        """Estime les classements Elo à partir des résultats accumulés"""
+        scores = {}
+        for i, j in combinations(range(len(self.noms)), 2):
+            parties = self.victoires[i][j] + self.victoires[j][i] + self.nuls[i][j]
+            scores[(i, j)] = (self.victoires[i][j] + self.nuls[i][j] / 2, parties)
+        self.elo, self.ecarts = classement_elo(self.noms, scores)
+
+    def ordre(self) -> List[int]:
+        """Index des politiques, de la mieux classée à la moins bien classée"""
+        return sorted(range(len(self.noms)), key=lambda i: -self.elo[i])
+
+    def to_dict(self) -> Dict:
+        """Retourne le classement sous forme sérialisable"""
+        return {
+            'classes': list(self.classes),
+            'graines': self.graines,
+            'parties': self.parties,
+            'combats_simules': self.combats_simules,
+            'combats_repris': self.combats_repris,
+            'tours_moyen': self.tours_total / self.parties if self.parties else 0.0,
+            'temps': self.temps,
+            'classement': [
+                {
+                    'politique': self.noms[i],
+                    'elo': self.elo[i],
+                    'ecart_type': self.ecarts[i],
+                    'min': self.elo[i] - Z_CONFIANCE * self.ecarts[i],
+                    'max': self.elo[i] + Z_CONFIANCE * self.ecarts[i],
+                    'parties': self.parties_de(i),
+                    'score': self.score(i)
+                }
+                for i in self.ordre()
+            ],
+            'rencontres': [
+                {
+                    'politiques': [self.noms[i], self.noms[j]],
+                    'victoires': [self.victoires[i][j], self.victoires[j][i]],
+                    'nuls': self.nuls[i][j]
+                }
+                for i, j in combinations(range(len(self.noms)), 2)
+            ]
+        }
+
+    def afficher(self):
+        """Affiche le classement du tournoi"""
+        print("\n" + "="*70)
+        print("🏆 CLASSEMENT DU TOURNOI")
+        print("="*70)
+        print(f"\n🎲 {self.parties} combats {self.classes[0].title()} / {self.classes[1].title()} "
+              f"({self.combats_simules} simulés, {self.combats_repris} repris) en {self.temps:.1f}s")
+
+        print(f"\n   {'#':>2}  {'Politique':<22} {'Elo':>6}  {'IC 95%':>15}  {'Score':>7}")
+        for rang, i in enumerate(self.ordre(), 1):
+            marge = Z_CONFIANCE * self.ecarts[i]
+            print(f"   {rang:>2}  {self.noms[i]:<22} {self.elo[i]:6.0f}  "
+                  f"{self.elo[i] - marge:6.0f} - {self.elo[i] + marge:<6.0f}  {self.score(i):7.2%}")
+
+        print("\n" + "="*70 + "\n")
+
+
+class Tournoi:
+    """Tournoi toutes rondes entre politiques d'IA, reprenable après interruption"""
+
+    def __init__(self, politiques: Sequence[Politique], classes: Tuple[str, str] = ('sage', 'magicien'),
+                 graines: int = 100, seed_base: int = 0, tours_max: int = TOURS_MAX, workers: int = 1,
+                 fichier: Optional[str] = None):
+        """
+        Args:
+            politiques: Politiques classées (au moins deux, de noms distincts)
+            classes: Classes jouées: chaque paire les joue dans les deux attributions
+            graines: Combats par paire et par attribution des classes
+            seed_base: Graine du premier combat de chaque rencontre
+            tours_max: Nombre de tours au-delà duquel un combat est déclaré nul
+            workers: Nombre de processus (1 pour tout jouer dans le processus courant)
+            fichier: Fichier de reprise (None pour ne rien garder)
+
+        Raises:
+            ValueError: Si moins de deux politiques sont données, ou deux fois la même
+        """
+        noms = [politique.nom for politique in politiques]
+        if len(noms) < 2:
+            raise ValueError("Un tournoi demande au moins deux politiques")
+        if len(set(noms)) != len(noms):
+            raise ValueError("Chaque politique ne peut participer qu'une fois")
+
+        self.politiques = list(politiques)
+        self.classes = tuple(classes)
+        self.graines = graines
+        self.seed_base = seed_base
+        self.tours_max = tours_max
+        self.workers = workers
+        self.fichier = fichier
+
+    def empreinte(self) -> str:
+        """Empreinte de ce qui détermine l'issue d'un combat, hors politiques et graine"""
+        contenu = [VERSION_MOTEUR, self.tours_max]
+        contenu += [REGISTRE.definition(classe).empreinte for classe in sorted(set(self.classes))]
+        return hashlib.sha256(json.dumps(contenu).encode('utf-8')).hexdigest()[:16]
+
+    def taches(self) -> List[Tuple[int, int, Tache]]:
+        """Toutes les tâches du tournoi: (index de i, index de j, tâche)"""
+        empreinte = self.empreinte()
+        attributions = [self.classes] if self.classes[0] == self.classes[1] else [
+            self.classes, self.classes[::-1]]
+        fin = self.seed_base + self.graines
+
+        taches = []
+        for i, j in combinations(range(len(self.politiques)), 2):
+            politiques = (self.politiques[i], self.politiques[j])
+            for classes in attributions:
+                for debut in range(self.seed_base, fin, TAILLE_LOT):
+                    lot = (debut, min(debut + TAILLE_LOT, fin))
+                    cle = '|'.join([empreinte, politiques[0].description, politiques[1].description,
+                                    *classes, f'{lot[0]}-{lot[1]}'])
+                    taches.append((i, j, (cle, politiques, classes, *lot, self.tours_max)))
+        return taches
+
+    def lancer(self, progression: Optional[Callable[[int, int], None]] = None) -> ResultatTournoi:
+        """
+        Joue les rencontres qui ne sont pas déjà dans le fichier de reprise, puis classe les politiques
+
+        Args:
+            progression: Fonction appelée avec (combats joués ou repris, combats au total) après chaque tâche
+
+        Returns:
+            Le résultat du tournoi, classement calculé
+        """
+        debut = time.perf_counter()
+        resultats = _charger_reprise(self.fichier)
+        resultat = ResultatTournoi([politique.nom for politique in self.politiques], self.classes, self.graines)
+        taches = self.taches()
+        total = sum(tache[4] - tache[3] for _, _, tache in taches)
+
+        index = {}
+        a_jouer = []
+        for i, j, tache in taches:
+            compteurs = resultats.get(tache[0])
+            if compteurs is None:
+                index[tache[0]] = (i, j)
+                a_jouer.append(tache)
+            else:
+                resultat.ajouter(i, j, compteurs, repris=True)
+
+        derniere_sauvegarde = time.perf_counter()
+        try:
+            for cle, compteurs in self.__jouer(a_jouer):
+                resultats[cle] = compteurs
+                resultat.ajouter(*index[cle], compteurs)
+                if progression:
+                    progression(resultat.parties, total)
+                if self.fichier and time.perf_counter() - derniere_sauvegarde >= INTERVALLE_SAUVEGARDE:
+                    _sauvegarder_reprise(self.fichier, resultats)
+                    derniere_sauvegarde = time.perf_counter()
+        finally:
+            # Même interrompu, le tournoi garde tout ce qui a été joué
+            if self.fichier and a_jouer:
+                _sauvegarder_reprise(self.fichier, resultats)
+
+        resultat.calculer_classement()
+        resultat.temps = time.perf_counter() - debut
+        return resultat
+
+    def __jouer(self, taches: List[Tache]):
+        """Joue les tâches, dans le processus courant ou sur un pool, au fil de l'eau"""
+        if not taches:
+            return
+
+        if self.workers <= 1:
+            surveiller = REGISTRE.surveiller
+            _initialiser_worker()
+            try:
+                yield from map(_jouer_rencontres, taches)
+            finally:
+                REGISTRE.surveiller = surveiller
+            return
+
+        with Pool(self.workers, initializer=_initialiser_worker) as pool:
+            yield from pool.imap_unordered(_jouer_rencontres, taches)
+
+
+def _charger_reprise(fichier: Optional[str]) -> Dict[str, List[int]]:
+    """
+    Lit les résultats d'un fichier de reprise (vide s'il n'existe pas)
+
+    Raises:
+        ValueError: Si le fichier n'est pas un fichier de reprise valide
+    """
+    if not fichier or not os.path.exists(fichier):
+        return {}
+    try:
+        with open(fichier, 'r', encoding='utf-8') as f:
+            donnees = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Fichier de reprise illisible : {fichier} ({e})") from e
+    if not isinstance(donnees, dict) or donnees.get('version') != VERSION_REPRISE:
+        raise ValueError(f"Fichier de reprise d'un format inconnu : {fichier}")
+    return donnees['resultats']
+
+
+def _sauvegarder_reprise(fichier: str, resultats: Dict[str, List[int]]):
+    """Réécrit le fichier de reprise de façon atomique (jamais à moitié écrit)"""
+    temporaire = f'{fichier}.{os.getpid()}.tmp'
+    with open(temporaire, 'w', encoding='utf-8') as f:
+        json.dump({'version': VERSION_REPRISE, 'resultats': resultats}, f, separators=(',', ':'))
+    os.replace(temporaire, fichier)
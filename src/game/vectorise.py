@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Module du moteur vectorisé - N combats IA vs IA simulés en parallèle avec NumPy
+
+Au lieu d'un objet Personnage par combattant, chaque camp stocke l'état de
+tous les combats dans des tableaux (PV, PM, cooldowns, totaux des effets...)
+et tous les combats avancent d'un tour à la fois par opérations masquées.
+Les expirations (effets, familiers, dégâts de zone) sont rangées dans des
+tampons circulaires indexés par le tour du camp, comme dans
+GestionnaireEffets.
+
+Les règles sont celles de personnage_v2 / magicien et la politique celle de
+AIPlayer ; les tirages aléatoires suivent les mêmes lois mais pas la même
+séquence : les résultats sont équivalents en distribution, pas combat par
+combat (voir comparer_moteurs).
+
+NumPy est une dépendance optionnelle: seul ce module en a besoin.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+from src.game.monte_carlo import RapportSimulation, lancer_simulation
+from src.game.simulation import CLASSES, TOURS_MAX
+from src.models.competence import TypeSkill
+from src.models.magicien import Magicien
+from src.models.registre import REGISTRE, DefinitionPersonnage
+
+
+# Stats d'effets qui influencent l'issue d'un combat (l'attaque n'entre dans aucun calcul de dégâts)
+DEFENSE, REDUCTION, CRITIQUE = range(3)
+_STATS_BUFF = {'defense': DEFENSE, 'reduction_degats': REDUCTION, 'bonus_crit': CRITIQUE}
+_STATS_DEBUFF = {'defense': DEFENSE, 'reduction_degats': REDUCTION}  # Le critique ne vient que des buffs
+
+_ATTAQUES = (TypeSkill.ATTAQUE_LEGERE, TypeSkill.ATTAQUE_MOYENNE, TypeSkill.ATTAQUE_LOURDE)
+_ATTAQUES_MOYENNES = (TypeSkill.ATTAQUE_MOYENNE, TypeSkill.ATTAQUE_LEGERE)
+
+# Régénération passive de PM au début de chaque tour
+REGEN_MP = 15
+
+# Nombre minimal de combats avant de compacter les tableaux des combats terminés
+_COMPACTAGE_MIN = 64
+
+
+def _verifier_numpy():
+    if np is None:
+        raise ImportError("Le moteur vectorisé nécessite NumPy (pip install numpy)")
+
+
+class _TableClasse:
+    """Compétences et stats d'une classe, converties en tableaux"""
+
+    def __init__(self, identifiant: str, definition: Optional[DefinitionPersonnage] = None):
+        type_personnage = CLASSES[identifiant]
+        if definition is None:
+            definition = REGISTRE.definition(identifiant)
+        self.identifiant = identifiant
+        self.skills = definition.competences(type_personnage)
+        self.noms = [skill.nom for skill in self.skills]
+
+        stats = definition.stats
+        self.hp_max = stats.get('hp_max', 500)
+        self.mp_max = stats.get('mp_max', 450)
+        self.defense_base = stats.get('defense', 300)
+
+        # Passif du Magicien: PM rendus à chaque invocation, et PM des buffs (Psyche)
+        self.invocateur = issubclass(type_personnage, Magicien)
+        self.passif_mp = definition.passif['valeur']
+
+        self.cout = np.array([skill.cout_mp for skill in self.skills])
+        self.code = np.array([skill.code_type for skill in self.skills])
+        self.degats_base = np.array([skill.degats_base for skill in self.skills], dtype=float)
+        self.zones = [uid for uid, skill in enumerate(self.skills) if skill.zone]
+
+    def masque(self, *codes: int):
+        """Masque (S, 1) des compétences dont le type est parmi codes"""
+        return np.isin(self.code, codes)[:, None]
+
+    def horizon(self) -> int:
+        """Plus longue échéance planifiée par une compétence de la classe, en tours"""
+        durees = [1]
+        for skill in self.skills:
+            durees += [duree + 1 for _, _, duree in skill.effets_buff + skill.effets_debuff]
+            durees += [familier[3] for familier in skill.familiers + (skill.familier, skill.auto_invocation)
+                       if familier]
+            if skill.zone:
+                durees.append(skill.zone[2] + 1)
+        return max(durees) + 1
+
+
+class _Camp:
+    """État d'un camp (joueur 1 ou 2) dans tous les combats du lot"""
+
+    def __init__(self, table: _TableClasse, n: int, horizon: int, rng):
+        self.table = table
+        self.horizon = horizon
+        self.tour = 0  # Nombre de débuts de tour joués (identique dans tous les combats)
+
+        self.hp = np.full(n, table.hp_max, dtype=np.int64)
+        self.mp = np.full(n, table.mp_max, dtype=np.int64)
+        self.cooldowns = np.zeros((len(table.skills), n), dtype=np.int64)
+        self.surcharge = np.zeros(n, dtype=bool)
+        self.agressive = rng.random(n) < 0.5  # Tirage fait par AIPlayer à sa création
+
+        # Totaux des effets actifs et montants qui expirent à chaque tour
+        self.totaux = np.zeros((3, n))
+        self.expirations = np.zeros((horizon, 3, n))
+
+        # Dégâts par tour des familiers actifs, et montants qui disparaissent à chaque tour
+        self.familiers = np.zeros(n, dtype=np.int64)
+        self.fin_familiers = np.zeros((horizon, n), dtype=np.int64)
+
+        # Dégâts de zone planifiés, et debuffs de zone à poser (un tampon par compétence de zone)
+        self.zones = np.zeros((horizon, n), dtype=np.int64)
+        self.debuffs_zone = {uid: np.zeros((horizon, n)) for uid in table.zones}
+
+        self.utilisations = np.zeros(len(table.skills), dtype=np.int64)
+
+    def garder(self, index):
+        """Ne garde que les combats d'index donnés"""
+        for nom in ('hp', 'mp', 'cooldowns', 'surcharge', 'agressive', 'totaux', 'expirations',
+                    'familiers', 'fin_familiers', 'zones'):
+            setattr(self, nom, getattr(self, nom)[..., index])
+        self.debuffs_zone = {uid: tampon[:, index] for uid, tampon in self.debuffs_zone.items()}
+
+    def ajouter_effet(self, stat: int, valeur, duree: int, index):
+        """Équivalent vectoriel de GestionnaireEffets.ajouter"""
+        self.totaux[stat, index] += valeur
+        self.expirations[(self.tour + max(duree, 0) + 1) % self.horizon, stat, index] += valeur
+
+    def ajouter_familier(self, degats: int, duree: int, index):
+        """Un familier attaque aux débuts des `duree` tours suivants"""
+        if duree > 0:
+            self.familiers[index] += degats
+            self.fin_familiers[(self.tour + duree) % self.horizon, index] += degats
+
+    def recevoir_degats(self, degats, index):
+        """Équivalent vectoriel de Personnage.recevoir_degats (avec défense)"""
+        defense = np.maximum(0, self.table.defense_base + self.totaux[DEFENSE, index])
+        reduction = self.totaux[REDUCTION, index]
+        reduction_percent = np.minimum(50, defense / 100 * 2)
+        degats_reduits = degats * (1 - reduction_percent / 100)
+        degats_reduits = np.where(reduction > 0, degats_reduits * (1 - reduction / 100), degats_reduits)
+        degats_finaux = np.maximum(1, np.trunc(degats_reduits)).astype(np.int64)
+        self.hp[index] = np.maximum(0, self.hp[index] - degats_finaux)
+
+    def gagner_mp(self, valeur: int, index):
+        self.mp[index] = np.minimum(self.mp[index] + valeur, self.table.mp_max)
+
+
+class MoteurVectorise:
+    """Simule des lots de combats IA vs IA avec les tableaux NumPy"""
+
+    def __init__(self, class_a: str, class_b: str, difficulte: str = 'normal', tours_max: int = TOURS_MAX,
+                 definitions: Optional[Dict[str, DefinitionPersonnage]] = None):
+        """
+        Args:
+            class_a: Classe du joueur 1, qui joue en premier dans tous les combats
+            class_b: Classe du joueur 2
+            difficulte: Niveau de difficulté des deux IA ('facile', 'normal', 'difficile')
+            tours_max: Nombre de tours au-delà duquel un combat est déclaré nul
+            definitions: Définitions à utiliser à la place de celles du registre, par identifiant de classe
+        """
+        _verifier_numpy()
+        if difficulte not in ('facile', 'normal', 'difficile'):
+            raise ValueError(f"Difficulté non vectorisée : {difficulte}")
+        definitions = definitions or {}
+        self.tables = tuple(_TableClasse(classe, definitions.get(classe)) for classe in (class_a, class_b))
+        self.difficulte = difficulte
+        self.tours_max = tours_max
+        self.horizon = max(table.horizon() for table in self.tables)
+
+    def simuler(self, parties: int, seed: Optional[int] = None) -> RapportSimulation:
+        """
+        Simule un lot de combats, tous en parallèle
+
+        Args:
+            parties: Nombre de combats
+            seed: Graine du lot (None pour une graine tirée au hasard)
+
+        Returns:
+            Le rapport du lot, au même format que lancer_simulation
+        """
+        rng = np.random.default_rng(seed)
+        camps = tuple(_Camp(table, parties, self.horizon, rng) for table in self.tables)
+
+        ids = np.arange(parties)  # Index d'origine des combats encore présents dans les tableaux
+        en_cours = np.ones(parties, dtype=bool)
+        vainqueurs = np.full(parties, -1, dtype=np.int8)
+        tours = np.full(parties, self.tours_max, dtype=np.int64)
+        pv_finaux = np.zeros((2, parties), dtype=np.int64)
+
+        for tour in range(1, self.tours_max + 1):
+            actif = (tour - 1) % 2
+            attaquant, defenseur = camps[actif], camps[1 - actif]
+
+            self._debut_tour(attaquant, defenseur)
+            en_cours = self._enregistrer_ko(attaquant, defenseur, en_cours, ids, vainqueurs, tours, pv_finaux,
+                                            actif, tour)
+
+            choix = self._choisir(attaquant, defenseur, en_cours, rng)
+            for uid in range(len(attaquant.table.skills)):
+                index = np.flatnonzero(choix == uid)
+                if index.size:
+                    attaquant.utilisations[uid] += index.size
+                    self._utiliser(attaquant, defenseur, uid, index, rng)
+            en_cours = self._enregistrer_ko(attaquant, defenseur, en_cours, ids, vainqueurs, tours, pv_finaux,
+                                            actif, tour)
+
+            restants = np.count_nonzero(en_cours)
+            if not restants:
+                break
+            if restants * 2 < en_cours.size and en_cours.size >= _COMPACTAGE_MIN:
+                garder = np.flatnonzero(en_cours)
+                for camp in camps:
+                    camp.garder(garder)
+                ids = ids[garder]
+                en_cours = en_cours[garder]
+
+        # Combats nuls: PV des deux camps à la limite de tours
+        for index, camp in enumerate(camps):
+            pv_finaux[index, ids[en_cours]] = camp.hp[en_cours]
+        return self._rapport(camps, vainqueurs, tours, pv_finaux)
+
+    @staticmethod
+    def _enregistrer_ko(attaquant: _Camp, defenseur: _Camp, en_cours, ids, vainqueurs, tours, pv_finaux,
+                        actif: int, tour: int):
+        """Termine les combats dont le défenseur est KO et retourne le nouveau masque en cours"""
+        ko = en_cours & (defenseur.hp <= 0)
+        if ko.any():
+            vainqueurs[ids[ko]] = actif
+            tours[ids[ko]] = tour
+            pv_finaux[actif, ids[ko]] = attaquant.hp[ko]
+            en_cours = en_cours & ~ko
+        return en_cours
+
+    def _debut_tour(self, attaquant: _Camp, defenseur: _Camp):
+        """Équivalent vectoriel de Personnage.start_turn"""
+        attaquant.tour += 1
+        case = attaquant.tour % self.horizon
+
+        # Régénération passive de PM
+        attaquant.gagner_mp(REGEN_MP, slice(None))
+
+        # Attaques des familiers (dégâts cumulés, réduits par la défense)
+        index = np.flatnonzero(attaquant.familiers > 0)
+        if index.size:
+            defenseur.recevoir_degats(attaquant.familiers[index], index)
+
+        # Zones: dégâts bruts, puis debuff posé au premier tour de la zone
+        defenseur.hp = np.maximum(0, defenseur.hp - attaquant.zones[case])
+        attaquant.zones[case] = 0
+        for uid, tampon in attaquant.debuffs_zone.items():
+            index = np.flatnonzero(tampon[case])
+            if index.size:
+                _, _, duree, (stat, _) = attaquant.table.skills[uid].zone
+                defenseur.ajouter_effet(_STATS_DEBUFF[stat], tampon[case, index], duree, index)
+            tampon[case] = 0
+
+        # Expiration des effets et des familiers, cooldowns
+        attaquant.totaux -= attaquant.expirations[case]
+        attaquant.expirations[case] = 0
+        attaquant.familiers -= attaquant.fin_familiers[case]
+        attaquant.fin_familiers[case] = 0
+        np.subtract(attaquant.cooldowns, 1, out=attaquant.cooldowns, where=attaquant.cooldowns > 0)
+
+    def _choisir(self, camp: _Camp, adversaire: _Camp, en_cours, rng):
+        """
+        Équivalent vectoriel de AIPlayer.choose_skill
+
+        Returns:
+            uid choisi dans chaque combat (-1 pour passer le tour)
+        """
+        table = camp.table
+        n = camp.hp.size
+        disponibles = (camp.mp >= table.cout[:, None]) & (camp.cooldowns <= 0) & en_cours
+        choix = np.full(n, -1)
+        reste = disponibles.any(axis=0)
+
+        hp_percent = camp.hp / table.hp_max
+        opponent_hp_percent = adversaire.hp / adversaire.table.hp_max
+
+        def prendre(condition, masque, au_hasard=True):
+            nonlocal reste
+            candidats = disponibles & masque
+            retenus = reste & condition & candidats.any(axis=0)
+            index = np.flatnonzero(retenus)
+            if index.size:
+                choix[index] = self._tirer(candidats[:, index], rng) if au_hasard \
+                    else self._meilleur(candidats[:, index], table)
+                reste = reste & ~retenus
+
+        # Mêmes priorités que AIPlayer (les tirages faits pour tous sont indépendants)
+        prendre(hp_percent < 0.3, table.masque(TypeSkill.HEAL))
+        prendre((opponent_hp_percent < 0.4) & (camp.mp > 140), table.masque(TypeSkill.ATTAQUE_ULTIME))
+        prendre(rng.random(n) < 0.2, table.masque(TypeSkill.BUFF))
+        prendre((rng.random(n) < 0.15) & (opponent_hp_percent > 0.5), table.masque(TypeSkill.DEBUFF))
+        prendre((hp_percent < 0.2) & (rng.random(n) < 0.3), table.masque(TypeSkill.EVASION))
+
+        moyennes = camp.agressive | (camp.mp > 100)
+        attaques = np.where(moyennes, table.masque(*_ATTAQUES_MOYENNES), table.masque(TypeSkill.ATTAQUE_LEGERE))
+        if self.difficulte == 'difficile':
+            prendre(True, attaques, au_hasard=False)
+        elif self.difficulte == 'facile':
+            prendre(True, attaques)
+        else:
+            prendre(rng.random(n) < 0.7, attaques, au_hasard=False)
+            prendre(True, attaques)
+
+        # Par défaut: première compétence disponible
+        index = np.flatnonzero(reste)
+        choix[index] = disponibles[:, index].argmax(axis=0)
+        return choix
+
+    @staticmethod
+    def _tirer(candidats, rng):
+        """Choisit uniformément une compétence parmi les candidats de chaque colonne"""
+        rangs = (rng.random(candidats.shape[1]) * candidats.sum(axis=0)).astype(np.int64)
+        return (candidats.cumsum(axis=0) > rangs).argmax(axis=0)
+
+    @staticmethod
+    def _meilleur(candidats, table: _TableClasse):
+        """Premier candidat de plus grand degats_base (comme max())"""
+        return np.where(candidats, table.degats_base[:, None], -np.inf).argmax(axis=0)
+
+    def _utiliser(self, attaquant: _Camp, defenseur: _Camp, uid: int, index, rng):
+        """Équivalent vectoriel de Personnage.use_skill et des handlers de chaque type"""
+        table = attaquant.table
+        skill = table.skills[uid]
+        code = skill.code_type
+
+        attaquant.mp[index] -= skill.cout_mp
+        if skill.cooldown > 0:
+            attaquant.cooldowns[uid, index] = skill.cooldown
+
+        if code in _ATTAQUES:
+            degats = skill.degats or 0
+            chance_crit = 0.15 + attaquant.totaux[CRITIQUE, index] / 100 + 0.30 * attaquant.surcharge[index]
+            critique = rng.random(index.size) < chance_crit
+            defenseur.recevoir_degats(np.where(critique, int(degats * 1.5), degats), index)
+            self._appliquer_debuffs(skill, defenseur, index)
+            if table.invocateur and skill.auto_invocation:
+                attaquant.ajouter_familier(skill.auto_invocation[2], skill.auto_invocation[3], index)
+                attaquant.gagner_mp(table.passif_mp, index)
+
+        elif code == TypeSkill.HEAL:
+            attaquant.hp[index] = np.minimum(attaquant.hp[index] + skill.heal, table.hp_max)
+
+        elif code == TypeSkill.BUFF:
+            for stat, valeur, duree in skill.effets_buff:
+                if stat in _STATS_BUFF:
+                    attaquant.ajouter_effet(_STATS_BUFF[stat], valeur, duree, index)
+            if skill.surcharge:
+                attaquant.surcharge[index] = True
+            if table.invocateur and skill.heal_mp is not None:
+                attaquant.gagner_mp(skill.heal_mp, index)
+
+        elif code == TypeSkill.DEBUFF:
+            if skill.degats is not None:
+                defenseur.recevoir_degats(skill.degats, index)
+            self._appliquer_debuffs(skill, defenseur, index)
+
+        elif code == TypeSkill.INVOCATION:
+            if table.invocateur and skill.familier_choice:
+                tirage = (rng.random(index.size) * len(skill.familiers)).astype(np.int64)
+                for i, (_, _, degats, duree) in enumerate(skill.familiers):
+                    attaquant.ajouter_familier(degats, duree, index[tirage == i])
+            elif skill.familier:
+                attaquant.ajouter_familier(skill.familier[2], skill.familier[3], index)
+            if table.invocateur and (skill.familier_choice or skill.familier):
+                attaquant.gagner_mp(table.passif_mp, index)
+
+        elif code == TypeSkill.ZONE and skill.zone:
+            degats, intervalle, duree, debuff = skill.zone
+            for ecoule in range(1, max(duree, 1) + 1):
+                if ecoule % intervalle == 0:
+                    attaquant.zones[(attaquant.tour + ecoule) % self.horizon, index] += degats
+            if debuff and debuff[0] in _STATS_DEBUFF:
+                attaquant.debuffs_zone[uid][(attaquant.tour + 1) % self.horizon, index] += debuff[1]
+
+        # Évasion, ultime: sans effet sur l'issue du combat
+
+    @staticmethod
+    def _appliquer_debuffs(skill, defenseur: _Camp, index):
+        for stat, valeur, duree in skill.effets_debuff:
+            if stat in _STATS_DEBUFF:
+                defenseur.ajouter_effet(_STATS_DEBUFF[stat], valeur, duree, index)
+
+    def _rapport(self, camps, vainqueurs, tours, pv_finaux) -> RapportSimulation:
+        """Construit le rapport du lot"""
+        rapport = RapportSimulation()
+        rapport.parties = int(vainqueurs.size)
+        rapport.nuls = int(np.count_nonzero(vainqueurs == -1))
+        rapport.victoires_premier = int(np.count_nonzero(vainqueurs == 0))
+        for index, camp in enumerate(camps):
+            classe = camp.table.identifiant
+            victoires = int(np.count_nonzero(vainqueurs == index))
+            if victoires:
+                rapport.victoires[classe] += victoires
+            utilisations = {nom: int(nb) for nom, nb in zip(camp.table.noms, camp.utilisations) if nb}
+            rapport.skills.setdefault(classe, Counter()).update(utilisations)
+            rapport.pv_restants[classe] += float(pv_finaux[index].sum()) / camp.table.hp_max
+
+        valeurs, nombres = np.unique(tours, return_counts=True)
+        rapport.tours.update({int(v): int(nb) for v, nb in zip(valeurs, nombres)})
+        return rapport
+
+
+def simuler_lot_vectorise(debut: int, fin: int, classes: Tuple[str, str], difficulte: str = 'normal',
+                          alterner: bool = True, tours_max: int = TOURS_MAX,
+                          definitions: Optional[Dict[str, DefinitionPersonnage]] = None) -> RapportSimulation:
+    """
+    Équivalent vectorisé d'un lot de lancer_simulation (graines debut..fin-1)
+
+    Avec l'alternance, les graines impaires inversent les classes comme dans
+    le moteur objet: le lot est simulé en deux sous-lots.
+    """
+    class_a, class_b = classes
+    parties = fin - debut
+    impaires = (fin // 2 - debut // 2) if alterner else 0
+    rapport = RapportSimulation()
+    if parties - impaires:
+        moteur = MoteurVectorise(class_a, class_b, difficulte, tours_max, definitions)
+        rapport.fusionner(moteur.simuler(parties - impaires, seed=(debut, 0)))
+    if impaires:
+        moteur = MoteurVectorise(class_b, class_a, difficulte, tours_max, definitions)
+        rapport.fusionner(moteur.simuler(impaires, seed=(debut, 1)))
+    return rapport
+
+
+def comparer_moteurs(class_a: str, class_b: str, parties_objet: int = 2000, parties_vectorise: int = 20000,
+                     difficulte: str = 'normal', seuil: float = 4.0, seed: int = 0) -> Dict:
+    """
+    Vérifie que le moteur vectorisé reproduit statistiquement le moteur objet
+
+    Compare le taux de victoire du joueur 1 (test z sur deux proportions), le
+    nombre moyen de tours (test de Welch) et la part de chaque compétence
+    dans les utilisations d'une classe.
+
+    Args:
+        class_a: Classe du joueur 1 (qui commence)
+        class_b: Classe du joueur 2
+        parties_objet: Combats simulés par le moteur objet
+        parties_vectorise: Combats simulés par le moteur vectorisé
+        difficulte: Niveau de difficulté des IA
+        seuil: Écart maximal accepté, en nombre d'écarts-types
+        seed: Graine des deux simulations
+
+    Returns:
+        Dictionnaire des statistiques comparées, avec 'ok' à True si tous les écarts sont sous le seuil
+    """
+    objet = lancer_simulation(parties_objet, 1, (class_a, class_b), difficulte, seed, alterner=False)
+    vectorise = MoteurVectorise(class_a, class_b, difficulte).simuler(parties_vectorise, seed)
+
+    # Taux de victoire du joueur 1
+    p1 = objet.victoires_premier / objet.parties
+    p2 = vectorise.victoires_premier / vectorise.parties
+    p = (objet.victoires_premier + vectorise.victoires_premier) / (objet.parties + vectorise.parties)
+    erreur = math.sqrt(p * (1 - p) * (1 / objet.parties + 1 / vectorise.parties))
+    z_victoire = abs(p1 - p2) / erreur if erreur else (0.0 if p1 == p2 else math.inf)
+
+    # Nombre moyen de tours
+    erreur = math.sqrt(objet.ecart_type_tours ** 2 / objet.parties
+                       + vectorise.ecart_type_tours ** 2 / vectorise.parties)
+    ecart = abs(objet.tours_moyen - vectorise.tours_moyen)
+    z_tours = ecart / erreur if erreur else (0.0 if ecart == 0 else math.inf)
+
+    # Part de chaque compétence (approximation binomiale)
+    z_skills = {}
+    for classe, compteur in objet.skills.items():
+        autre = vectorise.skills.get(classe, Counter())
+        n1, n2 = sum(compteur.values()), sum(autre.values())
+        for nom in set(compteur) | set(autre):
+            q1, q2 = compteur[nom] / n1, autre[nom] / n2
+            q = (compteur[nom] + autre[nom]) / (n1 + n2)
+            erreur = math.sqrt(q * (1 - q) * (1 / n1 + 1 / n2))
+            z_skills[f"{classe}/{nom}"] = abs(q1 - q2) / erreur if erreur else 0.0
+
+    return {
+        'classes': (class_a, class_b),
+        'taux_victoire_premier': {'objet': p1, 'vectorise': p2, 'z': z_victoire},
+        'tours_moyen': {'objet': objet.tours_moyen, 'vectorise': vectorise.tours_moyen, 'z': z_tours},
+        'skills_z_max': max(z_skills.values(), default=0.0),
+        'skills_z': z_skills,
+        'ok': max([z_victoire, z_tours] + list(z_skills.values())) < seuil
+    }
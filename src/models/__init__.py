@@ -5,5 +5,13 @@ Package models - Classes de personnages
 from src.models.personnage_v2 import Personnage
 from src.models.sage import Sage
 from src.models.magicien import Magicien
+from src.models.aleatoire import Aleatoire
+from src.models.effets import Effet, GestionnaireEffets
+from src.models.evenements import SinkCombat, SinkTerminal, SinkNul, SinkTampon, TypeEvenement
+from src.models.registre import REGISTRE, DefinitionPersonnage, RegistreConfig
 
-__all__ = ['Personnage', 'Sage', 'Magicien']
+__all__ = [
+    'Personnage', 'Sage', 'Magicien', 'Aleatoire', 'Effet', 'GestionnaireEffets',
+    'SinkCombat', 'SinkTerminal', 'SinkNul', 'SinkTampon', 'TypeEvenement',
+    'REGISTRE', 'DefinitionPersonnage', 'RegistreConfig'
+]
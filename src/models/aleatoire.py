@@ -0,0 +1,57 @@
+"""
+Module du générateur aléatoire propre à chaque combat
+"""
+
+import random
+from typing import Any, Optional, Sequence
+
+
+def nouvelle_seed() -> int:
+    """Tire une graine de combat au hasard"""
+    return random.randrange(2**32)
+
+
+class Aleatoire:
+    """
+    Générateur aléatoire d'un combat, partagé par les personnages et les IA
+
+    Toutes les décisions aléatoires du combat (coups critiques, choix des
+    familiers, décisions de l'IA) passent par cet objet : rejouer la même
+    graine redonne exactement le même combat.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Graine du combat (None pour une graine tirée au hasard)
+        """
+        self.seed = seed if seed is not None else nouvelle_seed()
+        self._random = random.Random(self.seed)
+
+    def chance(self, probabilite: float) -> bool:
+        """Retourne True avec la probabilité donnée"""
+        return self._random.random() < probabilite
+
+    def choix(self, sequence: Sequence) -> Any:
+        """Choisit un élément au hasard dans une séquence non vide"""
+        return self._random.choice(sequence)
+
+    def etat(self) -> tuple:
+        """Retourne l'état interne du générateur"""
+        return self._random.getstate()
+
+    def restaurer(self, etat: tuple):
+        """Restaure un état obtenu avec etat()"""
+        self._random.setstate(etat)
+
+    def cloner(self) -> 'Aleatoire':
+        """Retourne un générateur indépendant, dans le même état que celui-ci"""
+        clone = Aleatoire.__new__(Aleatoire)
+        clone.seed = self.seed
+        # Pas de réinitialisation par la graine: l'état est écrasé juste après
+        clone._random = random.Random.__new__(random.Random)
+        clone._random.setstate(self._random.getstate())
+        return clone
+
+    def __repr__(self):
+        return f"Aleatoire(seed={self.seed})"
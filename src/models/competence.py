@@ -0,0 +1,157 @@
+"""
+Module des compétences compilées
+
+Les définitions JSON des skills sont converties une seule fois en objets
+immuables à slots : identifiant entier, coûts précalculés, effets déjà
+triés par type et référence directe vers la méthode qui applique le skill.
+La boucle de combat n'a ainsi plus aucune recherche dans un dictionnaire
+ni comparaison de chaînes à faire.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class TypeSkill:
+    """Codes entiers des types de compétences"""
+    ATTAQUE_LEGERE = 0
+    ATTAQUE_MOYENNE = 1
+    ATTAQUE_LOURDE = 2
+    ATTAQUE_ULTIME = 3
+    HEAL = 4
+    BUFF = 5
+    DEBUFF = 6
+    EVASION = 7
+    INVOCATION = 8
+    ZONE = 9
+    INCONNU = 10
+
+
+# Correspondance entre le type JSON et son code
+CODES_TYPE: Dict[str, int] = {
+    'attaque_legere': TypeSkill.ATTAQUE_LEGERE,
+    'attaque_moyenne': TypeSkill.ATTAQUE_MOYENNE,
+    'attaque_lourde': TypeSkill.ATTAQUE_LOURDE,
+    'attaque_ultime': TypeSkill.ATTAQUE_ULTIME,
+    'heal': TypeSkill.HEAL,
+    'buff': TypeSkill.BUFF,
+    'debuff': TypeSkill.DEBUFF,
+    'evasion': TypeSkill.EVASION,
+    'invocation': TypeSkill.INVOCATION,
+    'zone': TypeSkill.ZONE
+}
+
+# Méthode de Personnage qui applique chaque type de compétence
+HANDLERS_TYPE: Dict[int, Optional[str]] = {
+    TypeSkill.ATTAQUE_LEGERE: '_appliquer_attaque',
+    TypeSkill.ATTAQUE_MOYENNE: '_appliquer_attaque',
+    TypeSkill.ATTAQUE_LOURDE: '_appliquer_attaque',
+    TypeSkill.ATTAQUE_ULTIME: None,  # Type reconnu par l'IA mais sans effet en combat
+    TypeSkill.HEAL: '_appliquer_heal',
+    TypeSkill.BUFF: '_appliquer_buff',
+    TypeSkill.DEBUFF: '_appliquer_debuff',
+    TypeSkill.EVASION: '_appliquer_evasion',
+    TypeSkill.INVOCATION: '_appliquer_invocation',
+    TypeSkill.ZONE: '_appliquer_zone',
+    TypeSkill.INCONNU: None
+}
+
+# Familier compilé : (nom, element, degats, duree)
+DonneesFamilier = Tuple[str, str, int, int]
+
+
+def _aucun_effet(personnage, skill, adversaire):
+    """Handler des types de compétences sans effet"""
+    pass
+
+
+def _compiler_familier(donnees: Optional[Dict]) -> Optional[DonneesFamilier]:
+    if not donnees:
+        return None
+    return (donnees['nom'], donnees['element'], donnees['degats'], donnees['duree'])
+
+
+class Competence:
+    """Compétence compilée, immuable et partagée entre tous les personnages d'une classe"""
+
+    __slots__ = (
+        'uid', 'id', 'nom', 'type', 'code_type', 'icone', 'description',
+        'cout_mp', 'cooldown', 'degats', 'degats_base', 'heal', 'heal_mp',
+        'effets', 'effets_buff', 'effets_debuff', 'surcharge',
+        'familier', 'familiers', 'familier_choice', 'auto_invocation', 'zone',
+        'appliquer'
+    )
+
+    def __init__(self, uid: int, donnees: Dict, classe_personnage: type):
+        """
+        Compile une définition JSON de compétence
+
+        Args:
+            uid: Identifiant entier du skill (son index dans la table de la classe)
+            donnees: Définition JSON du skill
+            classe_personnage: Classe dont les méthodes appliquent le skill
+        """
+        code_type = CODES_TYPE.get(donnees['type'], TypeSkill.INCONNU)
+        effets = tuple(
+            (effet['type'], effet['stat'], effet['valeur'], effet['duree'])
+            for effet in donnees.get('effets', ())
+        )
+        zone = donnees.get('zone')
+        if zone is not None:
+            debuff = zone.get('debuff')
+            zone = (zone['degats'], zone['intervalle'], zone['duree'],
+                    (debuff['stat'], debuff['valeur']) if debuff else None)
+
+        nom_handler = HANDLERS_TYPE[code_type]
+        valeurs = {
+            'uid': uid,
+            'id': donnees.get('id', donnees['nom']),
+            'nom': donnees['nom'],
+            'type': donnees['type'],
+            'code_type': code_type,
+            'icone': donnees.get('icone', '⚔️'),
+            'description': donnees.get('description', ''),
+            'cout_mp': donnees.get('cout_mp', 0),
+            'cooldown': donnees.get('cooldown', 0),
+            'degats': donnees.get('degats'),  # None si le skill n'inflige pas de dégâts directs
+            'degats_base': donnees.get('degats_base', 0),
+            'heal': donnees.get('heal', 0),
+            'heal_mp': donnees.get('heal_mp'),
+            'effets': effets,
+            'effets_buff': tuple(e[1:] for e in effets if e[0] == 'buff'),
+            'effets_debuff': tuple(e[1:] for e in effets if e[0] == 'debuff'),
+            'surcharge': donnees.get('special') == 'surcharge',
+            'familier': _compiler_familier(donnees.get('familier')),
+            'familiers': tuple(_compiler_familier(f) for f in donnees.get('familiers', ())),
+            'familier_choice': bool(donnees.get('familier_choice')),
+            'auto_invocation': _compiler_familier(donnees.get('auto_invocation')),
+            'zone': zone,
+            'appliquer': getattr(classe_personnage, nom_handler) if nom_handler else _aucun_effet
+        }
+        for nom, valeur in valeurs.items():
+            object.__setattr__(self, nom, valeur)
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("Une compétence compilée est immuable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self  # Immuable: partagée au lieu d'être copiée
+
+    def __repr__(self):
+        return f"Competence({self.uid}, {self.id!r})"
+
+
+def compiler_skills(skills: List[Dict], classe_personnage: type) -> Tuple[Competence, ...]:
+    """
+    Compile la liste des skills JSON d'une classe de personnage
+
+    Args:
+        skills: Définitions JSON des skills
+        classe_personnage: Classe dont les méthodes appliquent les skills
+
+    Returns:
+        Table des compétences, indexée par leur uid
+    """
+    return tuple(Competence(uid, donnees, classe_personnage) for uid, donnees in enumerate(skills))
@@ -0,0 +1,127 @@
+"""
+Module des effets temporaires (buffs/debuffs) et de leur gestionnaire
+
+Le gestionnaire tient à jour le total de chaque stat à chaque ajout ou
+expiration d'effet, et range les effets par tour d'expiration : faire
+avancer le temps ne touche que les effets qui expirent réellement, sans
+jamais reparcourir la liste des effets actifs.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class Effet:
+    """Classe représentant un effet temporaire (buff/debuff)"""
+
+    __slots__ = ('type', 'stat', 'valeur', 'duree', 'nom', 'expiration')
+
+    def __init__(self, type_effet: str, stat: str, valeur: float, duree: int, nom: str = ""):
+        self.type = type_effet
+        self.stat = stat
+        self.valeur = valeur
+        self.duree = duree  # Durée au moment de l'application
+        self.nom = nom
+        self.expiration = 0  # Tour du gestionnaire où l'effet disparaît
+
+    def __repr__(self):
+        signe = "+" if self.valeur >= 0 else ""
+        return f"{self.nom} ({signe}{self.valeur} {self.stat}, {self.duree} tours)"
+
+
+class GestionnaireEffets:
+    """Effets actifs d'un personnage, avec totaux par stat maintenus en continu"""
+
+    __slots__ = ('tour', 'buffs', 'debuffs', 'totaux_buffs', 'totaux_debuffs', '__expirations')
+
+    def __init__(self):
+        self.tour = 0  # Nombre d'appels à avancer()
+
+        # Effets actifs dans l'ordre d'application (dict pour un retrait en O(1))
+        self.buffs: Dict[Effet, None] = {}
+        self.debuffs: Dict[Effet, None] = {}
+
+        # Somme des valeurs des effets actifs, par stat
+        self.totaux_buffs: Dict[str, float] = {}
+        self.totaux_debuffs: Dict[str, float] = {}
+
+        # Effets indexés par le tour où ils expirent
+        self.__expirations: Dict[int, List[Effet]] = {}
+
+    def __tables(self, effet: Effet) -> Tuple[Dict[Effet, None], Dict[str, float]]:
+        if effet.type == 'buff':
+            return self.buffs, self.totaux_buffs
+        return self.debuffs, self.totaux_debuffs
+
+    def ajouter(self, effet: Effet):
+        """
+        Ajoute un effet et met à jour le total de sa stat
+
+        Un effet de durée n reste actif pendant n appels à avancer() et
+        disparaît au suivant (immédiatement au premier si n <= 0).
+        """
+        actifs, totaux = self.__tables(effet)
+        actifs[effet] = None
+        totaux[effet.stat] = totaux.get(effet.stat, 0) + effet.valeur
+
+        effet.expiration = self.tour + max(effet.duree, 0) + 1
+        self.__expirations.setdefault(effet.expiration, []).append(effet)
+
+    def avancer(self) -> bool:
+        """
+        Passe au tour suivant et retire les effets expirés
+
+        Returns:
+            True si au moins un effet a expiré
+        """
+        self.tour += 1
+        expires = self.__expirations.pop(self.tour, None)
+        if not expires:
+            return False
+
+        for effet in expires:
+            actifs, totaux = self.__tables(effet)
+            del actifs[effet]
+            totaux[effet.stat] -= effet.valeur
+        return True
+
+    def total_buffs(self, stat: str) -> float:
+        """Somme des buffs actifs sur une stat"""
+        return self.totaux_buffs.get(stat, 0)
+
+    def total_debuffs(self, stat: str) -> float:
+        """Somme des debuffs actifs sur une stat"""
+        return self.totaux_debuffs.get(stat, 0)
+
+    def duree_restante(self, effet: Effet) -> int:
+        """Nombre de tours restants d'un effet actif"""
+        return min(effet.duree, effet.expiration - self.tour - 1)
+
+    def cle(self) -> Tuple:
+        """Clé canonique des effets actifs (indépendante de leur ordre d'application)"""
+        effets = [(e.type, e.stat, e.valeur, self.duree_restante(e)) for e in self.buffs]
+        effets += [(e.type, e.stat, e.valeur, self.duree_restante(e)) for e in self.debuffs]
+        effets.sort()
+        return tuple(effets)
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture l'état des effets actifs
+
+        Les Effet ne sont jamais modifiés une fois ajoutés: ils sont partagés
+        entre le gestionnaire et ses snapshots au lieu d'être copiés.
+        """
+        return (self.tour, tuple(self.buffs), tuple(self.debuffs),
+                tuple(self.totaux_buffs.items()), tuple(self.totaux_debuffs.items()),
+                tuple((tour, tuple(effets)) for tour, effets in self.__expirations.items()))
+
+    def restore(self, etat: Tuple):
+        """Restaure un état obtenu avec snapshot()"""
+        self.tour, buffs, debuffs, totaux_buffs, totaux_debuffs, expirations = etat
+        self.buffs = dict.fromkeys(buffs)
+        self.debuffs = dict.fromkeys(debuffs)
+        self.totaux_buffs = dict(totaux_buffs)
+        self.totaux_debuffs = dict(totaux_debuffs)
+        self.__expirations = {tour: list(effets) for tour, effets in expirations}
+
+    def __len__(self):
+        return len(self.buffs) + len(self.debuffs)
@@ -0,0 +1,219 @@
+"""
+Module des événements de combat et des sorties (sinks) qui les consomment
+
+Les personnages n'affichent plus rien directement : ils émettent des
+événements typés (code entier + valeurs brutes) vers un sink, qui décide
+s'il faut les afficher tout de suite, plus tard, ou pas du tout.
+"""
+
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class TypeEvenement:
+    """Codes des événements émis pendant un combat"""
+    TOUR = 0              # (numero, hp_j1, mp_j1, hp_j2, mp_j2) - acteur = attaquant
+    SKILL = 1             # (nom_skill, icone, mp, mp_max, cout_mp)
+    CRITIQUE = 2          # ()
+    DEGATS = 3            # (degats, hp, hp_max) - acteur = personnage touché
+    SOIN = 4              # (hp_soignes,)
+    BUFF = 5              # (nom_effet, stat, valeur, duree)
+    DEBUFF = 6            # (nom_effet, stat, valeur, duree) - acteur = personnage affaibli
+    SURCHARGE = 7         # ()
+    EVASION = 8           # ()
+    INVOCATION = 9        # (nom_familier, element)
+    ATTAQUE_FAMILIER = 10 # (nom_familier, degats)
+    ZONE_CREEE = 11       # (nom_zone,)
+    ZONE_DEGATS = 12      # (nom_zone, degats)
+    REGEN_MP = 13         # (mp_regeneres,)
+    PASSIF_MP = 14        # (mp_recuperes,)
+    RECUP_MP = 15         # (mp_recuperes,)
+    CHOIX_FAMILIER = 16   # (((nom, element, degats), ...),)
+    NIVEAU = 17           # (niveau, bonus_stats)
+    ZONE_DEBUFF = 18      # (nom_effet, stat, valeur, duree) - non affiché
+
+
+def _formater_effet(nom: str, stat: str, valeur: float, duree: int) -> str:
+    """Reproduit la représentation d'un Effet"""
+    signe = "+" if valeur >= 0 else ""
+    return f"{nom} ({signe}{valeur} {stat}, {duree} tours)"
+
+
+def _formater_choix_familier(acteur: str, familiers: Tuple) -> str:
+    lignes = [f"\n   🐉 Choisissez un familier:"]
+    for i, (nom, element, degats) in enumerate(familiers, 1):
+        lignes.append(f"   {i}. {nom} ({element}) - {degats} dégâts/tour")
+    return "\n".join(lignes)
+
+
+# Texte affiché pour chaque type d'événement: f(acteur, *valeurs) -> str
+# Un format qui retourne None correspond à un événement enregistré mais non affiché
+FORMATS: Dict[int, Callable[..., Optional[str]]] = {
+    TypeEvenement.TOUR: lambda acteur, numero, *etat:
+        f"\n{'='*70}\n⚔️  TOUR {numero} - {acteur} attaque !\n{'='*70}",
+    TypeEvenement.SKILL: lambda acteur, nom, icone, mp, mp_max, cout:
+        f"\n🎯 {acteur} utilise : {icone} {nom}\n   💙 PM : {mp}/{mp_max} (-{cout})",
+    TypeEvenement.CRITIQUE: lambda acteur: f"   💥 COUP CRITIQUE!",
+    TypeEvenement.DEGATS: lambda acteur, degats, hp, hp_max:
+        f"   💔 {acteur} subit {degats} dégâts! (HP: {hp}/{hp_max})",
+    TypeEvenement.SOIN: lambda acteur, hp: f"   💚 {acteur} récupère {hp} HP!",
+    TypeEvenement.BUFF: lambda acteur, *effet: f"   🔺 {acteur} gagne: {_formater_effet(*effet)}",
+    TypeEvenement.DEBUFF: lambda acteur, *effet: f"   🔻 {acteur} subit: {_formater_effet(*effet)}",
+    TypeEvenement.SURCHARGE: lambda acteur: f"   ⚡ Compétences surchargées!",
+    TypeEvenement.EVASION: lambda acteur: f"   💨 {acteur} esquive!",
+    TypeEvenement.INVOCATION: lambda acteur, nom, element: f"   🐾 {nom} invoqué! ({element})",
+    TypeEvenement.ATTAQUE_FAMILIER: lambda acteur, nom, degats: f"   🐾 {nom} attaque! (+{degats} dégâts)",
+    TypeEvenement.ZONE_CREEE: lambda acteur, nom: f"   🌊 {nom} créée!",
+    TypeEvenement.ZONE_DEGATS: lambda acteur, nom, degats: f"   🌊 {nom} inflige {degats} dégâts!",
+    TypeEvenement.REGEN_MP: lambda acteur, mp: f"   💙 {acteur} régénère {mp} MP (Régénération passive)",
+    TypeEvenement.PASSIF_MP: lambda acteur, mp: f"   🔮 Récupération mana passive: +{mp} MP",
+    TypeEvenement.RECUP_MP: lambda acteur, mp: f"   💙 {acteur} récupère {mp} MP!",
+    TypeEvenement.CHOIX_FAMILIER: _formater_choix_familier,
+    TypeEvenement.NIVEAU: lambda acteur, niveau, bonus:
+        f"\n🎉 {acteur} a atteint le niveau {niveau}!\n   +{bonus} à toutes les stats!",
+    TypeEvenement.ZONE_DEBUFF: lambda acteur, *effet: None,
+}
+
+
+def formater_evenement(code: int, acteur: str, *valeurs) -> Optional[str]:
+    """
+    Convertit un événement en texte affichable
+
+    Args:
+        code: Code TypeEvenement de l'événement
+        acteur: Nom du personnage concerné
+        valeurs: Valeurs propres au type d'événement
+
+    Returns:
+        Le texte tel qu'il doit apparaître dans le terminal (None si non affiché)
+    """
+    return FORMATS[code](acteur, *valeurs)
+
+
+class SinkCombat:
+    """Interface des sorties d'événements de combat"""
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        """Reçoit un événement émis par un personnage"""
+        raise NotImplementedError
+
+    def flush(self):
+        """Appelé une fois à la fin de chaque tour"""
+        pass
+
+
+class SinkTerminal(SinkCombat):
+    """Affiche chaque événement immédiatement dans le terminal"""
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        texte = FORMATS[code](acteur, *valeurs)
+        if texte is not None:
+            print(texte)
+
+
+class SinkNul(SinkCombat):
+    """Ignore tous les événements (simulations headless)"""
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        pass
+
+
+class SinkTampon(SinkCombat):
+    """Accumule les événements du tour et les affiche en une seule écriture"""
+
+    def __init__(self, sortie=None):
+        """
+        Args:
+            sortie: Flux d'écriture (sys.stdout par défaut)
+        """
+        self.sortie = sortie
+        self.evenements: List[Tuple] = []
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        self.evenements.append((code, acteur) + valeurs)
+
+    def flush(self):
+        if not self.evenements:
+            return
+        lignes = [FORMATS[e[0]](*e[1:]) for e in self.evenements]
+        self.evenements.clear()
+        lignes = [ligne for ligne in lignes if ligne is not None]
+        if lignes:
+            sortie = self.sortie or sys.stdout
+            sortie.write("\n".join(lignes) + "\n")
+            sortie.flush()
+
+
+class SinkJournal(SinkCombat):
+    """
+    Enregistre le flux d'événements d'un combat sous forme compacte
+
+    Chaque événement est stocké comme une liste [code, index_acteur, *valeurs]
+    où index_acteur désigne le joueur 1 (0) ou le joueur 2 (1). La position du
+    premier événement de chaque tour est indexée pour pouvoir sauter
+    directement à n'importe quel tour lors d'un replay.
+
+    Combat pose sur chaque joueur une vue du journal (pour) qui donne son
+    index: deux joueurs du même nom restent distingués. Un journal posé
+    directement sur un personnage, hors combat, retrouve l'acteur par son nom.
+    """
+
+    def __init__(self, noms: Tuple[str, str], suivant: Optional[SinkCombat] = None):
+        """
+        Args:
+            noms: Noms des deux joueurs, dans l'ordre du combat
+            suivant: Sink auquel retransmettre les événements (affichage en direct)
+        """
+        self.noms = list(noms)
+        self.suivant = suivant
+        self.evenements: List[List] = []
+        self.index_tours: List[int] = []
+
+    def pour(self, index: int) -> 'SinkActeur':
+        """Vue du journal pour le joueur d'index donné (0 ou 1)"""
+        return SinkActeur(self, index)
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        self.enregistrer(self.noms.index(acteur) if acteur in self.noms else acteur, code, acteur, *valeurs)
+
+    def enregistrer(self, index_acteur: int, code: int, acteur: str, *valeurs):
+        """Enregistre un événement dont l'index de l'acteur est connu"""
+        if code == TypeEvenement.TOUR:
+            self.index_tours.append(len(self.evenements))
+        self.evenements.append([code, index_acteur, *valeurs])
+
+        if self.suivant is not None:
+            self.suivant.emettre(code, acteur, *valeurs)
+
+    def flush(self):
+        if self.suivant is not None:
+            self.suivant.flush()
+
+    def to_dict(self) -> Dict:
+        """Retourne le journal sous forme sérialisable en JSON"""
+        return {
+            'joueurs': self.noms,
+            'evenements': self.evenements,
+            'index_tours': self.index_tours
+        }
+
+
+class SinkActeur(SinkCombat):
+    """Vue d'un SinkJournal pour l'un des deux joueurs: ses événements portent son index"""
+
+    __slots__ = ('journal', 'index')
+
+    def __init__(self, journal: SinkJournal, index: int):
+        self.journal = journal
+        self.index = index
+
+    def emettre(self, code: int, acteur: str, *valeurs):
+        self.journal.enregistrer(self.index, code, acteur, *valeurs)
+
+    def flush(self):
+        self.journal.flush()
+
+
+# Instances partagées (les sinks terminal et nul n'ont pas d'état)
+SINK_TERMINAL = SinkTerminal()
+SINK_NUL = SinkNul()
@@ -2,29 +2,21 @@
 Module définissant la classe abstraite Personnage v2.0
 Avec système de stats étendues, buffs/debuffs, familiers, zones
 """
-import random
+import copy
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-
-class Effet:
-    """Classe représentant un effet temporaire (buff/debuff)"""
-    
-    def __init__(self, type_effet: str, stat: str, valeur: float, duree: int, nom: str = ""):
-        self.type = type_effet
-        self.stat = stat
-        self.valeur = valeur
-        self.duree = duree
-        self.nom = nom
-    
-    def __repr__(self):
-        signe = "+" if self.valeur >= 0 else ""
-        return f"{self.nom} ({signe}{self.valeur} {self.stat}, {self.duree} tours)"
+from src.models.aleatoire import Aleatoire
+from src.models.competence import Competence
+from src.models.effets import Effet, GestionnaireEffets
+from src.models.evenements import SINK_TERMINAL, SinkCombat, TypeEvenement
 
 
 class Familier:
     """Classe représentant un familier invoqué"""
     
+    __slots__ = ('nom', 'element', 'degats', 'duree', 'tours_restants')
+    
     def __init__(self, nom: str, element: str, degats: int, duree: int):
         self.nom = nom
         self.element = element
@@ -45,7 +37,10 @@ class Familier:
 class ZoneEffet:
     """Classe représentant une zone d'effet au sol"""
     
-    def __init__(self, nom: str, degats: int, intervalle: int, duree_totale: int, effet_debuff: Optional[Dict] = None):
+    __slots__ = ('nom', 'degats', 'intervalle', 'duree_totale', 'tours_ecoules', 'effet_debuff')
+    
+    def __init__(self, nom: str, degats: int, intervalle: int, duree_totale: int,
+                 effet_debuff: Optional[Tuple[str, float]] = None):
         self.nom = nom
         self.degats = degats
         self.intervalle = intervalle
@@ -74,17 +69,33 @@ class Personnage(ABC):
     # Propriété de classe publique pour gérer le tour
     tour = 'joueur1'
     
-    def __init__(self, nom: str, skills: List[Dict], stats: Dict):
+    # État du personnage à slots (pas de __dict__ par instance)
+    __slots__ = (
+        '__nom', '__skills', '__sink', '__rng',
+        '__hp_max', '__mp_max', '__attack_base', '__defense_base', '__endurance_max', '__niveau',
+        '__hp_actuel', '__mp_actuel', '__endurance_actuel',
+        '__attack', '__defense', '__reduction_degats', '__bonus_crit',
+        '__effets', '__cooldowns', '__familiers', '__zones_effet',
+        '__degats_infliges_total', '__degats_recus_total', '__coups_critiques',
+        '__skills_utilises', '__ordre_skills', '__dernier_skill', '__skills_surchargees'
+    )
+    
+    def __init__(self, nom: str, skills: Tuple[Competence, ...], stats: Dict, sink: Optional[SinkCombat] = None,
+                 rng: Optional[Aleatoire] = None):
         """
         Initialise un personnage
         
         Args:
             nom: Le nom du personnage
-            skills: Liste des skills possibles
+            skills: Table des compétences compilées (voir compiler_skills)
             stats: Dictionnaire des stats de base
+            sink: Sortie des événements de combat (terminal par défaut)
+            rng: Générateur aléatoire du combat (nouveau générateur par défaut)
         """
         self.__nom = nom
         self.__skills = skills
+        self.__sink = sink if sink is not None else SINK_TERMINAL
+        self.__rng = rng if rng is not None else Aleatoire()
         
         # Stats de base
         self.__hp_max = stats.get('hp_max', 500)
@@ -106,11 +117,10 @@ class Personnage(ABC):
         self.__bonus_crit = 0
         
         # Effets actifs
-        self.__buffs: List[Effet] = []
-        self.__debuffs: List[Effet] = []
+        self.__effets = GestionnaireEffets()
         
-        # Cooldowns des skills
-        self.__cooldowns: Dict[str, int] = {}
+        # Cooldowns des skills, indexés par uid
+        self.__cooldowns: List[int] = [0] * len(skills)
         
         # Familiers et zones
         self.__familiers: List[Familier] = []
@@ -120,7 +130,9 @@ class Personnage(ABC):
         self.__degats_infliges_total = 0
         self.__degats_recus_total = 0
         self.__coups_critiques = 0
-        self.__skills_utilises: Dict[str, int] = {}
+        self.__skills_utilises: List[int] = [0] * len(skills)
+        self.__ordre_skills: List[int] = []  # uids dans l'ordre de première utilisation
+        self.__dernier_skill: Optional[int] = None  # uid du skill utilisé pendant le tour en cours
         
         # Mécaniques spéciales
         self.__skills_surchargees = False
@@ -131,6 +143,22 @@ class Personnage(ABC):
     def nom(self) -> str:
         return self.__nom
     
+    @property
+    def sink(self) -> SinkCombat:
+        return self.__sink
+    
+    @sink.setter
+    def sink(self, value: SinkCombat):
+        self.__sink = value
+    
+    @property
+    def rng(self) -> Aleatoire:
+        return self.__rng
+    
+    @rng.setter
+    def rng(self, value: Aleatoire):
+        self.__rng = value
+    
     @property
     def hp_max(self) -> int:
         return self.__hp_max
@@ -168,16 +196,25 @@ class Personnage(ABC):
         return self.__niveau
     
     @property
-    def skills(self) -> List[Dict]:
+    def skills(self) -> Tuple[Competence, ...]:
         return self.__skills
     
+    @property
+    def effets(self) -> GestionnaireEffets:
+        return self.__effets
+    
     @property
     def buffs(self) -> List[Effet]:
-        return self.__buffs
+        return list(self.__effets.buffs)
     
     @property
     def debuffs(self) -> List[Effet]:
-        return self.__debuffs
+        return list(self.__effets.debuffs)
+    
+    @property
+    def dernier_skill(self) -> Optional[int]:
+        """uid du skill utilisé pendant le dernier tour du personnage (None s'il a passé)"""
+        return self.__dernier_skill
     
     @property
     def familiers(self) -> List[Familier]:
@@ -234,31 +271,12 @@ class Personnage(ABC):
     # MÉTHODES DE GESTION DES STATS
     
     def recalculer_stats(self):
-        """Recalcule les stats en tenant compte des buffs/debuffs"""
-        self.__attack = self.__attack_base
-        self.__defense = self.__defense_base
-        self.__reduction_degats = 0
-        self.__bonus_crit = 0
-        
-        # Appliquer les buffs
-        for buff in self.__buffs:
-            if buff.stat == 'attack':
-                self.__attack += buff.valeur
-            elif buff.stat == 'defense':
-                self.__defense += buff.valeur
-            elif buff.stat == 'reduction_degats':
-                self.__reduction_degats += buff.valeur
-            elif buff.stat == 'bonus_crit':
-                self.__bonus_crit += buff.valeur
-        
-        # Appliquer les debuffs
-        for debuff in self.__debuffs:
-            if debuff.stat == 'attack':
-                self.__attack += debuff.valeur  # valeur négative
-            elif debuff.stat == 'defense':
-                self.__defense += debuff.valeur
-            elif debuff.stat == 'reduction_degats':
-                self.__reduction_degats += debuff.valeur
+        """Recalcule les stats à partir des totaux des buffs/debuffs actifs"""
+        effets = self.__effets
+        self.__attack = self.__attack_base + effets.total_buffs('attack') + effets.total_debuffs('attack')
+        self.__defense = self.__defense_base + effets.total_buffs('defense') + effets.total_debuffs('defense')
+        self.__reduction_degats = effets.total_buffs('reduction_degats') + effets.total_debuffs('reduction_degats')
+        self.__bonus_crit = effets.total_buffs('bonus_crit')  # Seuls les buffs donnent du critique
         
         # S'assurer que les stats ne deviennent pas négatives
         self.__attack = max(0, self.__attack)
@@ -266,26 +284,17 @@ class Personnage(ABC):
     
     def ajouter_buff(self, buff: Effet):
         """Ajoute un buff au personnage"""
-        self.__buffs.append(buff)
+        self.__effets.ajouter(buff)
         self.recalculer_stats()
     
     def ajouter_debuff(self, debuff: Effet):
         """Ajoute un debuff au personnage"""
-        self.__debuffs.append(debuff)
+        self.__effets.ajouter(debuff)
         self.recalculer_stats()
     
     def mettre_a_jour_effets(self):
-        """Met à jour la durée des effets et les retire s'ils sont expirés"""
-        # Buffs
-        self.__buffs = [b for b in self.__buffs if b.duree > 0]
-        for buff in self.__buffs:
-            buff.duree -= 1
-        
-        # Debuffs
-        self.__debuffs = [d for d in self.__debuffs if d.duree > 0]
-        for debuff in self.__debuffs:
-            debuff.duree -= 1
-        
+        """Fait avancer la durée des effets et retire ceux qui expirent"""
+        self.__effets.avancer()
         self.recalculer_stats()
     
     # MÉTHODES DE GESTION DES FAMILIERS ET ZONES
@@ -293,7 +302,7 @@ class Personnage(ABC):
     def ajouter_familier(self, familier: Familier):
         """Ajoute un familier invoqué"""
         self.__familiers.append(familier)
-        print(f"   🐾 {familier.nom} invoqué! ({familier.element})")
+        self.__sink.emettre(TypeEvenement.INVOCATION, self.__nom, familier.nom, familier.element)
     
     def mettre_a_jour_familiers(self):
         """Met à jour les familiers et retire ceux expirés"""
@@ -309,7 +318,7 @@ class Personnage(ABC):
             degats = familier.attaquer()
             if degats > 0:
                 degats_total += degats
-                print(f"   🐾 {familier.nom} attaque! (+{degats} dégâts)")
+                self.__sink.emettre(TypeEvenement.ATTAQUE_FAMILIER, self.__nom, familier.nom, degats)
         
         if degats_total > 0:
             adversaire.recevoir_degats(degats_total, ignore_defense=False)
@@ -319,7 +328,7 @@ class Personnage(ABC):
     def ajouter_zone(self, zone: ZoneEffet):
         """Ajoute une zone d'effet"""
         self.__zones_effet.append(zone)
-        print(f"   🌊 {zone.nom} créée!")
+        self.__sink.emettre(TypeEvenement.ZONE_CREEE, self.__nom, zone.nom)
     
     def mettre_a_jour_zones(self, adversaire: 'Personnage'):
         """Met à jour les zones et applique leurs effets"""
@@ -327,195 +336,131 @@ class Personnage(ABC):
             degats = zone.appliquer_degats()
             if degats > 0:
                 adversaire.recevoir_degats(degats, ignore_defense=True)
-                print(f"   🌊 {zone.nom} inflige {degats} dégâts!")
+                self.__sink.emettre(TypeEvenement.ZONE_DEGATS, self.__nom, zone.nom, degats)
             
             # Appliquer le debuff si présent
             if zone.effet_debuff and zone.tours_ecoules == 1:
-                debuff = Effet(
-                    'debuff',
-                    zone.effet_debuff['stat'],
-                    zone.effet_debuff['valeur'],
-                    zone.duree_totale,
-                    zone.nom
-                )
+                stat, valeur = zone.effet_debuff
+                debuff = Effet('debuff', stat, valeur, zone.duree_totale, zone.nom)
                 adversaire.ajouter_debuff(debuff)
+                adversaire.sink.emettre(TypeEvenement.ZONE_DEBUFF, adversaire.nom, debuff.nom, debuff.stat,
+                                        debuff.valeur, debuff.duree)
         
         self.__zones_effet = [z for z in self.__zones_effet if z.est_active()]
     
     # MÉTHODES DE COMBAT
     
-    def can_use_skill(self, skill: Dict) -> bool:
+    def can_use_skill(self, skill: Competence) -> bool:
         """Vérifie si une compétence peut être utilisée"""
-        # Vérifier les PM
-        if self.__mp_actuel < skill.get('cout_mp', 0):
-            return False
-        
-        # Vérifier le cooldown (le temps de recharge)
-        skill_id = skill.get('id', skill['nom'])
-        if skill_id in self.__cooldowns and self.__cooldowns[skill_id] > 0:
-            return False
-        
-        return True
+        # Vérifier les PM puis le cooldown (le temps de recharge)
+        return self.__mp_actuel >= skill.cout_mp and self.__cooldowns[skill.uid] <= 0
     
-    def use_skill(self, skill: Dict, opponent: 'Personnage'):
+    def cooldown_restant(self, skill: Competence) -> int:
+        """Retourne le nombre de tours avant que la compétence soit de nouveau disponible"""
+        return max(0, self.__cooldowns[skill.uid])
+    
+    def use_skill(self, skill: Competence, opponent: 'Personnage'):
         """Utilise une compétence sur l'adversaire"""
-        skill_id = skill.get('id', skill['nom'])
-        skill_name = skill['nom']
-        skill_type = skill['type']
-        
         # Consommer les PM
-        mp_cost = skill.get('cout_mp', 0)
+        mp_cost = skill.cout_mp
         self.__mp_actuel -= mp_cost
         
         # Appliquer le cooldown
-        if 'cooldown' in skill and skill['cooldown'] > 0:
-            self.__cooldowns[skill_id] = skill['cooldown']
+        if skill.cooldown > 0:
+            self.__cooldowns[skill.uid] = skill.cooldown
         
         # Stats
-        if skill_name not in self.__skills_utilises:
-            self.__skills_utilises[skill_name] = 0
-        self.__skills_utilises[skill_name] += 1
-        
-        # Affichage de l'utilisation
-        icon = skill.get('icone', '⚔️')
-        print(f"\n🎯 {self.nom} utilise : {icon} {skill_name}")
-        print(f"   💙 PM : {self.__mp_actuel}/{self.__mp_max} (-{mp_cost})")
-        
-        # Apply effects based on type
-        if skill_type in ['attaque_legere', 'attaque_moyenne', 'attaque_lourde']:
-            self._appliquer_attaque(skill, opponent)
-        elif skill_type == 'heal':
-            self._appliquer_heal(skill)
-        elif skill_type == 'buff':
-            self._appliquer_buff(skill)
-        elif skill_type == 'debuff':
-            self._appliquer_debuff(skill, opponent)
-        elif skill_type == 'evasion':
-            self._appliquer_evasion(skill)
-        elif skill_type == 'invocation':
-            self._appliquer_invocation(skill)
-        elif skill_type == 'zone':
-            self._appliquer_zone(skill, opponent)
-    
-    def _appliquer_attaque(self, skill: Dict, adversaire: 'Personnage'):
-        """Applique une attaque"""
-        degats_base = skill.get('degats', 0)
+        uid = skill.uid
+        if not self.__skills_utilises[uid]:
+            self.__ordre_skills.append(uid)
+        self.__skills_utilises[uid] += 1
+        self.__dernier_skill = uid
+        
+        # Événement d'utilisation
+        self.__sink.emettre(TypeEvenement.SKILL, self.__nom, skill.nom, skill.icone,
+                            self.__mp_actuel, self.__mp_max, mp_cost)
         
+        # Appliquer les effets (méthode résolue à la compilation du skill)
+        skill.appliquer(self, skill, opponent)
+    
+    def _appliquer_attaque(self, skill: Competence, adversaire: 'Personnage'):
+        """Applique une attaque"""
         # Calcul des dégâts
-        degats = degats_base
+        degats = skill.degats or 0
         
         # Coup critique
         chance_crit = 0.15 + (self.__bonus_crit / 100)
         if self.__skills_surchargees:
             chance_crit += 0.30
         
-        est_critique = random.random() < chance_crit
+        est_critique = self.__rng.chance(chance_crit)
         if est_critique:
             degats = int(degats * 1.5)
             self.__coups_critiques += 1
-            print(f"   💥 COUP CRITIQUE!")
+            self.__sink.emettre(TypeEvenement.CRITIQUE, self.__nom)
         
         # Appliquer les dégâts
         adversaire.recevoir_degats(degats)
         self.__degats_infliges_total += degats
         
         # Effets additionnels du skill
-        if 'effets' in skill:
-            for effet in skill['effets']:
-                if effet['type'] == 'debuff':
-                    debuff = Effet(
-                        'debuff',
-                        effet['stat'],
-                        effet['valeur'],
-                        effet['duree'],
-                        skill['nom']
-                    )
-                    adversaire.ajouter_debuff(debuff)
-                    print(f"   🔻 {adversaire.nom} subit: {debuff}")
-    
-    def _appliquer_heal(self, skill: Dict):
+        self.__appliquer_debuffs(skill, adversaire)
+    
+    def __appliquer_debuffs(self, skill: Competence, adversaire: 'Personnage'):
+        """Applique les debuffs d'un skill à l'adversaire"""
+        for stat, valeur, duree in skill.effets_debuff:
+            debuff = Effet('debuff', stat, valeur, duree, skill.nom)
+            adversaire.ajouter_debuff(debuff)
+            adversaire.sink.emettre(TypeEvenement.DEBUFF, adversaire.nom, debuff.nom, debuff.stat,
+                                    debuff.valeur, debuff.duree)
+    
+    def _appliquer_heal(self, skill: Competence, adversaire: 'Personnage'):
         """Applique un soin"""
-        heal = skill.get('heal', 0)
         hp_avant = self.__hp_actuel
-        self.hp_actuel = self.__hp_actuel + heal
+        self.hp_actuel = self.__hp_actuel + skill.heal
         heal_effectif = self.__hp_actuel - hp_avant
-        print(f"   💚 {self.nom} récupère {heal_effectif} HP!")
+        self.__sink.emettre(TypeEvenement.SOIN, self.__nom, heal_effectif)
     
-    def _appliquer_buff(self, skill: Dict):
+    def _appliquer_buff(self, skill: Competence, adversaire: 'Personnage'):
         """Applique un buff"""
-        if 'effets' in skill:
-            for effet in skill['effets']:
-                if effet['type'] == 'buff':
-                    buff = Effet(
-                        'buff',
-                        effet['stat'],
-                        effet['valeur'],
-                        effet['duree'],
-                        skill['nom']
-                    )
-                    self.ajouter_buff(buff)
-                    print(f"   🔺 {self.nom} gagne: {buff}")
+        for stat, valeur, duree in skill.effets_buff:
+            buff = Effet('buff', stat, valeur, duree, skill.nom)
+            self.ajouter_buff(buff)
+            self.__sink.emettre(TypeEvenement.BUFF, self.__nom, buff.nom, buff.stat, buff.valeur, buff.duree)
         
         # Effets spéciaux
-        if 'special' in skill:
-            if skill['special'] == 'surcharge':
-                self.__skills_surchargees = True
-                print(f"   ⚡ Compétences surchargées!")
+        if skill.surcharge:
+            self.__skills_surchargees = True
+            self.__sink.emettre(TypeEvenement.SURCHARGE, self.__nom)
     
-    def _appliquer_debuff(self, skill: Dict, adversaire: 'Personnage'):
+    def _appliquer_debuff(self, skill: Competence, adversaire: 'Personnage'):
         """Applique un debuff"""
         # Dégâts du skill debuff
-        if 'degats' in skill:
-            degats = skill['degats']
+        if skill.degats is not None:
+            degats = skill.degats
             adversaire.recevoir_degats(degats)
             self.__degats_infliges_total += degats
         
         # Appliquer les debuffs
-        if 'effets' in skill:
-            for effet in skill['effets']:
-                if effet['type'] == 'debuff':
-                    debuff = Effet(
-                        'debuff',
-                        effet['stat'],
-                        effet['valeur'],
-                        effet['duree'],
-                        skill['nom']
-                    )
-                    adversaire.ajouter_debuff(debuff)
-                    print(f"   🔻 {adversaire.nom} subit: {debuff}")
-    
-    def _appliquer_evasion(self, skill: Dict):
+        self.__appliquer_debuffs(skill, adversaire)
+    
+    def _appliquer_evasion(self, skill: Competence, adversaire: 'Personnage'):
         """Applique une évasion d'urgence"""
         # Ajouter un buff d'évasion temporaire
-        buff = Effet('buff', 'evasion', 100, 1, skill['nom'])
+        buff = Effet('buff', 'evasion', 100, 1, skill.nom)
         self.ajouter_buff(buff)
-        print(f"   💨 {self.nom} esquive!")
+        self.__sink.emettre(TypeEvenement.EVASION, self.__nom)
     
-    def _appliquer_invocation(self, skill: Dict):
+    def _appliquer_invocation(self, skill: Competence, adversaire: 'Personnage'):
         """Applique une invocation de familier"""
-        if 'familier' in skill:
-            fam_data = skill['familier']
-            familier = Familier(
-                fam_data['nom'],
-                fam_data['element'],
-                fam_data['degats'],
-                fam_data['duree']
-            )
-            self.ajouter_familier(familier)
-    
-    def _appliquer_zone(self, skill: Dict, adversaire: 'Personnage'):
-        """Applique une zone d'effet"""
-        if 'zone' in skill:
-            zone_data = skill['zone']
-            zone = ZoneEffet(
-                skill['nom'],
-                zone_data['degats'],
-                zone_data['intervalle'],
-                zone_data['duree'],
-                zone_data.get('debuff')
-            )
-            self.ajouter_zone(zone)
-            adversaire  # La zone affectera l'adversaire
+        if skill.familier:
+            self.ajouter_familier(Familier(*skill.familier))
+    
+    def _appliquer_zone(self, skill: Competence, adversaire: 'Personnage'):
+        """Applique une zone d'effet (qui affectera l'adversaire à chaque tour)"""
+        if skill.zone:
+            degats, intervalle, duree, debuff = skill.zone
+            self.ajouter_zone(ZoneEffet(skill.nom, degats, intervalle, duree, debuff))
     
     def recevoir_degats(self, degats: int, ignore_defense: bool = False):
         """Reçoit des dégâts"""
@@ -535,23 +480,25 @@ class Personnage(ABC):
         self.__hp_actuel = max(0, self.__hp_actuel - degats_finaux)
         self.__degats_recus_total += degats_finaux
         
-        print(f"   💔 {self.nom} subit {degats_finaux} dégâts! (HP: {self.__hp_actuel}/{self.__hp_max})")
+        self.__sink.emettre(TypeEvenement.DEGATS, self.__nom, degats_finaux, self.__hp_actuel, self.__hp_max)
     
     def mettre_a_jour_cooldowns(self):
         """Réduit les cooldowns de 1"""
-        for skill_id in list(self.__cooldowns.keys()):
-            self.__cooldowns[skill_id] -= 1
-            if self.__cooldowns[skill_id] <= 0:
-                del self.__cooldowns[skill_id]
+        cooldowns = self.__cooldowns
+        for uid in range(len(cooldowns)):
+            if cooldowns[uid] > 0:
+                cooldowns[uid] -= 1
     
     def start_turn(self, opponent: 'Personnage'):
         """Actions au début du tour"""
+        self.__dernier_skill = None
+        
         # Régénération passive de MP
         mp_regen = 15
         old_mp = self.__mp_actuel
         self.__mp_actuel = min(self.__mp_actuel + mp_regen, self.__mp_max)
         if self.__mp_actuel > old_mp:
-            print(f"   💙 {self.__nom} régénère {self.__mp_actuel - old_mp} MP (Régénération passive)")
+            self.__sink.emettre(TypeEvenement.REGEN_MP, self.__nom, self.__mp_actuel - old_mp)
         
         # Attaques des familiers
         self.attaque_familiers(opponent)
@@ -566,7 +513,7 @@ class Personnage(ABC):
     
     def end_turn(self):
         """Actions à la fin du tour"""
-        pass
+        self.__sink.flush()
     
     @property
     def is_alive(self) -> bool:
@@ -587,8 +534,8 @@ class Personnage(ABC):
         self.__hp_actuel = self.__hp_max
         self.__mp_actuel = self.__mp_max
         
-        print(f"\n🎉 {self.nom} a atteint le niveau {self.__niveau}!")
-        print(f"   +{bonus_stats} à toutes les stats!")
+        self.__sink.emettre(TypeEvenement.NIVEAU, self.__nom, self.__niveau, bonus_stats)
+        self.__sink.flush()
     
     def display_stats(self):
         """Affiche les statistiques du personnage"""
@@ -617,10 +564,10 @@ class Personnage(ABC):
         print(f"   ⭐ Niveau: {self.__niveau}")
         
         # Affiche les buffs/debuffs actifs
-        if self.__buffs:
-            print(f"   🔺 Buffs: {', '.join([b.nom for b in self.__buffs])}")
-        if self.__debuffs:
-            print(f"   🔻 Debuffs: {', '.join([d.nom for d in self.__debuffs])}")
+        if self.__effets.buffs:
+            print(f"   🔺 Buffs: {', '.join([b.nom for b in self.__effets.buffs])}")
+        if self.__effets.debuffs:
+            print(f"   🔻 Debuffs: {', '.join([d.nom for d in self.__effets.debuffs])}")
         if self.__familiers:
             print(f"   🐾 Familiars: {', '.join([f.nom for f in self.__familiers])}")
         if self.__zones_effet:
@@ -639,5 +586,85 @@ class Personnage(ABC):
             'degats_infliges': self.__degats_infliges_total,
             'degats_recus': self.__degats_recus_total,
             'coups_critiques': self.__coups_critiques,
-            'skills_utilises': self.__skills_utilises
+            'skills_utilises': {self.__skills[uid].nom: self.__skills_utilises[uid] for uid in self.__ordre_skills}
         }
+    
+    # MÉTHODES DE SNAPSHOT
+    
+    def snapshot(self) -> Tuple:
+        """
+        Capture l'état complet du personnage en cours de combat
+        
+        Les compétences compilées, le sink et le générateur aléatoire ne sont
+        pas copiés (le générateur est capturé par Combat.snapshot).
+        
+        Returns:
+            État immuable, à passer à restore()
+        """
+        return (
+            self.__hp_max, self.__mp_max, self.__attack_base, self.__defense_base, self.__niveau,
+            self.__hp_actuel, self.__mp_actuel, self.__endurance_actuel,
+            self.__attack, self.__defense, self.__reduction_degats, self.__bonus_crit,
+            self.__effets.snapshot(), tuple(self.__cooldowns),
+            tuple((f.nom, f.element, f.degats, f.duree, f.tours_restants) for f in self.__familiers),
+            tuple((z.nom, z.degats, z.intervalle, z.duree_totale, z.effet_debuff, z.tours_ecoules)
+                  for z in self.__zones_effet),
+            self.__degats_infliges_total, self.__degats_recus_total, self.__coups_critiques,
+            tuple(self.__skills_utilises), tuple(self.__ordre_skills), self.__dernier_skill,
+            self.__skills_surchargees
+        )
+    
+    def restore(self, etat: Tuple):
+        """Restaure un état obtenu avec snapshot()"""
+        (self.__hp_max, self.__mp_max, self.__attack_base, self.__defense_base, self.__niveau,
+         self.__hp_actuel, self.__mp_actuel, self.__endurance_actuel,
+         self.__attack, self.__defense, self.__reduction_degats, self.__bonus_crit,
+         effets, cooldowns, familiers, zones,
+         self.__degats_infliges_total, self.__degats_recus_total, self.__coups_critiques,
+         skills_utilises, ordre_skills, self.__dernier_skill, self.__skills_surchargees) = etat
+        
+        self.__effets.restore(effets)
+        self.__cooldowns = list(cooldowns)
+        self.__skills_utilises = list(skills_utilises)
+        self.__ordre_skills = list(ordre_skills)
+        
+        self.__familiers = []
+        for nom, element, degats, duree, tours_restants in familiers:
+            familier = Familier(nom, element, degats, duree)
+            familier.tours_restants = tours_restants
+            self.__familiers.append(familier)
+        
+        self.__zones_effet = []
+        for nom, degats, intervalle, duree_totale, effet_debuff, tours_ecoules in zones:
+            zone = ZoneEffet(nom, degats, intervalle, duree_totale, effet_debuff)
+            zone.tours_ecoules = tours_ecoules
+            self.__zones_effet.append(zone)
+    
+    def cle_etat(self) -> Tuple:
+        """
+        Clé canonique et hashable de l'état de jeu du personnage
+        
+        Seul ce qui influence la suite du combat en fait partie: les compteurs
+        statistiques et l'ordre des effets, familiers et zones sont ignorés.
+        Deux personnages de même clé jouent la suite du combat à l'identique.
+        """
+        return (
+            self.__skills, self.__hp_actuel, self.__mp_actuel, self.__hp_max, self.__mp_max,
+            self.__attack_base, self.__defense_base, self.__skills_surchargees,
+            tuple(self.__cooldowns), self.__effets.cle(),
+            tuple(sorted((f.nom, f.degats, f.tours_restants) for f in self.__familiers)),
+            tuple(sorted((z.nom, z.degats, z.intervalle, z.duree_totale, z.tours_ecoules, z.effet_debuff)
+                         for z in self.__zones_effet))
+        )
+    
+    def cloner(self) -> 'Personnage':
+        """
+        Retourne une copie indépendante du personnage
+        
+        La copie partage les compétences, le sink et le générateur aléatoire
+        de l'original.
+        """
+        clone = copy.copy(self)
+        clone.__effets = GestionnaireEffets()
+        clone.restore(self.snapshot())
+        return clone
@@ -0,0 +1,182 @@
+"""
+Module du registre des configurations de personnages
+
+Chaque fichier config/<classe>.json est lu, validé et compilé une seule
+fois par processus. Le registre ne relit un fichier que si sa date de
+modification a changé, ce qui permet au jeu de prendre en compte une
+config éditée sans redémarrer.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+from src.models.competence import CODES_TYPE, Competence, compiler_skills
+
+
+# Répertoire par défaut des configurations
+CONFIG_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'config'))
+
+_CLES_RACINE = ('nom', 'classe', 'description', 'stats', 'passif', 'skills')
+_CLES_EFFET = ('type', 'stat', 'valeur', 'duree')
+_CLES_FAMILIER = ('nom', 'element', 'degats', 'duree')
+_CLES_ZONE = ('degats', 'intervalle', 'duree')
+
+
+def _verifier(condition: bool, chemin: str, message: str):
+    if not condition:
+        raise ValueError(f"Config invalide ({os.path.basename(chemin)}): {message}")
+
+
+def valider_config(data: Dict, chemin: str = '<config>'):
+    """
+    Vérifie la structure d'une configuration de personnage
+
+    Args:
+        data: Configuration JSON déjà parsée
+        chemin: Chemin du fichier (pour les messages d'erreur)
+
+    Raises:
+        ValueError: Si la configuration est incomplète ou incohérente
+    """
+    _verifier(isinstance(data, dict), chemin, "la racine doit être un objet")
+    for cle in _CLES_RACINE:
+        _verifier(cle in data, chemin, f"clé '{cle}' manquante")
+    _verifier(isinstance(data['stats'], dict), chemin, "'stats' doit être un objet")
+    _verifier(isinstance(data['passif'], dict) and 'valeur' in data['passif'], chemin,
+              "'passif' doit contenir une 'valeur'")
+    _verifier(isinstance(data['skills'], list) and data['skills'], chemin, "'skills' doit être une liste non vide")
+
+    ids = set()
+    for i, skill in enumerate(data['skills'], 1):
+        nom = skill.get('nom', f'skill n°{i}')
+        _verifier('nom' in skill and 'type' in skill, chemin, f"{nom}: 'nom' et 'type' sont obligatoires")
+        _verifier(skill['type'] in CODES_TYPE, chemin, f"{nom}: type inconnu '{skill['type']}'")
+
+        skill_id = skill.get('id', skill['nom'])
+        _verifier(skill_id not in ids, chemin, f"{nom}: identifiant '{skill_id}' en double")
+        ids.add(skill_id)
+
+        for cle in ('cout_mp', 'cooldown', 'degats', 'heal', 'heal_mp'):
+            if cle in skill:
+                _verifier(isinstance(skill[cle], (int, float)) and skill[cle] >= 0, chemin,
+                          f"{nom}: '{cle}' doit être un nombre positif")
+
+        for effet in skill.get('effets', ()):
+            _verifier(all(cle in effet for cle in _CLES_EFFET), chemin,
+                      f"{nom}: un effet doit définir {', '.join(_CLES_EFFET)}")
+            _verifier(effet['type'] in ('buff', 'debuff'), chemin, f"{nom}: type d'effet inconnu '{effet['type']}'")
+
+        familiers = [skill[cle] for cle in ('familier', 'auto_invocation') if cle in skill]
+        familiers += skill.get('familiers', [])
+        for familier in familiers:
+            _verifier(all(cle in familier for cle in _CLES_FAMILIER), chemin,
+                      f"{nom}: un familier doit définir {', '.join(_CLES_FAMILIER)}")
+        if skill.get('familier_choice'):
+            _verifier(bool(skill.get('familiers')), chemin, f"{nom}: 'familier_choice' sans 'familiers'")
+
+        if 'zone' in skill:
+            zone = skill['zone']
+            _verifier(all(cle in zone for cle in _CLES_ZONE), chemin,
+                      f"{nom}: une zone doit définir {', '.join(_CLES_ZONE)}")
+            _verifier(zone['intervalle'] > 0, chemin, f"{nom}: l'intervalle de zone doit être positif")
+
+
+class DefinitionPersonnage:
+    """Configuration validée d'une classe de personnage, partagée par toutes ses instances"""
+
+    def __init__(self, identifiant: str, data: Dict, chemin: Optional[str] = None, mtime: int = 0):
+        """
+        Args:
+            identifiant: Identifiant de la classe ('sage', 'magicien', ...)
+            data: Configuration JSON validée
+            chemin: Fichier d'origine (None pour une définition construite en mémoire)
+            mtime: Date de modification du fichier au moment de la lecture
+        """
+        self.identifiant = identifiant
+        self.data = data
+        self.chemin = chemin
+        self.mtime = mtime
+
+        self.nom = data['nom']
+        self.classe = data['classe']
+        self.description = data['description']
+        self.stats = data['stats']
+        self.passif = data['passif']
+        self._competences: Dict[type, Tuple[Competence, ...]] = {}
+        self._empreinte: Optional[str] = None
+
+    @property
+    def empreinte(self) -> str:
+        """Hash SHA-256 du contenu de la configuration (indépendant de la mise en forme du fichier)"""
+        if self._empreinte is None:
+            canonique = json.dumps(self.data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+            self._empreinte = hashlib.sha256(canonique.encode('utf-8')).hexdigest()
+        return self._empreinte
+
+    def competences(self, classe_personnage: type) -> Tuple[Competence, ...]:
+        """
+        Retourne la table des compétences compilée pour une classe de personnage
+
+        La compilation n'a lieu qu'une fois par classe (les handlers dépendent
+        des méthodes redéfinies par la classe).
+        """
+        table = self._competences.get(classe_personnage)
+        if table is None:
+            table = compiler_skills(self.data['skills'], classe_personnage)
+            self._competences[classe_personnage] = table
+        return table
+
+
+class RegistreConfig:
+    """Cache des configurations de personnages, invalidé par date de modification"""
+
+    def __init__(self, dossier: str = CONFIG_DIR):
+        """
+        Args:
+            dossier: Répertoire contenant les fichiers <classe>.json
+        """
+        self.dossier = dossier
+        self.surveiller = True  # False pour ne plus jamais relire (simulations en lot)
+        self._definitions: Dict[str, DefinitionPersonnage] = {}
+
+    def chemin(self, identifiant: str) -> str:
+        return os.path.join(self.dossier, f'{identifiant}.json')
+
+    def definition(self, identifiant: str) -> DefinitionPersonnage:
+        """
+        Retourne la définition d'une classe, en relisant le fichier seulement s'il a changé
+
+        Args:
+            identifiant: Identifiant de la classe ('sage', 'magicien', ...)
+
+        Raises:
+            FileNotFoundError: Si le fichier de configuration n'existe pas
+            ValueError: Si la configuration est invalide
+        """
+        definition = self._definitions.get(identifiant)
+        if definition is not None and not self.surveiller:
+            return definition
+
+        chemin = self.chemin(identifiant)
+        mtime = os.stat(chemin).st_mtime_ns
+        if definition is None or definition.mtime != mtime:
+            with open(chemin, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            valider_config(data, chemin)
+            definition = DefinitionPersonnage(identifiant, data, chemin, mtime)
+            self._definitions[identifiant] = definition
+
+        return definition
+
+    def invalider(self, identifiant: Optional[str] = None):
+        """Oublie une définition (ou toutes) pour forcer une relecture"""
+        if identifiant is None:
+            self._definitions.clear()
+        else:
+            self._definitions.pop(identifiant, None)
+
+
+# Registre partagé par tout le processus
+REGISTRE = RegistreConfig()
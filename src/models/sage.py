@@ -2,36 +2,38 @@
 Module définissant la classe Sage
 """
 
-import json
-import os
+from src.models.competence import Competence
+from src.models.evenements import TypeEvenement
 from src.models.personnage_v2 import Personnage, Familier
+from src.models.registre import REGISTRE, DefinitionPersonnage
 
 
 class Sage(Personnage):
     """Classe représentant le Sage - Maître des arts mystiques"""
     
-    def __init__(self, nom_custom: str = None):
-        # Chargement de la configuration
-        config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'sage.json')
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    __slots__ = ('classe', 'description', 'passif', 'passif_mp')
+    
+    def __init__(self, nom_custom: str = None, definition: DefinitionPersonnage = None):
+        # Configuration partagée (lue une seule fois par le registre)
+        if definition is None:
+            definition = REGISTRE.definition('sage')
         
         # Utiliser le nom personnalisé ou celui du config
-        nom_final = nom_custom if nom_custom else data['nom']
+        nom_final = nom_custom if nom_custom else definition.nom
         
         # Initialisation via la classe mère
-        super().__init__(nom_final, data['skills'], data['stats'])
+        super().__init__(nom_final, definition.competences(type(self)), definition.stats)
         
-        self.classe = data['classe']
-        self.description = data['description']
-        self.passif = data['passif']
+        self.classe = definition.classe
+        self.description = definition.description
+        self.passif = definition.passif
+        self.passif_mp = self.passif['valeur']
     
-    def utiliser_skill(self, skill: dict, adversaire: 'Personnage'):
+    def utiliser_skill(self, skill: Competence, adversaire: 'Personnage'):
         """Override pour ajouter la récupération de mana passive"""
         # Utiliser le skill normalement
         super().utiliser_skill(skill, adversaire)
         
         # Passif: Récupération de mana +10 par skill utilisé
-        self.mp_actuel = self.mp_actuel + self.passif['valeur']
-        print(f"   🔮 Récupération mana passive: +{self.passif['valeur']} MP")
+        self.mp_actuel = self.mp_actuel + self.passif_mp
+        self.sink.emettre(TypeEvenement.PASSIF_MP, self.nom, self.passif_mp)
@@ -1,17 +1,24 @@
 """
 Package utils - Utilitaires du jeu
+
+Les modules d'interface (menus, saisies, art ASCII) ne sont importés qu'au
+premier accès à l'un de leurs noms: les chemins sans terminal n'en paient
+pas le coût.
 """
 
-from src.utils.affichage import (
-    afficher_titre,
-    afficher_tour,
-    afficher_introduction,
-    afficher_victoire,
-    charger_config
-)
-from src.utils.input_handler import InputHandler
-from src.utils.menu import Menu
-from src.utils import ascii_art
+import importlib
+
+# Nom exporté -> module qui le définit (None: le nom est le module lui-même)
+_EXPORTS = {
+    'afficher_titre': 'src.utils.affichage',
+    'afficher_tour': 'src.utils.affichage',
+    'afficher_introduction': 'src.utils.affichage',
+    'afficher_victoire': 'src.utils.affichage',
+    'charger_config': 'src.utils.affichage',
+    'InputHandler': 'src.utils.input_handler',
+    'Menu': 'src.utils.menu',
+    'ascii_art': None
+}
 
 __all__ = [
     'afficher_titre',
@@ -23,3 +30,19 @@ __all__ = [
     'Menu',
     'ascii_art'
 ]
+
+
+def __getattr__(nom):
+    if nom not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    module = _EXPORTS[nom]
+    if module is None:
+        valeur = importlib.import_module(f'{__name__}.{nom}')
+    else:
+        valeur = getattr(importlib.import_module(module), nom)
+    globals()[nom] = valeur
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,14 @@
 """
 Module ASCII Art - WiZ-Fight
 Art visuel personnalisé par Savage
+
+Importé seulement par les écrans qui dessinent (menus, combats
+interactifs): les commandes sans terminal ne le chargent jamais.
 """
 
+import sys
+from typing import Optional
+
 
 LOGO_WIZFIGHT = """
 ╔══════════════════════════════════════════════════════════════════════╗
@@ -156,10 +162,19 @@ def display_logo():
     print(LOGO_WIZFIGHT)
 
 
-def display_welcome_screen():
-    """Displays welcome screen with game presentation"""
+def display_welcome_screen(wait: Optional[bool] = None):
+    """
+    Displays welcome screen with game presentation
+    
+    Args:
+        wait: Waits for Enter before returning (default: only when stdin is a terminal,
+            so scripted runs are never blocked)
+    """
     print(ECRAN_BIENVENUE)
-    input()  # Wait for user to press Enter
+    if wait is None:
+        wait = sys.stdin is not None and sys.stdin.isatty()
+    if wait:
+        input()  # Wait for user to press Enter
 
 
 def display_character_skin(player_class: str, mini: bool = False):
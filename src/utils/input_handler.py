@@ -2,7 +2,7 @@
 Module de gestion des entrées du joueur
 """
 
-from typing import Dict, List
+from src.models.competence import Competence
 from src.models.personnage_v2 import Personnage
 
 
@@ -10,7 +10,7 @@ class InputHandler:
     """Gestion des entrées du joueur"""
     
     @staticmethod
-    def choose_skill(character: Personnage, opponent: Personnage) -> Dict:
+    def choose_skill(character: Personnage, opponent: Personnage) -> Competence:
         """
         Affiche le menu de sélection des compétences et retourne le choix du joueur
         
@@ -38,18 +38,16 @@ class InputHandler:
         
         available_skills = []
         for i, skill in enumerate(character.skills, 1):
-            skill_id = skill.get('id', skill['nom'])
-            skill_name = skill['nom']
-            skill_type = skill['type']
-            mp_cost = skill.get('cout_mp', 0)
-            icon = skill.get('icone', '⚔️')
+            skill_name = skill.nom
+            skill_type = skill.type
+            mp_cost = skill.cout_mp
+            icon = skill.icone
             
             # Véruifie si la compétence peut être utilisée
             can_use = character.can_use_skill(skill)
             
             # Obtient le cooldown restant
-            cooldowns = character._Personnage__cooldowns
-            remaining_cooldown = cooldowns.get(skill_id, 0)
+            remaining_cooldown = character.cooldown_restant(skill)
             
             # Affichage formaté
             status = ""
@@ -78,7 +76,7 @@ class InputHandler:
             print(f"\n┌─ {i}. {icon} {skill_name}")
             print(f"│  📋 Type: {type_mapping}")
             print(f"│  💙 Coût: {mp_cost} MP")
-            if cooldown := skill.get('cooldown', 0):
+            if cooldown := skill.cooldown:
                 cooldown_status = f"{remaining_cooldown} tours" if remaining_cooldown > 0 else "Prêt"
                 print(f"│  ⏱️  Cooldown: {cooldown_status}")
             print(f"└─ {status}")
@@ -100,12 +98,10 @@ class InputHandler:
                     if character.can_use_skill(chosen_skill):
                         return chosen_skill
                     else:
-                        skill_id = chosen_skill.get('id', chosen_skill['nom'])
-                        cooldowns = character._Personnage__cooldowns
-                        remaining_cooldown = cooldowns.get(skill_id, 0)
+                        remaining_cooldown = character.cooldown_restant(chosen_skill)
                         
-                        if character.current_mp < chosen_skill.get('cout_mp', 0):
-                            print(f"❌ MP insuffisants ! ({character.current_mp}/{chosen_skill.get('cout_mp', 0)})")
+                        if character.current_mp < chosen_skill.cout_mp:
+                            print(f"❌ MP insuffisants ! ({character.current_mp}/{chosen_skill.cout_mp})")
                         elif remaining_cooldown > 0:
                             print(f"❌ Compétence en cooldown ! ({remaining_cooldown} tours restants)")
                 else:
@@ -5,6 +5,7 @@ Module menu - Gestion des menus principaux du jeu
 from typing import Optional, Tuple
 from src.models.sage import Sage
 from src.models.magicien import Magicien
+from src.models.registre import REGISTRE
 from src.utils import ascii_art
 
 
@@ -66,40 +67,38 @@ class Menu:
     @staticmethod
     def ask_player_name(player_class: str) -> str:
         """Demande le nom du joueur après le choix de la classe"""
-        if player_class == 'sage':
-            character = Sage()
-            icon = "🧙"
-        else:
-            character = Magicien()
-            icon = "🔮"
-        print(f"\n✨ Vous avez choisi : {icon} {character.nom}")
+        definition = REGISTRE.definition(player_class)
+        icon = "🧙" if player_class == 'sage' else "🔮"
+        print(f"\n✨ Vous avez choisi : {icon} {definition.nom}")
         
         while True:
-            name = input(f"\n📝 Quel est votre nom, {character.nom} ? ").strip()
+            name = input(f"\n📝 Quel est votre nom, {definition.nom} ? ").strip()
             if name:
                 return name
             print("❌ Le nom ne peut pas être vide !")
     
     @staticmethod
     def show_character_details(player_class: str):
-        """Affiche les détails complets du personnage"""
+        """Affiche les détails complets du personnage (lus dans sa config, sans créer de personnage)"""
+        definition = REGISTRE.definition(player_class)
         if player_class == 'sage':
-            character = Sage()
+            classe_personnage = Sage
             icon = "🧙"
         else:
-            character = Magicien()
+            classe_personnage = Magicien
             icon = "🔮"
+        stats = definition.stats
         
         print("\n" + "="*70)
-        print(f"📖 DETAILS - {icon} {character.nom}")
+        print(f"📖 DETAILS - {icon} {definition.nom}")
         print("="*70)
         
-        # Stats de base
+        # Stats de base (valeurs par défaut de Personnage si la config ne les précise pas)
         print(f"\n📊 STATS DE BASE :")
-        print(f"   ❤️  HP : {character.hp_max}")
-        print(f"   💙 MP : {character.mp_max}")
-        print(f"   ⚔️  ATQ : {character.attack}")
-        print(f"   🛡️  DEF : {character.defense}")
+        print(f"   ❤️  HP : {stats.get('hp_max', 500)}")
+        print(f"   💙 MP : {stats.get('mp_max', 450)}")
+        print(f"   ⚔️  ATQ : {stats.get('attack', 250)}")
+        print(f"   🛡️  DEF : {stats.get('defense', 300)}")
         
         # Passif
         print(f"\n✨ CAPACITÉ PASSIVE :")
@@ -115,13 +114,14 @@ class Menu:
         print(f"\n⚔️  COMPÉTENCES DISPONIBLES :")
         print("="*70)
         
-        for i, skill in enumerate(character.skills, 1):
-            skill_icon = skill.get('icone', '⚔️')
-            name = skill['nom']
-            skill_type = skill['type'].replace('_', ' ').title()
-            mp_cost = skill.get('cout_mp', skill.get('mp_cost', 0))
-            cooldown = skill.get('cooldown', 0)
-            desc = skill['description']
+        # Table compilée partagée par la classe (compilée une seule fois par le registre)
+        for i, skill in enumerate(definition.competences(classe_personnage), 1):
+            skill_icon = skill.icone
+            name = skill.nom
+            skill_type = skill.type.replace('_', ' ').title()
+            mp_cost = skill.cout_mp
+            cooldown = skill.cooldown
+            desc = skill.description
             
             print(f"\n{'─'*70}")
             print(f"{i}. {skill_icon} {name} [{skill_type}]")
@@ -131,26 +131,25 @@ class Menu:
             print(f"   📝 {desc}")
             
             # Détails des effets
-            if 'degats' in skill:
-                print(f"   💥 Dégâts : {skill['degats']}")
+            if skill.degats is not None:
+                print(f"   💥 Dégâts : {skill.degats}")
             
-            if 'heal' in skill:
-                print(f"   💚 Soin : {skill['heal']} HP")
+            if skill.heal:
+                print(f"   💚 Soin : {skill.heal} HP")
             
-            if 'effets' in skill:
-                for effect in skill['effets']:
-                    if effect['type'] == 'buff':
-                        print(f"   🔺 Buff: +{effect['valeur']} {effect['stat']} ({effect['duree']} tours)")
-                    elif effect['type'] == 'debuff':
-                        print(f"   🔻 Debuff: {effect['valeur']} {effect['stat']} ({effect['duree']} tours)")
+            for effect_type, stat, valeur, duree in skill.effets:
+                if effect_type == 'buff':
+                    print(f"   🔺 Buff: +{valeur} {stat} ({duree} tours)")
+                elif effect_type == 'debuff':
+                    print(f"   🔻 Debuff: {valeur} {stat} ({duree} tours)")
             
-            if 'familier' in skill:
-                fam = skill['familier']
-                print(f"   🐾 Invocations : {fam['nom']} ({fam['element']}) - {fam['degats']} dégâts/tour ({fam['duree']} tours)")
+            if skill.familier:
+                fam_nom, fam_element, fam_degats, fam_duree = skill.familier
+                print(f"   🐾 Invocations : {fam_nom} ({fam_element}) - {fam_degats} dégâts/tour ({fam_duree} tours)")
             
-            if 'zone' in skill:
-                zone = skill['zone']
-                print(f"   🌊 Zone: {zone['degats']} dégâts/tour pendant {zone['duree']} tours")
+            if skill.zone:
+                zone_degats, _, zone_duree, _ = skill.zone
+                print(f"   🌊 Zone: {zone_degats} dégâts/tour pendant {zone_duree} tours")
         
         print("\n" + "="*70)
         input("\n⏎ Appuyez sur Entrée pour revenir au menu...")
@@ -179,6 +178,24 @@ class Menu:
                 return choice
             print("❌ Choix invalide !")
     
+    @staticmethod
+    def pvp_menu() -> str:
+        """Affiche le sous-menu du PvP en réseau"""
+        print("\n" + "="*70)
+        print("👥 JOUEUR CONTRE JOUEUR (réseau)")
+        print("="*70)
+        print("\n1. 🏠 Héberger une partie sur cette machine")
+        print("2. 🌐 Rejoindre une partie")
+        print("3. 🔁 Reprendre une partie interrompue")
+        print("4. 🔙 Retour")
+        print("\n" + "="*70)
+        
+        while True:
+            choice = input("\nVotre choix (1-4) : ").strip()
+            if choice in ['1', '2', '3', '4']:
+                return choice
+            print("❌ Choix invalide !")
+    
     @staticmethod
     def confirm_pve_battle(player_name: str, player_class: str) -> bool:
         """Confirme le début d'une bataille PvE"""
@@ -0,0 +1,29 @@
+"""
+Fixtures partagées des tests
+"""
+
+import asyncio
+
+import pytest
+
+from src.game.serveur import ServeurJeu
+
+
+@pytest.fixture
+def jouer_contre():
+    """Fonction qui lance un serveur sur un port libre, exécute scenario(serveur) contre lui, puis l'arrête"""
+    def jouer(scenario, **options):
+        async def principal():
+            serveur = ServeurJeu(port=0, **options)
+            await serveur.demarrer()
+            tache = asyncio.create_task(serveur.servir())
+            try:
+                return await scenario(serveur)
+            finally:
+                tache.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await tache
+
+        return asyncio.run(principal())
+
+    return jouer
@@ -0,0 +1,88 @@
+"""
+Tests du cache de combats - Succès, échecs, éviction et simulations relancées
+"""
+
+import pytest
+
+from src.game.cache_combats import CacheCombats, cle_combat
+from src.game.monte_carlo import lancer_simulation
+
+
+def _cle(seed: int) -> bytes:
+    return cle_combat('sage', 'magicien', seed, ('normal', 'normal'), 1000)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CacheCombats(str(tmp_path / 'combats.sqlite'), taille_max=10)
+    yield cache
+    cache.fermer()
+
+
+def test_echec_puis_succes(cache):
+    """Un combat absent est un échec; une fois enregistré, il est relu tel quel"""
+    assert cache.chercher([_cle(1)]) == {}
+    assert cache.echecs == 1
+
+    cache.enregistrer({_cle(1): {'vainqueur': 'IA-Sage-1', 'tours': 12}})
+    assert cache.chercher([_cle(1), _cle(2)]) == {_cle(1): {'vainqueur': 'IA-Sage-1', 'tours': 12}}
+    assert (cache.succes, cache.echecs) == (1, 2)
+    assert len(cache) == 1
+
+
+def test_cle_depend_de_tout_ce_qui_determine_le_combat():
+    """Graine, IA, limite de tours et ordre des classes changent la clé"""
+    cles = {
+        _cle(1), _cle(2),
+        cle_combat('sage', 'magicien', 1, ('normal', 'difficile'), 1000),
+        cle_combat('sage', 'magicien', 1, ('normal', 'normal'), 500),
+        cle_combat('magicien', 'sage', 1, ('normal', 'normal'), 1000)
+    }
+    assert len(cles) == 5
+
+
+def test_enregistrer_deux_fois_ne_compte_qu_une_entree(cache):
+    cache.enregistrer({_cle(1): {'tours': 1}})
+    cache.enregistrer({_cle(1): {'tours': 2}})
+    assert len(cache) == 1
+    assert cache.chercher([_cle(1)])[_cle(1)] == {'tours': 1}
+
+
+def test_eviction_des_combats_les_moins_recemment_lus(cache):
+    """Au-delà de taille_max, le cache redescend à 90% en évinçant les combats lus le moins récemment"""
+    cache.enregistrer({_cle(seed): {'seed': seed} for seed in range(10)})
+    relus = [_cle(seed) for seed in range(3)]
+    assert len(cache.chercher(relus)) == 3
+    assert cache.evictions == 0
+
+    cache.enregistrer({_cle(seed): {'seed': seed} for seed in range(10, 15)})
+
+    assert len(cache) == 9
+    assert cache.evictions == 6
+    restants = cache.chercher([_cle(seed) for seed in range(15)])
+    assert set(relus) <= set(restants)
+    assert all(_cle(seed) in restants for seed in range(10, 15))
+
+
+def test_cache_persiste_entre_connexions(tmp_path):
+    chemin = str(tmp_path / 'sous_dossier' / 'combats.sqlite')
+    premier = CacheCombats(chemin)
+    premier.enregistrer({_cle(1): {'tours': 3}})
+    premier.fermer()
+
+    second = CacheCombats(chemin)
+    assert second.chercher([_cle(1)]) == {_cle(1): {'tours': 3}}
+    second.fermer()
+
+
+def test_simulation_relancee_lue_dans_le_cache(tmp_path):
+    """Relancer une simulation relit ses combats au lieu de les rejouer, avec les mêmes statistiques"""
+    cache = CacheCombats(str(tmp_path / 'combats.sqlite'))
+    premier = lancer_simulation(40, 1, seed_base=3, cache=cache)
+    second = lancer_simulation(40, 1, seed_base=3, cache=cache)
+    cache.fermer()
+
+    assert premier.depuis_cache == 0
+    assert second.depuis_cache == 40
+    assert second.victoires == premier.victoires
+    assert second.tours == premier.tours
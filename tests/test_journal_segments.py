@@ -0,0 +1,83 @@
+"""
+Tests du journal en segments - Rotation, lignes tronquées, relecture par adresse
+"""
+
+import os
+
+import pytest
+
+from src.game.journal_segments import JournalSegments
+from src.game.save_manager import DOSSIER_SEGMENTS, SaveManager
+
+
+def _partie(numero: int) -> dict:
+    return {'mode': 'PvE', 'vainqueur': f'J{numero}', 'nombre_tours': numero,
+            'joueur1': {'nom': f'J{numero}', 'classe': 'sage'}, 'joueur2': {'nom': 'AI', 'classe': 'magicien'}}
+
+
+def test_rotation_des_segments(tmp_path):
+    """Un segment qui atteint sa taille maximale est fermé; l'ordre d'écriture est conservé à la lecture"""
+    with JournalSegments(str(tmp_path), taille_segment=200) as journal:
+        adresses = [journal.ajouter(_partie(numero)) for numero in range(10)]
+
+        segments = journal.segments()
+        assert len(segments) > 1
+        assert [enregistrement['nombre_tours'] for enregistrement in journal] == list(range(10))
+        assert [adresse for adresse, _ in journal.lire(avec_adresses=True)] == adresses
+
+
+def test_ligne_tronquee_en_fin_de_segment_ignoree(tmp_path):
+    """Une écriture interrompue (pas de saut de ligne final) n'est pas lue; les précédentes le sont"""
+    with JournalSegments(str(tmp_path)) as journal:
+        journal.ajouter(_partie(1))
+        journal.ajouter(_partie(2))
+        segment = journal.segments()[0]
+
+    chemin = os.path.join(str(tmp_path), segment)
+    position = os.path.getsize(chemin)
+    with open(chemin, 'ab') as f:
+        f.write(b'{"mode":"PvE","vainqueur":"J3"')
+
+    journal = JournalSegments(str(tmp_path))
+    assert [enregistrement['vainqueur'] for enregistrement in journal] == ['J1', 'J2']
+    with pytest.raises(ValueError):
+        journal.charger(f'{segment}#{position}')
+
+
+def test_ligne_endommagee_au_milieu_sautee(tmp_path):
+    """Seul l'enregistrement endommagé est perdu"""
+    with open(os.path.join(str(tmp_path), 'segment-00000000000000000001-1-abcd.jsonl'), 'wb') as f:
+        f.write(b'{"vainqueur":"J1"}\npas du json\n{"vainqueur":"J3"}\n')
+
+    assert [enregistrement['vainqueur'] for enregistrement in JournalSegments(str(tmp_path))] == ['J1', 'J3']
+
+
+def test_charger_par_adresse(tmp_path):
+    with JournalSegments(str(tmp_path), taille_segment=200) as journal:
+        adresses = {numero: journal.ajouter(_partie(numero)) for numero in range(6)}
+        for numero, adresse in adresses.items():
+            assert journal.charger(adresse) == _partie(numero)
+
+        with pytest.raises(ValueError):
+            journal.charger('inconnu#0')
+        with pytest.raises(ValueError):
+            journal.charger(f"{adresses[0].partition('#')[0]}#abc")
+        with pytest.raises(FileNotFoundError):
+            journal.charger('segment-absent.jsonl#0')
+
+
+def test_save_manager_en_segments(tmp_path):
+    """Les parties sauvegardées en segments sont indexées à la lecture et rechargées par leur adresse"""
+    dossier = str(tmp_path / 'saves')
+    save_manager = SaveManager(dossier, stockage='segments')
+    chemins = [save_manager.save_game(_partie(numero)) for numero in range(3)]
+    assert all(DOSSIER_SEGMENTS in chemin and '#' in chemin for chemin in chemins)
+
+    # Un autre gestionnaire (autre processus) voit les mêmes parties
+    lecteur = SaveManager(dossier, stockage='segments')
+    sauvegardes = lecteur.lister_sauvegardes(tri='duree_tours', decroissant=False)
+    assert [sauvegarde['vainqueur'] for sauvegarde in sauvegardes] == ['J0', 'J1', 'J2']
+    assert lecteur.charger_partie(sauvegardes[1]['filename'])['vainqueur'] == 'J1'
+
+    save_manager.save_game(_partie(7))
+    assert lecteur.compter_sauvegardes() == 4
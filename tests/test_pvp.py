@@ -0,0 +1,99 @@
+"""
+Tests du PvP en réseau - Appariement, réplique des clients, reprise par jeton, abandon
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from src.game import client
+from src.game.client import ClientPvP, charge_pvp
+from src.game.pvp import empreinte_tour, repliquer
+from src.game.save_manager import SaveManager
+from src.game.simulation import VERSION_MOTEUR
+
+
+def _choix_aleatoire(seed: int):
+    rng = random.Random(seed)
+
+    async def choisir(combat, skills):
+        return rng.choice(skills)
+    return choisir
+
+
+@pytest.fixture(autouse=True)
+def reconnexion_rapide(monkeypatch):
+    monkeypatch.setattr(client, 'DELAI_RECONNEXION', 0.05)
+
+
+def test_parties_simultanees_terminees_et_sauvegardees(jouer_contre, tmp_path):
+    save_manager = SaveManager(str(tmp_path), stockage='segments')
+
+    async def scenario(serveur):
+        return await charge_pvp(10, port=serveur.port)
+
+    resultat = jouer_contre(scenario, save_manager=save_manager)
+    assert resultat['terminees'] == 20
+    assert resultat['coups'] > 0
+    assert save_manager.compter_sauvegardes(mode='PvP') == 10
+
+
+def test_reprise_par_jeton_apres_coupure(jouer_contre):
+    """Un joueur coupé en pleine partie la reprend avec son jeton, au même état que son adversaire"""
+    clients = []
+    coupures = []
+
+    async def choisir_puis_couper(combat, skills):
+        if combat.tour > 6 and not coupures:
+            coupures.append(clients[0].jeton)
+            clients[0].canal.ecrivain.close()
+        return skills[0]
+
+    async def scenario(serveur):
+        clients.extend([ClientPvP('Merlin', 'sage', choisir_puis_couper, port=serveur.port),
+                        ClientPvP('Merlin', 'magicien', _choix_aleatoire(1), port=serveur.port)])
+        return await asyncio.gather(*(joueur.jouer() for joueur in clients))
+
+    resultats = jouer_contre(scenario)
+    coupe, adversaire = clients
+    assert coupures == [coupe.jeton]
+    assert (coupe.reprises, adversaire.reprises) == (1, 0)
+    assert resultats[0] == resultats[1]
+    assert resultats[0]['abandon'] is False
+    assert coupe.combat.tour == adversaire.combat.tour
+    assert empreinte_tour(coupe.combat) == empreinte_tour(adversaire.combat)
+    assert adversaire.combat.joueurs[1].nom == 'Merlin (2)'
+
+
+def test_jeton_inconnu_refuse(jouer_contre):
+    async def scenario(serveur):
+        joueur = ClientPvP('Merlin', 'sage', _choix_aleatoire(0), port=serveur.port, jeton='inconnu')
+        return await joueur.jouer(), joueur.reprises
+
+    assert jouer_contre(scenario) == (None, 0)
+
+
+def test_abandon_si_le_tour_n_est_pas_joue(jouer_contre):
+    """Un joueur qui ne joue pas son tour dans le délai perd la partie"""
+    async def muet(combat, skills):
+        await asyncio.sleep(60)
+
+    async def scenario(serveur):
+        absent = asyncio.create_task(ClientPvP('Absent', 'sage', muet, port=serveur.port).jouer())
+        await asyncio.sleep(0.05)  # Le premier arrivé joue en premier
+        resultat = await ClientPvP('Present', 'magicien', _choix_aleatoire(0), port=serveur.port).jouer()
+        absent.cancel()
+        return resultat
+
+    resultat = jouer_contre(scenario, delai_inactivite=0.3)
+    assert resultat['abandon'] is True
+    assert resultat['vainqueur'] == 'Present'
+
+
+def test_replique_refuse_une_config_differente():
+    partie = {'version_moteur': VERSION_MOTEUR, 'seed': 1, 'tours_max': 10, 'coups': [],
+              'joueurs': [{'nom': 'A', 'classe': 'sage', 'empreinte': 'autre'},
+                          {'nom': 'B', 'classe': 'magicien', 'empreinte': 'autre'}]}
+    with pytest.raises(ValueError):
+        repliquer(partie)
@@ -0,0 +1,93 @@
+"""
+Tests du serveur de jeu - Sessions PvE simultanées, plafond, inactivité, sauvegardes
+"""
+
+import asyncio
+
+import pytest
+
+from src.game.client import charge_pve, jouer_automatique
+from src.game.protocole import Canal, ConnexionFermee
+from src.game.save_manager import SaveManager
+
+
+async def _attendre(canal: Canal, type_message: str, delai: float = 5.0) -> dict:
+    while True:
+        message = await canal.recevoir(delai)
+        if message['type'] == type_message:
+            return message
+
+
+def test_sessions_simultanees_terminees_et_sauvegardees(jouer_contre, tmp_path):
+    save_manager = SaveManager(str(tmp_path), stockage='segments')
+
+    async def scenario(serveur):
+        return await charge_pve(30, port=serveur.port), serveur.statistiques()
+
+    resultat, statistiques = jouer_contre(scenario, save_manager=save_manager)
+    assert resultat['terminees'] == 30
+    assert resultat['tours'] > 0
+    assert statistiques['parties_terminees'] == 30
+    assert statistiques['sessions'] == 0
+    assert save_manager.compter_sauvegardes(mode='PvE') == 30
+
+
+def test_plafond_de_sessions(jouer_contre):
+    """Au-delà de sessions_max, une connexion reçoit 'complet' et est fermée; une place libérée est reprise"""
+    async def scenario(serveur):
+        occupants = [await Canal.ouvrir('127.0.0.1', serveur.port) for _ in range(2)]
+        for canal in occupants:
+            await _attendre(canal, 'bienvenue')
+
+        refuse = await Canal.ouvrir('127.0.0.1', serveur.port)
+        message = await refuse.recevoir(5)
+        with pytest.raises(ConnexionFermee):
+            await refuse.recevoir(5)
+        await refuse.fermer()
+        refusees = serveur.refusees
+
+        await occupants[0].fermer()
+        await asyncio.sleep(0.1)
+        accepte = await Canal.ouvrir('127.0.0.1', serveur.port)
+        bienvenue = await accepte.recevoir(5)
+        for canal in (occupants[1], accepte):
+            await canal.fermer()
+        return message, refusees, bienvenue
+
+    message, refusees, bienvenue = jouer_contre(scenario, sessions_max=2)
+    assert message['type'] == 'complet'
+    assert refusees == 1
+    assert bienvenue['type'] == 'bienvenue'
+
+
+def test_session_inactive_fermee(jouer_contre):
+    async def scenario(serveur):
+        canal = await Canal.ouvrir('127.0.0.1', serveur.port)
+        await _attendre(canal, 'question')
+        message = await canal.recevoir(5)
+        with pytest.raises(ConnexionFermee):
+            await canal.recevoir(5)
+        await canal.fermer()
+        await asyncio.sleep(0.05)
+        return message, serveur.statistiques()['sessions']
+
+    message, sessions = jouer_contre(scenario, delai_inactivite=0.2)
+    assert message['type'] == 'inactivite'
+    assert sessions == 0
+
+
+def test_joueur_nomme_comme_l_ia_renomme(jouer_contre):
+    """Deux combattants homonymes se confondraient dans le journal: le joueur nommé 'AI' est renommé"""
+    sauvegardes = []
+
+    async def scenario(serveur):
+        async def sauvegarder(donnees):
+            sauvegardes.append(donnees)
+        serveur.sauvegarder = sauvegarder
+        return await jouer_automatique(port=serveur.port, nom='AI', seed=1)
+
+    resultat = jouer_contre(scenario)
+    assert resultat['resultat'] is not None
+    donnees, = sauvegardes
+    assert (donnees['joueur1']['nom'], donnees['joueur2']['nom']) == ('AI (2)', 'AI')
+    assert {evenement[1] for evenement in donnees['journal']['evenements']} == {0, 1}
@@ -0,0 +1,69 @@
+"""
+Tests du solveur exact - Générateur énuméré et combats qui l'utilisent
+"""
+
+from src.ai.ai_player import AIPlayer
+from src.game.simulation import CLASSES, Combat
+from src.game.solveur import AleatoireEnumere
+from src.models.evenements import SINK_NUL
+
+
+def _combat_enumere() -> Combat:
+    joueurs = [CLASSES[classe](f"IA-{classe}") for classe in ('sage', 'magicien')]
+    for joueur in joueurs:
+        joueur.sink = SINK_NUL
+    return Combat(joueurs[0], joueurs[1], rng=AleatoireEnumere())
+
+
+def _jouer(combat: Combat, tours: int) -> tuple:
+    """Joue des tours (décisions des IA tirées par le générateur du combat) et retourne l'état des joueurs"""
+    ias = [AIPlayer(joueur, 'normal', rng=combat.rng) for joueur in combat.joueurs]
+    for _ in range(tours):
+        if combat.termine:
+            break
+        skills = combat.debut_tour()
+        combat.jouer(ias[combat.index_actif].choose_skill(skills, combat.defenseur) if skills else None)
+    return tuple((joueur.current_hp, joueur.current_mp) for joueur in combat.joueurs)
+
+
+def test_generateur_enumere_restaure_sa_position_dans_la_branche():
+    rng = AleatoireEnumere()
+    rng.rejouer((1, 2))
+    assert rng.chance(0.5) is False
+    etat = rng.etat()
+    premiers = [rng.choix('abc'), rng.chance(0.3)]
+
+    rng.restaurer(etat)
+    assert [rng.choix('abc'), rng.chance(0.3)] == premiers == ['c', True]
+    assert rng.branche_suivante() == (1, 2, 1)
+
+
+def test_generateur_enumere_clone_independant():
+    rng = AleatoireEnumere()
+    rng.rejouer((0, 1))
+    rng.chance(0.5)
+    clone = rng.cloner()
+    assert clone.choix('ab') == rng.choix('ab') == 'b'
+
+    clone.choix('ab')
+    assert len(clone.issues) == 3
+    assert len(rng.issues) == 2
+    assert clone.probabilite_branche() == rng.probabilite_branche() * 0.5
+
+
+def test_combat_enumere_snapshot_restore_et_clone():
+    """Un combat au générateur énuméré se restaure et se clone comme un combat seedé"""
+    combat = _combat_enumere()
+    combat.rng.rejouer((0, 1, 0, 1))
+    _jouer(combat, 2)
+    etat = combat.snapshot()
+    clone = combat.cloner()
+
+    suite = _jouer(combat, 4)
+    issues = combat.rng.issues[:]
+
+    assert _jouer(clone, 4) == suite
+    assert clone.rng.issues == issues
+    combat.restore(etat)
+    assert _jouer(combat, 4) == suite
+    assert combat.rng.issues == issues
@@ -0,0 +1,92 @@
+"""
+Tests de la table de transposition - Éviction LRU et accès depuis plusieurs threads
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from src.ai.transposition import TableTransposition
+
+
+# Nombre de threads qui se partagent la table (comme les IA expertes du serveur)
+THREADS = 8
+
+
+class EntreesEntrelacees(OrderedDict):
+    """Entrées qui cèdent la main à un autre thread après chaque lecture, pour provoquer les entrelacements"""
+
+    def get(self, *args):
+        entree = super().get(*args)
+        time.sleep(0)
+        return entree
+
+
+def _table_partagee(capacite: int) -> TableTransposition:
+    table = TableTransposition(capacite)
+    table._TableTransposition__entrees = EntreesEntrelacees()
+    return table
+
+
+def _en_parallele(travail):
+    erreurs = []
+    depart = threading.Barrier(THREADS)
+
+    def executer(numero):
+        depart.wait()
+        try:
+            travail(numero)
+        except Exception as erreur:
+            erreurs.append(erreur)
+
+    threads = [threading.Thread(target=executer, args=(numero,)) for numero in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return erreurs
+
+
+def test_eviction_des_positions_les_moins_recemment_utilisees():
+    table = TableTransposition(capacite=3)
+    for cle in 'abc':
+        table.enregistrer(cle, 1.0)
+    assert table.chercher('a') == [1, 1.0]
+    table.enregistrer('d', 0.0)
+
+    assert table.chercher('b') is None
+    assert all(table.chercher(cle) is not None for cle in 'acd')
+    assert (len(table), table.evictions) == (3, 1)
+
+
+def test_recherches_et_evictions_concurrentes():
+    """Une petite table évince sans cesse: aucune recherche ne doit échouer, aucun compteur se perdre"""
+    table = _table_partagee(capacite=16)
+    operations = 500
+
+    def travail(numero):
+        rng = random.Random(numero)
+        for _ in range(operations):
+            cle = rng.randrange(64)
+            table.chercher(cle)
+            table.enregistrer(cle, 1.0)
+
+    assert _en_parallele(travail) == []
+    assert table.succes + table.echecs == THREADS * operations
+    assert len(table) == table.capacite
+    assert len(table) + table.evictions <= table.echecs  # Deux threads peuvent manquer la même position
+
+
+def test_evaluations_concurrentes_toutes_comptees():
+    table = _table_partagee(capacite=100)
+    operations = 500
+
+    def travail(numero):
+        for i in range(operations):
+            table.enregistrer(i % 10, 0.5)
+
+    assert _en_parallele(travail) == []
+    entrees = [table.chercher(cle) for cle in range(10)]
+    assert sum(entree[0] for entree in entrees) == THREADS * operations
+    assert sum(entree[1] for entree in entrees) == THREADS * operations * 0.5
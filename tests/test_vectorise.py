@@ -0,0 +1,21 @@
+"""
+Tests du moteur vectorisé - Équivalence statistique avec le moteur objet
+"""
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from src.game.vectorise import comparer_moteurs
+
+
+@pytest.mark.parametrize('class_a, class_b', [
+    ('sage', 'magicien'),
+    ('magicien', 'sage'),
+    ('sage', 'sage'),
+    ('magicien', 'magicien')
+])
+def test_moteur_vectorise_equivalent_au_moteur_objet(class_a, class_b):
+    """Taux de victoire, durée des combats et usage des compétences concordent (échantillon seedé)"""
+    resultat = comparer_moteurs(class_a, class_b, parties_objet=400, parties_vectorise=4000, seed=7)
+    assert resultat['ok'], resultat